@@ -14,13 +14,18 @@ from config import get_settings
 # Alembic Config object (provides access to alembic.ini values)
 config = context.config
 
-# Set up Python logging from the config file
-if config.config_file_name is not None:
+# Set up Python logging from the config file (skipped when the app runs
+# migrations itself — see db/migrate.py — so its logging config is kept)
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
-# Use the app's DATABASE_URL so migrations always target the right database
-settings = get_settings()
-config.set_main_option("sqlalchemy.url", settings.database_url)
+# Use the app's DATABASE_URL (or MIGRATION_DATABASE_URL) so migrations always
+# target the right database
+settings = get_settings()  # cached per process
+database_url = settings.migration_database_url or settings.database_url
+if config.get_main_option("sqlalchemy.url") != database_url:
+    # ConfigParser interpolates "%", so escape it (URL-encoded passwords)
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
 
 # MetaData for autogenerate support
 target_metadata = Base.metadata
@@ -51,20 +56,51 @@ def do_run_migrations(connection) -> None:
         context.run_migrations()
 
 
-async def run_async_migrations() -> None:
-    """Create an async engine and run migrations."""
-    connectable = async_engine_from_config(
+def _get_connectable():
+    """Return the app's pooled engine, or a throwaway one if it can't be used."""
+    engine = None
+    if not settings.migration_database_url:
+        try:
+            from db.connection import engine
+        except Exception:
+            engine = None
+    if engine is not None:
+        return engine
+    connect_args = {}
+    if database_url.startswith("postgresql+asyncpg"):
+        # Skip JIT warm-up on short-lived migration connections
+        connect_args["server_settings"] = {"jit": "off"}
+    return async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=connect_args,
     )
+
+
+async def run_async_migrations() -> None:
+    """Run migrations on the app's engine (or a fallback one)."""
+    connectable = _get_connectable()
     async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
+        driver_connection = (await connection.get_raw_connection()).driver_connection
+        if hasattr(driver_connection, "pipeline"):
+            # psycopg 3: keep several DDL statements in flight per round-trip
+            async with driver_connection.pipeline():
+                await connection.run_sync(do_run_migrations)
+        else:
+            await connection.run_sync(do_run_migrations)
+    # Pooled connections are bound to this event loop, which asyncio.run()
+    # closes on return, so release them before it does.
     await connectable.dispose()
 
 
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode — with a live database connection."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        # Called from the running app, which already holds a connection
+        do_run_migrations(connection)
+        return
     asyncio.run(run_async_migrations())
 
 
@@ -3,12 +3,15 @@
 Revision ID: 0001
 Revises:
 Create Date: 2026-02-14
+
+The whole schema is issued as one SQL script so a fresh install costs a
+single protocol round-trip instead of one per table/index/type.  Keep the
+statements in dependency order; ``models/database.py`` remains the source
+of truth for autogenerate diffs in later revisions.
 """
 from typing import Sequence, Union
 
-from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
+from db.migration_helpers import execute_sql_script
 
 # revision identifiers, used by Alembic.
 revision: str = "0001"
@@ -17,490 +20,275 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
-    # Enable pgvector extension
-    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+SCHEMA_DDL = """
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE TYPE operatorrole AS ENUM ('viewer', 'admin');
+CREATE TYPE casestatus AS ENUM ('intake', 'ready', 'hearing', 'decided');
+CREATE TYPE casetype AS ENUM (
+    'contract', 'property_damage', 'security_deposit', 'loan_debt', 'consumer', 'other'
+);
+CREATE TYPE partyrole AS ENUM ('plaintiff', 'defendant');
+CREATE TYPE evidencetype AS ENUM (
+    'document', 'photo', 'receipt', 'text_message', 'email', 'contract', 'other'
+);
+CREATE TYPE hearingmessagerole AS ENUM ('judge', 'plaintiff', 'defendant');
 
-    # ── sessions ─────────────────────────────────────────────────────
-    op.create_table(
-        "sessions",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "role",
-            sa.Enum("viewer", "admin", name="operatorrole", create_type=True),
-            nullable=False,
-            server_default="viewer",
-        ),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.Column(
-            "last_active",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-    )
-    op.create_index("ix_sessions_last_active", "sessions", ["last_active"])
+-- ── sessions ─────────────────────────────────────────────────────
+CREATE TABLE sessions (
+    id UUID NOT NULL,
+    role operatorrole DEFAULT 'viewer' NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    last_active TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_sessions_last_active ON sessions (last_active);
 
-    # ── prompt_versions ──────────────────────────────────────────────
-    op.create_table(
-        "prompt_versions",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("name", sa.String(100), nullable=False),
-        sa.Column("step", sa.String(50), nullable=False),
-        sa.Column("version", sa.Integer, nullable=False),
-        sa.Column("content", sa.Text, nullable=False),
-        sa.Column(
-            "is_active",
-            sa.Boolean,
-            nullable=False,
-            server_default="true",
-        ),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.UniqueConstraint("step", "version", name="uq_prompt_versions_step_version"),
-    )
-    op.create_index(
-        "ix_prompt_versions_step_active",
-        "prompt_versions",
-        ["step", "is_active"],
-    )
+-- ── prompt_versions ──────────────────────────────────────────────
+CREATE TABLE prompt_versions (
+    id UUID NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    step VARCHAR(50) NOT NULL,
+    version INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT 'true' NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    CONSTRAINT uq_prompt_versions_step_version UNIQUE (step, version)
+);
+CREATE INDEX ix_prompt_versions_step_active ON prompt_versions (step, is_active);
 
-    # ── cases ────────────────────────────────────────────────────────
-    op.create_table(
-        "cases",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "session_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("sessions.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column(
-            "status",
-            sa.Enum(
-                "intake",
-                "ready",
-                "hearing",
-                "decided",
-                name="casestatus",
-                create_type=True,
-            ),
-            nullable=False,
-            server_default="intake",
-        ),
-        sa.Column(
-            "case_type",
-            sa.Enum(
-                "contract",
-                "property_damage",
-                "security_deposit",
-                "loan_debt",
-                "consumer",
-                "other",
-                name="casetype",
-                create_type=True,
-            ),
-            nullable=True,
-        ),
-        sa.Column("case_type_confidence", sa.Float, nullable=True),
-        sa.Column("plaintiff_narrative", sa.Text, nullable=True),
-        sa.Column("defendant_narrative", sa.Text, nullable=True),
-        sa.Column("claimed_amount", sa.Numeric(10, 2), nullable=True),
-        sa.Column("damages_breakdown", postgresql.JSONB, nullable=True),
-        sa.Column("archetype_id", sa.String(50), nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.Column(
-            "updated_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.CheckConstraint(
-            "claimed_amount >= 0 AND claimed_amount <= 6000",
-            name="ck_cases_claimed_amount_range",
-        ),
-    )
-    op.create_index("ix_cases_session_id", "cases", ["session_id"])
-    op.create_index("ix_cases_status", "cases", ["status"])
-    op.create_index("ix_cases_session_status", "cases", ["session_id", "status"])
+-- ── cases ────────────────────────────────────────────────────────
+CREATE TABLE cases (
+    id UUID NOT NULL,
+    session_id UUID NOT NULL,
+    status casestatus DEFAULT 'intake' NOT NULL,
+    case_type casetype,
+    case_type_confidence FLOAT,
+    plaintiff_narrative TEXT,
+    defendant_narrative TEXT,
+    claimed_amount NUMERIC(10, 2),
+    damages_breakdown JSONB,
+    archetype_id VARCHAR(50),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+);
+-- CHECK constraints use the NOT VALID + VALIDATE pattern (see
+-- db.migration_helpers.add_check_constraint_nonblocking) so copies of this
+-- script run against populated tables never hold an exclusive lock for a scan
+ALTER TABLE cases ADD CONSTRAINT ck_cases_claimed_amount_range
+    CHECK (claimed_amount >= 0 AND claimed_amount <= 6000) NOT VALID;
+ALTER TABLE cases VALIDATE CONSTRAINT ck_cases_claimed_amount_range;
+CREATE INDEX ix_cases_session_id ON cases (session_id);
+CREATE INDEX ix_cases_status ON cases (status);
+CREATE INDEX ix_cases_session_status ON cases (session_id, status);
 
-    # ── parties ──────────────────────────────────────────────────────
-    op.create_table(
-        "parties",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column(
-            "role",
-            sa.Enum("plaintiff", "defendant", name="partyrole", create_type=True),
-            nullable=False,
-        ),
-        sa.Column("name", sa.String(255), nullable=False),
-        sa.Column("address", sa.Text, nullable=True),
-        sa.Column("phone", sa.String(20), nullable=True),
-        sa.UniqueConstraint("case_id", "role", name="uq_parties_case_role"),
-    )
-    op.create_index("ix_parties_case_id", "parties", ["case_id"])
+-- ── parties ──────────────────────────────────────────────────────
+CREATE TABLE parties (
+    id UUID NOT NULL,
+    case_id UUID NOT NULL,
+    role partyrole NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    address TEXT,
+    phone VARCHAR(20),
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE CASCADE,
+    CONSTRAINT uq_parties_case_role UNIQUE (case_id, role)
+);
+CREATE INDEX ix_parties_case_id ON parties (case_id);
 
-    # ── evidence ─────────────────────────────────────────────────────
-    op.create_table(
-        "evidence",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column(
-            "submitted_by",
-            sa.Enum("plaintiff", "defendant", name="partyrole", create_type=False),
-            nullable=False,
-        ),
-        sa.Column(
-            "evidence_type",
-            sa.Enum(
-                "document",
-                "photo",
-                "receipt",
-                "text_message",
-                "email",
-                "contract",
-                "other",
-                name="evidencetype",
-                create_type=True,
-            ),
-            nullable=False,
-        ),
-        sa.Column("title", sa.String(255), nullable=False),
-        sa.Column("description", sa.Text, nullable=True),
-        sa.Column("file_path", sa.String(500), nullable=True),
-        sa.Column("score", sa.Integer, nullable=True),
-        sa.Column("score_explanation", sa.Text, nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.CheckConstraint("score >= 0 AND score <= 3", name="ck_evidence_score_range"),
-    )
-    op.create_index("ix_evidence_case_id", "evidence", ["case_id"])
+-- ── evidence ─────────────────────────────────────────────────────
+CREATE TABLE evidence (
+    id UUID NOT NULL,
+    case_id UUID NOT NULL,
+    submitted_by partyrole NOT NULL,
+    evidence_type evidencetype NOT NULL,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    file_path VARCHAR(500),
+    score INTEGER,
+    score_explanation TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE CASCADE
+);
+ALTER TABLE evidence ADD CONSTRAINT ck_evidence_score_range
+    CHECK (score >= 0 AND score <= 3) NOT VALID;
+ALTER TABLE evidence VALIDATE CONSTRAINT ck_evidence_score_range;
+CREATE INDEX ix_evidence_case_id ON evidence (case_id);
 
-    # ── case_timeline ────────────────────────────────────────────────
-    op.create_table(
-        "case_timeline",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column("event_date", sa.DateTime(timezone=True), nullable=False),
-        sa.Column("description", sa.Text, nullable=False),
-        sa.Column(
-            "source",
-            sa.Enum("plaintiff", "defendant", name="partyrole", create_type=False),
-            nullable=True,
-        ),
-        sa.Column(
-            "disputed",
-            sa.Boolean,
-            nullable=False,
-            server_default="false",
-        ),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-    )
-    op.create_index("ix_case_timeline_case_id", "case_timeline", ["case_id"])
-    op.create_index(
-        "ix_case_timeline_case_date",
-        "case_timeline",
-        ["case_id", "event_date"],
-    )
+-- ── case_timeline ────────────────────────────────────────────────
+CREATE TABLE case_timeline (
+    id UUID NOT NULL,
+    case_id UUID NOT NULL,
+    event_date TIMESTAMP WITH TIME ZONE NOT NULL,
+    description TEXT NOT NULL,
+    source partyrole,
+    disputed BOOLEAN DEFAULT 'false' NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_case_timeline_case_id ON case_timeline (case_id);
+CREATE INDEX ix_case_timeline_case_date ON case_timeline (case_id, event_date);
 
-    # ── hearings ─────────────────────────────────────────────────────
-    op.create_table(
-        "hearings",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="CASCADE"),
-            nullable=False,
-            unique=True,
-        ),
-        sa.Column("archetype_id", sa.String(50), nullable=False),
-        sa.Column(
-            "started_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
-    )
+-- ── hearings ─────────────────────────────────────────────────────
+CREATE TABLE hearings (
+    id UUID NOT NULL,
+    case_id UUID NOT NULL,
+    archetype_id VARCHAR(50) NOT NULL,
+    started_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE CASCADE,
+    UNIQUE (case_id)
+);
 
-    # ── hearing_messages ─────────────────────────────────────────────
-    op.create_table(
-        "hearing_messages",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "hearing_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("hearings.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column(
-            "role",
-            sa.Enum(
-                "judge",
-                "plaintiff",
-                "defendant",
-                name="hearingmessagerole",
-                create_type=True,
-            ),
-            nullable=False,
-        ),
-        sa.Column("content", sa.Text, nullable=False),
-        sa.Column("sequence", sa.Integer, nullable=False),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-    )
-    op.create_index(
-        "ix_hearing_messages_hearing_id",
-        "hearing_messages",
-        ["hearing_id"],
-    )
-    op.execute(
-        "ALTER TABLE hearing_messages "
-        "ADD CONSTRAINT uq_hearing_messages_hearing_seq UNIQUE (hearing_id, sequence)"
-    )
+-- ── hearing_messages ─────────────────────────────────────────────
+CREATE TABLE hearing_messages (
+    id UUID NOT NULL,
+    hearing_id UUID NOT NULL,
+    role hearingmessagerole NOT NULL,
+    content TEXT NOT NULL,
+    sequence INTEGER NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (hearing_id) REFERENCES hearings (id) ON DELETE CASCADE
+);
+CREATE INDEX ix_hearing_messages_hearing_id ON hearing_messages (hearing_id);
+ALTER TABLE hearing_messages
+    ADD CONSTRAINT uq_hearing_messages_hearing_seq UNIQUE (hearing_id, sequence);
 
-    # ── judgments ─────────────────────────────────────────────────────
-    op.create_table(
-        "judgments",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="CASCADE"),
-            nullable=False,
-            unique=True,
-        ),
-        sa.Column("archetype_id", sa.String(50), nullable=False),
-        sa.Column("findings_of_fact", postgresql.JSONB, nullable=False),
-        sa.Column("conclusions_of_law", postgresql.JSONB, nullable=False),
-        sa.Column("judgment_text", sa.Text, nullable=False),
-        sa.Column("rationale", sa.Text, nullable=False),
-        sa.Column("awarded_amount", sa.Numeric(10, 2), nullable=True),
-        sa.Column(
-            "in_favor_of",
-            sa.Enum("plaintiff", "defendant", name="partyrole", create_type=False),
-            nullable=False,
-        ),
-        sa.Column("evidence_scores", postgresql.JSONB, nullable=True),
-        sa.Column("reasoning_chain", postgresql.JSONB, nullable=True),
-        sa.Column(
-            "prompt_version_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("prompt_versions.id", ondelete="SET NULL"),
-            nullable=True,
-        ),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.CheckConstraint("awarded_amount >= 0", name="ck_judgments_awarded_amount_positive"),
-    )
+-- ── judgments ────────────────────────────────────────────────────
+CREATE TABLE judgments (
+    id UUID NOT NULL,
+    case_id UUID NOT NULL,
+    archetype_id VARCHAR(50) NOT NULL,
+    findings_of_fact JSONB NOT NULL,
+    conclusions_of_law JSONB NOT NULL,
+    judgment_text TEXT NOT NULL,
+    rationale TEXT NOT NULL,
+    awarded_amount NUMERIC(10, 2),
+    in_favor_of partyrole NOT NULL,
+    evidence_scores JSONB,
+    reasoning_chain JSONB,
+    prompt_version_id UUID,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE CASCADE,
+    FOREIGN KEY (prompt_version_id) REFERENCES prompt_versions (id) ON DELETE SET NULL,
+    UNIQUE (case_id),
+    CONSTRAINT ck_judgments_awarded_amount_positive CHECK (awarded_amount >= 0)
+);
 
-    # ── comparison_runs ──────────────────────────────────────────────
-    op.create_table(
-        "comparison_runs",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column("run_key", sa.String(128), nullable=False),
-        sa.Column("archetype_ids", postgresql.JSONB, nullable=False),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.UniqueConstraint(
-            "case_id", "run_key", name="uq_comparison_case_run_key"
-        ),
-    )
-    op.create_index("ix_comparison_runs_case_id", "comparison_runs", ["case_id"])
-    op.create_index(
-        "ix_comparison_runs_case_created",
-        "comparison_runs",
-        ["case_id", "created_at"],
-    )
+-- ── comparison_runs ──────────────────────────────────────────────
+CREATE TABLE comparison_runs (
+    id UUID NOT NULL,
+    case_id UUID NOT NULL,
+    run_key VARCHAR(128) NOT NULL,
+    archetype_ids JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE CASCADE,
+    CONSTRAINT uq_comparison_case_run_key UNIQUE (case_id, run_key)
+);
+CREATE INDEX ix_comparison_runs_case_id ON comparison_runs (case_id);
+CREATE INDEX ix_comparison_runs_case_created ON comparison_runs (case_id, created_at);
 
-    # ── comparison_results ───────────────────────────────────────────
-    op.create_table(
-        "comparison_results",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "run_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("comparison_runs.id", ondelete="CASCADE"),
-            nullable=False,
-        ),
-        sa.Column("archetype_id", sa.String(50), nullable=False),
-        sa.Column("findings_of_fact", postgresql.JSONB, nullable=False),
-        sa.Column("conclusions_of_law", postgresql.JSONB, nullable=False),
-        sa.Column("judgment_text", sa.Text, nullable=False),
-        sa.Column("rationale", sa.Text, nullable=False),
-        sa.Column("awarded_amount", sa.Numeric(10, 2), nullable=True),
-        sa.Column(
-            "in_favor_of",
-            sa.Enum("plaintiff", "defendant", name="partyrole", create_type=False),
-            nullable=False,
-        ),
-        sa.Column("evidence_scores", postgresql.JSONB, nullable=True),
-        sa.Column("reasoning_chain", postgresql.JSONB, nullable=True),
-        sa.Column("metadata", postgresql.JSONB, nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-        sa.UniqueConstraint(
-            "run_id", "archetype_id", name="uq_comparison_run_archetype"
-        ),
-        sa.CheckConstraint("awarded_amount >= 0", name="ck_comparison_results_awarded_amount_positive"),
-    )
-    op.create_index(
-        "ix_comparison_results_run_id",
-        "comparison_results",
-        ["run_id"],
-    )
+-- ── comparison_results ───────────────────────────────────────────
+CREATE TABLE comparison_results (
+    id UUID NOT NULL,
+    run_id UUID NOT NULL,
+    archetype_id VARCHAR(50) NOT NULL,
+    findings_of_fact JSONB NOT NULL,
+    conclusions_of_law JSONB NOT NULL,
+    judgment_text TEXT NOT NULL,
+    rationale TEXT NOT NULL,
+    awarded_amount NUMERIC(10, 2),
+    in_favor_of partyrole NOT NULL,
+    evidence_scores JSONB,
+    reasoning_chain JSONB,
+    metadata JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (run_id) REFERENCES comparison_runs (id) ON DELETE CASCADE,
+    CONSTRAINT uq_comparison_run_archetype UNIQUE (run_id, archetype_id),
+    CONSTRAINT ck_comparison_results_awarded_amount_positive CHECK (awarded_amount >= 0)
+);
+CREATE INDEX ix_comparison_results_run_id ON comparison_results (run_id);
 
-    # ── corpus_chunks ────────────────────────────────────────────────
-    op.create_table(
-        "corpus_chunks",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column("source_type", sa.String(50), nullable=False),
-        sa.Column("source_title", sa.String(255), nullable=False),
-        sa.Column("section_number", sa.String(50), nullable=True),
-        sa.Column("topic", sa.String(100), nullable=True),
-        sa.Column("content", sa.Text, nullable=False),
-        # embedding column added via raw SQL (pgvector type)
-        sa.Column("metadata", postgresql.JSONB, nullable=True),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-    )
-    # The embedding column needs the vector type — add via raw SQL
-    op.execute(
-        "ALTER TABLE corpus_chunks ADD COLUMN embedding vector(1536)"
-    )
-    op.create_index("ix_corpus_chunks_source_type", "corpus_chunks", ["source_type"])
-    op.create_index("ix_corpus_chunks_topic", "corpus_chunks", ["topic"])
-    # HNSW index for vector similarity search
-    op.execute(
-        """
-        CREATE INDEX IF NOT EXISTS ix_corpus_chunks_embedding_hnsw
-        ON corpus_chunks
-        USING hnsw (embedding vector_cosine_ops)
-        WITH (m = 16, ef_construction = 64)
-        """
-    )
+-- ── corpus_chunks ────────────────────────────────────────────────
+CREATE TABLE corpus_chunks (
+    id UUID NOT NULL,
+    source_type VARCHAR(50) NOT NULL,
+    source_title VARCHAR(255) NOT NULL,
+    section_number VARCHAR(50),
+    topic VARCHAR(100),
+    content TEXT NOT NULL,
+    metadata JSONB,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    embedding vector(1536),
+    PRIMARY KEY (id)
+);
+CREATE INDEX ix_corpus_chunks_source_type ON corpus_chunks (source_type);
+CREATE INDEX ix_corpus_chunks_topic ON corpus_chunks (topic);
+-- The HNSW vector index is built by revision 0003, after the corpus is loaded
 
-    # ── llm_calls ────────────────────────────────────────────────────
-    op.create_table(
-        "llm_calls",
-        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
-        sa.Column(
-            "case_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("cases.id", ondelete="SET NULL"),
-            nullable=True,
-        ),
-        sa.Column("pipeline_step", sa.String(50), nullable=False),
-        sa.Column("model", sa.String(50), nullable=False),
-        sa.Column("input_tokens", sa.Integer, nullable=False),
-        sa.Column("output_tokens", sa.Integer, nullable=False),
-        sa.Column("cost_usd", sa.Numeric(10, 6), nullable=False),
-        sa.Column("latency_ms", sa.Integer, nullable=False),
-        sa.Column(
-            "prompt_version_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("prompt_versions.id", ondelete="SET NULL"),
-            nullable=True,
-        ),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.func.now(),
-            nullable=False,
-        ),
-    )
-    op.create_index("ix_llm_calls_case_id", "llm_calls", ["case_id"])
-    op.create_index("ix_llm_calls_created_at", "llm_calls", ["created_at"])
-    op.create_index("ix_llm_calls_pipeline_step", "llm_calls", ["pipeline_step"])
+-- ── llm_calls ────────────────────────────────────────────────────
+CREATE TABLE llm_calls (
+    id UUID NOT NULL,
+    case_id UUID,
+    pipeline_step VARCHAR(50) NOT NULL,
+    model VARCHAR(50) NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    cost_usd NUMERIC(10, 6) NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    prompt_version_id UUID,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+    PRIMARY KEY (id),
+    FOREIGN KEY (case_id) REFERENCES cases (id) ON DELETE SET NULL,
+    FOREIGN KEY (prompt_version_id) REFERENCES prompt_versions (id) ON DELETE SET NULL
+);
+CREATE INDEX ix_llm_calls_case_id ON llm_calls (case_id);
+CREATE INDEX ix_llm_calls_created_at ON llm_calls (created_at);
+CREATE INDEX ix_llm_calls_pipeline_step ON llm_calls (pipeline_step);
+"""
 
 
-def downgrade() -> None:
-    op.drop_table("llm_calls")
-    op.drop_table("corpus_chunks")
-    op.drop_table("comparison_results")
-    op.drop_table("comparison_runs")
-    op.drop_table("judgments")
-    op.drop_table("hearing_messages")
-    op.drop_table("hearings")
-    op.drop_table("case_timeline")
-    op.drop_table("evidence")
-    op.drop_table("parties")
-    op.drop_table("cases")
-    op.drop_table("prompt_versions")
-    op.drop_table("sessions")
+DROP_DDL = """
+DROP TABLE IF EXISTS
+    llm_calls,
+    corpus_chunks,
+    comparison_results,
+    comparison_runs,
+    judgments,
+    hearing_messages,
+    hearings,
+    case_timeline,
+    evidence,
+    parties,
+    cases,
+    prompt_versions,
+    sessions;
+
+DROP TYPE IF EXISTS
+    hearingmessagerole,
+    evidencetype,
+    casetype,
+    casestatus,
+    partyrole,
+    operatorrole;
+
+DROP EXTENSION IF EXISTS vector;
+"""
+
+
+def upgrade() -> None:
+    execute_sql_script(SCHEMA_DDL)
 
-    # Drop enum types
-    op.execute("DROP TYPE IF EXISTS hearingmessagerole")
-    op.execute("DROP TYPE IF EXISTS evidencetype")
-    op.execute("DROP TYPE IF EXISTS casetype")
-    op.execute("DROP TYPE IF EXISTS casestatus")
-    op.execute("DROP TYPE IF EXISTS partyrole")
-    op.execute("DROP TYPE IF EXISTS operatorrole")
 
-    op.execute("DROP EXTENSION IF EXISTS vector")
+def downgrade() -> None:
+    execute_sql_script(DROP_DDL)
@@ -0,0 +1,63 @@
+"""Build the vector similarity index on corpus_chunks.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-02-16
+
+Kept out of the initial schema so that bulk corpus ingestion does not pay
+per-row index maintenance, and so the index is built once over the full table.
+For a fresh install, load the corpus between the two steps:
+
+    alembic upgrade 0002
+    # start the API and POST /corpus/ingest (admin session)
+    alembic upgrade head
+
+The index kind comes from VECTOR_INDEX_TYPE (hnsw, ivfflat or flat).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from config import get_settings
+from db.migration_helpers import (
+    VECTOR_INDEX_NAMES,
+    build_index_with_tuning,
+    corpus_vector_index_ddl,
+    resolve_ivfflat_lists,
+)
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    settings = get_settings()
+    ddl = corpus_vector_index_ddl(
+        settings.vector_index_type,
+        hnsw_m=settings.hnsw_m,
+        hnsw_ef_construction=settings.hnsw_ef_construction,
+        ivfflat_lists=(
+            resolve_ivfflat_lists(settings.ivfflat_lists)
+            if settings.vector_index_type == "ivfflat"
+            else 0
+        ),
+        # The column is still vector(1536) here; 0006 converts it for fp16
+        precision="fp32",
+    )
+    if ddl is None:
+        return
+
+    # CONCURRENTLY keeps corpus_chunks writable during the build
+    build_index_with_tuning(
+        ddl,
+        maintenance_work_mem=settings.index_build_maintenance_work_mem,
+        parallel_workers=settings.index_build_parallel_workers,
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in VECTOR_INDEX_NAMES.values():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,30 @@
+"""Store sessions.role as a SMALLINT code instead of a Postgres ENUM.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-02-17
+
+0 = viewer, 1 = admin (models.database.OPERATOR_ROLE_CODES).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE sessions ADD COLUMN role_code SMALLINT NOT NULL DEFAULT 0")
+    op.execute("UPDATE sessions SET role_code = 1 WHERE role = 'admin'")
+    op.execute("ALTER TABLE sessions DROP COLUMN role")
+    op.execute("DROP TYPE IF EXISTS operatorrole")
+
+
+def downgrade() -> None:
+    op.execute("CREATE TYPE operatorrole AS ENUM ('viewer', 'admin')")
+    op.execute("ALTER TABLE sessions ADD COLUMN role operatorrole NOT NULL DEFAULT 'viewer'")
+    op.execute("UPDATE sessions SET role = 'admin' WHERE role_code = 1")
+    op.execute("ALTER TABLE sessions DROP COLUMN role_code")
@@ -0,0 +1,37 @@
+"""Replace llm_calls step/time indexes with one covering index.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-02-18
+
+Per-step cost/latency aggregations become index-only scans.  Built
+CONCURRENTLY so llm_calls stays writable while the pipeline is running.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_calls_step_time
+            ON llm_calls (pipeline_step, created_at DESC)
+            INCLUDE (cost_usd, latency_ms, input_tokens, output_tokens)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_llm_calls_pipeline_step")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_llm_calls_created_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_calls_created_at ON llm_calls (created_at)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_calls_pipeline_step ON llm_calls (pipeline_step)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_llm_calls_step_time")
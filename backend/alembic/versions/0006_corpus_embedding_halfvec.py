@@ -0,0 +1,79 @@
+"""Store corpus embeddings as halfvec(1536) when VECTOR_PRECISION=fp16.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-02-19
+
+halfvec (pgvector >= 0.7) halves per-row storage and the bytes an index scan
+touches.  No-op with the default fp32 precision.  The ANN index is dropped
+before the type change (its vector opclass does not apply to halfvec) and
+rebuilt afterwards with the matching opclass.  Both directions check the
+column's actual type, so the downgrade undoes the conversion even if
+VECTOR_PRECISION has changed since the upgrade.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from config import get_settings
+from db.migration_helpers import (
+    VECTOR_INDEX_NAMES,
+    build_index_with_tuning,
+    corpus_vector_index_ddl,
+    resolve_ivfflat_lists,
+)
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _embedding_type() -> str:
+    """The column's current type name: ``vector`` or ``halfvec``."""
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+            "WHERE attrelid = 'corpus_chunks'::regclass AND attname = 'embedding'"
+        )
+    ).scalar_one().split("(", 1)[0]
+
+
+def _convert(column_type: str, precision: str) -> None:
+    settings = get_settings()
+    for index_name in VECTOR_INDEX_NAMES.values():
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute(
+        f"ALTER TABLE corpus_chunks ALTER COLUMN embedding TYPE {column_type}(1536) "
+        f"USING embedding::{column_type}(1536)"
+    )
+    ddl = corpus_vector_index_ddl(
+        settings.vector_index_type,
+        hnsw_m=settings.hnsw_m,
+        hnsw_ef_construction=settings.hnsw_ef_construction,
+        ivfflat_lists=(
+            resolve_ivfflat_lists(settings.ivfflat_lists)
+            if settings.vector_index_type == "ivfflat"
+            else 0
+        ),
+        precision=precision,
+    )
+    if ddl is not None:
+        build_index_with_tuning(
+            ddl,
+            maintenance_work_mem=settings.index_build_maintenance_work_mem,
+            parallel_workers=settings.index_build_parallel_workers,
+        )
+
+
+def upgrade() -> None:
+    if get_settings().vector_precision != "fp16" or _embedding_type() == "halfvec":
+        return
+    _convert("halfvec", "fp16")
+
+
+def downgrade() -> None:
+    if _embedding_type() != "halfvec":
+        return
+    _convert("vector", "fp32")
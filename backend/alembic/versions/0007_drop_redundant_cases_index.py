@@ -0,0 +1,27 @@
+"""Drop ix_cases_session_id, redundant with ix_cases_session_status.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-02-20
+
+The composite (session_id, status) index already serves session_id lookups
+through its leading column; the single-column index only added write cost.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_cases_session_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_cases_session_id ON cases (session_id)")
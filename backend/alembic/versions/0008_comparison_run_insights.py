@@ -0,0 +1,31 @@
+"""Store comparison insights on comparison_runs.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-02-21
+
+Reused comparison runs return the stored insights instead of recomputing
+them from the results on every request.  Existing rows start out NULL and
+are filled in the first time they are reused.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "comparison_runs",
+        sa.Column("comparison_insights", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("comparison_runs", "comparison_insights")
@@ -0,0 +1,32 @@
+"""Drop ix_hearing_messages_hearing_id, redundant with the (hearing_id, sequence) key.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-02-22
+
+uq_hearing_messages_hearing_seq is backed by a unique (hearing_id, sequence)
+B-tree, which already serves MAX(sequence) for a hearing as a single index
+descent and the transcript read in sequence order without a sort.  The
+single-column index only added write cost to every hearing turn.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_hearing_messages_hearing_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_hearing_messages_hearing_id "
+            "ON hearing_messages (hearing_id)"
+        )
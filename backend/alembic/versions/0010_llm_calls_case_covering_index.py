@@ -0,0 +1,37 @@
+"""Replace ix_llm_calls_case_id with a covering (case_id, created_at) index.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-02-23
+
+The judgment metadata totals (count and the cost/latency/token sums for one
+case) become an index-only scan, and the paginated call list reads in
+created_at order without a sort.  case_id still leads, so the new index
+also serves everything the single-column one did.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_calls_case_time
+            ON llm_calls (case_id, created_at)
+            INCLUDE (cost_usd, latency_ms, input_tokens, output_tokens)
+            """
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_llm_calls_case_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_llm_calls_case_id ON llm_calls (case_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_llm_calls_case_time")
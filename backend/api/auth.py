@@ -1,25 +1,26 @@
 """Authentication and role-claim endpoints."""
 
-import asyncio
-
 import fastapi
 from fastapi import APIRouter, Depends
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.guardrails import FixedWindowRateLimiter, api_error
+from api.guardrails import api_error, make_rate_limiter
 from api.security import (
-    get_session_by_header,
+    get_session_role,
+    invalidate_session_role,
     is_admin_key_valid,
+    require_session_id,
     required_session_header,
     set_session_cookie,
 )
 from db.connection import get_db
-from models.database import OperatorRole
+from models.database import OperatorRole, Session
 from models.schemas import AdminLoginRequest, AuthMeResponse, SessionResponse
 
 router = APIRouter()
 
-_admin_login_limiter = FixedWindowRateLimiter(
+_admin_login_limiter = make_rate_limiter(
     max_requests=5,
     window_seconds=900,  # 5 attempts per 15 minutes per session
 )
@@ -31,11 +32,11 @@ async def auth_me(
     db: AsyncSession = Depends(get_db),
 ):
     """Return trusted role claims for the current session."""
-    session = await get_session_by_header(db, session_id)
+    session_uuid, role = await get_session_role(db, session_id)
     return AuthMeResponse(
-        session_id=session.id,
-        role=session.role,
-        is_admin=session.role == OperatorRole.admin,
+        session_id=session_uuid,
+        role=role,
+        is_admin=role == OperatorRole.admin,
     )
 
 
@@ -52,18 +53,31 @@ async def claim_admin_role(
         code="admin_login_rate_limited",
         message="Too many admin login attempts. Try again later.",
     )
-    session = await get_session_by_header(db, session_id)
+    # Validate the key in memory first so failed attempts never touch the DB.
+    # Brute force is bounded by _admin_login_limiter; no server-side delay,
+    # which would only tie up the worker.
     if not is_admin_key_valid(body.admin_key):
-        # Deliberate delay to slow brute-force attacks
-        await asyncio.sleep(1.0)
         raise api_error(
             status_code=403,
             code="invalid_admin_key",
             message="Invalid admin key",
         )
-    session.role = OperatorRole.admin
-    await db.flush()
-    await db.refresh(session)
+    # Promote and fetch the row in one round-trip instead of SELECT + UPDATE
+    session_uuid = require_session_id(session_id)
+    result = await db.execute(
+        update(Session)
+        .where(Session.id == session_uuid)
+        .values(role=OperatorRole.admin, last_active=func.now())
+        .returning(Session)
+    )
+    session = result.scalar_one_or_none()
+    if session is None:
+        raise api_error(
+            status_code=404,
+            code="session_not_found",
+            message="Session not found",
+        )
+    invalidate_session_role(session.id)
     # Refresh the cookie to ensure it stays in sync
     set_session_cookie(response, str(session.id))
     return session
@@ -1,15 +1,19 @@
 """Case management API endpoints."""
 
+import asyncio
 import uuid
 
 import fastapi
 from fastapi import APIRouter, Depends, Query, UploadFile, File, Form
-from fastapi.responses import Response as RawResponse
+from fastapi.responses import FileResponse, Response as RawResponse
+from pydantic import TypeAdapter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from api.guardrails import api_error
+from api.responses import json_array_response, json_response, ndjson_response
+from crypto import is_encryption_enabled
 from db.connection import get_db
 from api.security import (
     apply_admin_claim,
@@ -44,6 +48,18 @@ from services import file_service
 
 router = APIRouter()
 
+# Everything CaseResponse serializes, eagerly; any other relationship access
+# raises instead of silently issuing one lazy SELECT per row.
+CASE_DETAIL_OPTIONS = (
+    selectinload(Case.parties),
+    selectinload(Case.evidence),
+    selectinload(Case.timeline_events),
+    raiseload("*"),
+)
+
+_case_adapter = TypeAdapter(CaseResponse)
+_timeline_adapter = TypeAdapter(list[TimelineEventResponse])
+
 
 # ─── Session Endpoints ────────────────────────────────────────────────────────
 
@@ -91,11 +107,7 @@ async def create_case(
     result = await db.execute(
         select(Case)
         .where(Case.id == case.id)
-        .options(
-            selectinload(Case.parties),
-            selectinload(Case.evidence),
-            selectinload(Case.timeline_events),
-        )
+        .options(*CASE_DETAIL_OPTIONS)
     )
     case = result.scalar_one()
     return case
@@ -112,13 +124,9 @@ async def get_case(
         db,
         case_id,
         session_id,
-        options=(
-            selectinload(Case.parties),
-            selectinload(Case.evidence),
-            selectinload(Case.timeline_events),
-        ),
+        options=CASE_DETAIL_OPTIONS,
     )
-    return case
+    return await json_response(_case_adapter, case)
 
 
 @router.put("/cases/{case_id}", response_model=CaseResponse)
@@ -142,11 +150,7 @@ async def update_case(
     result = await db.execute(
         select(Case)
         .where(Case.id == case_id)
-        .options(
-            selectinload(Case.parties),
-            selectinload(Case.evidence),
-            selectinload(Case.timeline_events),
-        )
+        .options(*CASE_DETAIL_OPTIONS)
     )
     return result.scalar_one()
 
@@ -238,15 +242,23 @@ async def download_evidence_file(
             message="Evidence file not found",
         )
 
-    plaintext = file_service.read_and_decrypt(evidence.file_path)
     filename = file_service.safe_filename(evidence.file_path)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+    if not is_encryption_enabled():
+        # Stored as plaintext: stream it from disk in chunks
+        return FileResponse(
+            file_service.resolve_upload_path(evidence.file_path),
+            media_type="application/octet-stream",
+            headers=headers,
+        )
 
+    # Fernet decrypts a whole file at once; keep that off the event loop
+    plaintext = await asyncio.to_thread(file_service.read_and_decrypt, evidence.file_path)
     return RawResponse(
         content=plaintext,
         media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+        headers=headers,
     )
 
 
@@ -277,14 +289,17 @@ async def get_timeline(
     db: AsyncSession = Depends(get_db),
     limit: int = Query(100, ge=1, le=500, description="Max events to return"),
     offset: int = Query(0, ge=0, description="Number of events to skip"),
+    stream: bool = Query(False, description="Stream events as NDJSON"),
 ):
     """Get all timeline events for a case, ordered by date."""
     await get_owned_case(db, case_id, session_id)
-    result = await db.execute(
+    stmt = (
         select(TimelineEvent)
         .where(TimelineEvent.case_id == case_id)
         .order_by(TimelineEvent.event_date)
         .limit(limit)
         .offset(offset)
     )
-    return result.scalars().all()
+    if stream:
+        return await ndjson_response(db, stmt, TimelineEventResponse)
+    return await json_array_response(db, stmt, _timeline_adapter)
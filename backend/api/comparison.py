@@ -3,18 +3,21 @@
 import asyncio
 import logging
 import uuid
+from operator import attrgetter, itemgetter
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import raiseload, selectinload
 
-from api.guardrails import FixedWindowRateLimiter, api_error
+from api.guardrails import api_error, make_rate_limiter
+from api.responses import json_response, ndjson_response
 from api.security import get_owned_case, required_session_header
 from config import get_settings
-from db.connection import get_db
+from db.connection import copy_rows, get_db, get_sessionmaker
 from engine.case_advisor import synthesize_comparison_insights
-from engine.pipeline import run_pipeline
+from engine.pipeline import analyze_case, run_pipeline
 from models.database import (
     Case,
     ComparisonResult,
@@ -24,19 +27,108 @@ from models.database import (
 from models.schemas import ComparisonRunRequest, ComparisonRunResponse
 from services.hearing_service import extract_party_names
 from services.judgment_helpers import (
+    cached_pipeline_result,
     comparison_run_key,
     derive_winner,
     extract_hearing_transcript,
+    get_cached_pipeline_result,
     get_case_and_hearing_context,
+    llm_call_row,
+    pipeline_cache_key,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
+_run_list_adapter = TypeAdapter(list[ComparisonRunResponse])
 settings = get_settings()
-comparison_limiter = FixedWindowRateLimiter(
+comparison_limiter = make_rate_limiter(
     max_requests=settings.judgment_requests_per_minute,
     window_seconds=60,
 )
+PIPELINE_WORKERS = 4  # judge pipelines a comparison run executes at once
+
+# ─── Run-key cache ────────────────────────────────────────────────────────────
+# (case_id, run_key) → ComparisonRun.id for runs this process has seen.  A
+# run_key hashes the case inputs, so a hit stays correct until that run is
+# replaced; the reuse path then loads the run by primary key instead of
+# searching by (case_id, run_key).  Ids that no longer resolve (run deleted by
+# another worker, or its transaction rolled back) fall back to the full lookup.
+_run_id_cache: dict[tuple[uuid.UUID, str], uuid.UUID] = {}
+_RUN_ID_CACHE_MAX_SIZE = 10_000
+
+
+def _cache_run_id(case_id: uuid.UUID, run_key: str, run_id: uuid.UUID) -> None:
+    _run_id_cache[(case_id, run_key)] = run_id
+    # Prevent unbounded growth: drop the oldest half (dicts keep insertion order)
+    if len(_run_id_cache) > _RUN_ID_CACHE_MAX_SIZE:
+        for key in list(_run_id_cache)[: len(_run_id_cache) // 2]:
+            _run_id_cache.pop(key, None)
+
+
+# Fixed-shape run lookups, built once and executed with bound parameters
+_RUN_WITH_RESULTS = select(ComparisonRun).options(
+    selectinload(ComparisonRun.results), raiseload("*")
+)
+_RUN_BY_ID = _RUN_WITH_RESULTS.where(ComparisonRun.id == bindparam("run_id"))
+_RUN_BY_KEY = _RUN_WITH_RESULTS.where(
+    ComparisonRun.case_id == bindparam("case_id"),
+    ComparisonRun.run_key == bindparam("run_key"),
+)
+_RUN_ID_BY_KEY = select(ComparisonRun.id).where(
+    ComparisonRun.case_id == bindparam("case_id"),
+    ComparisonRun.run_key == bindparam("run_key"),
+)
+
+
+async def _find_existing_run(
+    db: AsyncSession, case_id: uuid.UUID, run_key: str
+) -> ComparisonRun | None:
+    """Load the stored run for ``run_key`` with its results, if there is one."""
+    cached_id = _run_id_cache.get((case_id, run_key))
+    if cached_id is not None:
+        run = (
+            await db.execute(_RUN_BY_ID, {"run_id": cached_id})
+        ).scalar_one_or_none()
+        if run is not None and run.case_id == case_id:
+            return run
+        _run_id_cache.pop((case_id, run_key), None)
+
+    run = (
+        await db.execute(_RUN_BY_KEY, {"case_id": case_id, "run_key": run_key})
+    ).scalar_one_or_none()
+    if run is not None:
+        _cache_run_id(case_id, run_key, run.id)
+    return run
+
+
+async def _find_existing_run_id(
+    db: AsyncSession, case_id: uuid.UUID, run_key: str
+) -> uuid.UUID | None:
+    """Just the id of the stored run for ``run_key``: all a refresh needs."""
+    return await db.scalar(_RUN_ID_BY_KEY, {"case_id": case_id, "run_key": run_key})
+
+
+_INSIGHT_KEYS = (
+    "archetype_id", "in_favor_of", "awarded_amount", "evidence_scores", "reasoning_chain"
+)
+_INSIGHT_FIELDS = attrgetter(*_INSIGHT_KEYS)  # ComparisonResult objects
+_INSIGHT_ITEMS = itemgetter(*_INSIGHT_KEYS)  # ComparisonResult row dicts
+
+
+def _insights_input(results, fields=_INSIGHT_FIELDS) -> list[dict]:
+    """Shape ComparisonResult rows for synthesize_comparison_insights."""
+    rows = []
+    for archetype_id, in_favor_of, awarded, scores, chain in map(fields, results):
+        rows.append(
+            {
+                "archetype_id": archetype_id,
+                "in_favor_of": in_favor_of.value if in_favor_of else "unknown",
+                "awarded_amount": float(awarded) if awarded else 0,
+                "evidence_scores": scores or {},
+                "reasoning_chain": chain or {},
+            }
+        )
+    return rows
 
 
 @router.post("/cases/{case_id}/comparison-runs", response_model=ComparisonRunResponse)
@@ -45,6 +137,7 @@ async def run_or_reuse_comparison(
     body: ComparisonRunRequest,
     session_id: str = Depends(required_session_header),
     db: AsyncSession = Depends(get_db),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker),
 ):
     """Run and persist multi-judge comparison results, reusing matching runs."""
     await comparison_limiter.check(
@@ -60,7 +153,7 @@ async def run_or_reuse_comparison(
             message="Both plaintiff and defendant narratives are required.",
         )
 
-    archetype_ids = sorted({value.strip() for value in body.archetype_ids if value.strip()})
+    archetype_ids = body.archetype_ids  # normalized by ComparisonRunRequest
     if not archetype_ids:
         raise api_error(
             status_code=400,
@@ -69,23 +162,18 @@ async def run_or_reuse_comparison(
         )
 
     run_key = comparison_run_key(case, hearing, archetype_ids)
-    existing_stmt = (
-        select(ComparisonRun)
-        .where(ComparisonRun.case_id == case_id, ComparisonRun.run_key == run_key)
-        .options(selectinload(ComparisonRun.results))
-    )
-    existing = (await db.execute(existing_stmt)).scalar_one_or_none()
-    if existing and not body.force_refresh:
-        cached_insights_input = [
-            {
-                "archetype_id": r.archetype_id,
-                "in_favor_of": r.in_favor_of.value if r.in_favor_of else "unknown",
-                "awarded_amount": float(r.awarded_amount) if r.awarded_amount else 0,
-                "evidence_scores": r.evidence_scores or {},
-                "reasoning_chain": r.reasoning_chain or {},
-            }
-            for r in existing.results
-        ]
+    existing = None
+    existing_id = None
+    if body.force_refresh:
+        # The stored run is about to be replaced: its results aren't needed
+        existing_id = await _find_existing_run_id(db, case_id, run_key)
+    else:
+        existing = await _find_existing_run(db, case_id, run_key)
+    if existing:
+        insights = existing.comparison_insights
+        if insights is None or body.force_refresh_insights:
+            insights = synthesize_comparison_insights(_insights_input(existing.results))
+            existing.comparison_insights = insights
         return ComparisonRunResponse.model_validate(
             {
                 "id": existing.id,
@@ -94,113 +182,178 @@ async def run_or_reuse_comparison(
                 "created_at": existing.created_at,
                 "results": existing.results,
                 "reused": True,
-                "comparison_insights": synthesize_comparison_insights(cached_insights_input),
+                "comparison_insights": insights,
             }
         )
-    if existing and body.force_refresh:
-        await db.delete(existing)
-        await db.flush()
 
     plaintiff_name, defendant_name = extract_party_names(case)
     hearing_transcript = extract_hearing_transcript(hearing)
-    comp_run = ComparisonRun(
-        case_id=case_id,
-        run_key=run_key,
-        archetype_ids=archetype_ids,
-    )
-    db.add(comp_run)
-    await db.flush()
+    # End the read transaction so the request holds no pooled connection
+    # during the LLM phase (seconds to minutes); the writes below start a
+    # new, short one.  Loaded attributes survive (expire_on_commit=False).
+    await db.commit()
 
-    sem = asyncio.Semaphore(4)
     claimed = float(case.claimed_amount) if case.claimed_amount is not None else None
 
-    async def _run_one(arch_id: str) -> dict:
-        async with sem:
-            return await run_pipeline(
-                db=db,
+    cache_keys = {
+        aid: pipeline_cache_key(
+            plaintiff_narrative=case.plaintiff_narrative,
+            defendant_narrative=case.defendant_narrative,
+            plaintiff_name=plaintiff_name,
+            defendant_name=defendant_name,
+            claimed_amount=claimed,
+            archetype_id=aid,
+            hearing_transcript=hearing_transcript,
+        )
+        for aid in archetype_ids
+    }
+    # Judges already run on identical inputs (by an earlier judgment or run)
+    # are served from the pipeline cache; force_refresh asks for new output
+    cached = {}
+    if not body.force_refresh:
+        for aid, key in cache_keys.items():
+            hit = get_cached_pipeline_result(key)
+            if hit is not None:
+                cached[aid] = hit
+
+    # Facts, classification and rules don't depend on the judge: derive them
+    # once, so every judge works from the same record and the reasoning
+    # prompts share a prefix the provider can cache
+    case_analysis = None
+    if len(cached) < len(archetype_ids):
+        async with sessionmaker() as worker_db:
+            case_analysis = await analyze_case(
+                db=worker_db,
                 plaintiff_narrative=case.plaintiff_narrative,
                 defendant_narrative=case.defendant_narrative,
                 plaintiff_name=plaintiff_name,
                 defendant_name=defendant_name,
                 claimed_amount=claimed,
-                archetype_id=arch_id,
-                hearing_transcript=hearing_transcript,
             )
 
-    pipeline_results = await asyncio.gather(
-        *(_run_one(aid) for aid in archetype_ids),
-        return_exceptions=True,
+    async def _run_one(arch_id: str) -> tuple[dict, bool]:
+        async def _compute() -> dict:
+            # Steps 4-7 make no DB calls once case_analysis is given; the
+            # session is only there to satisfy run_pipeline's signature
+            async with sessionmaker() as worker_db:
+                return await run_pipeline(
+                    db=worker_db,
+                    plaintiff_narrative=case.plaintiff_narrative,
+                    defendant_narrative=case.defendant_narrative,
+                    plaintiff_name=plaintiff_name,
+                    defendant_name=defendant_name,
+                    claimed_amount=claimed,
+                    archetype_id=arch_id,
+                    hearing_transcript=hearing_transcript,
+                    case_analysis=case_analysis,
+                )
+
+        return await cached_pipeline_result(
+            cache_keys[arch_id], _compute, refresh=body.force_refresh
+        )
+
+    # A fixed pool of workers drains a queue of the judges still to run, so
+    # at most PIPELINE_WORKERS pipelines (and their coroutines) exist at once
+    outcomes: dict[str, tuple[dict, bool] | BaseException] = {
+        aid: (result, False) for aid, result in cached.items()
+    }
+    pending: asyncio.Queue[str] = asyncio.Queue()
+    for aid in archetype_ids:
+        if aid not in cached:
+            pending.put_nowait(aid)
+
+    async def _worker() -> None:
+        while not pending.empty():
+            aid = pending.get_nowait()
+            try:
+                outcomes[aid] = await _run_one(aid)
+            except Exception as exc:  # reported per judge below
+                outcomes[aid] = exc
+
+    await asyncio.gather(
+        *(_worker() for _ in range(min(PIPELINE_WORKERS, pending.qsize())))
     )
+    pipeline_results = [outcomes[aid] for aid in archetype_ids]
 
-    for archetype_id, pipeline_result in zip(archetype_ids, pipeline_results):
-        if isinstance(pipeline_result, BaseException):
+    if existing_id is not None:  # force_refresh: replace it in the same transaction
+        _run_id_cache.pop((case_id, run_key), None)
+        # comparison_results rows go with it via ON DELETE CASCADE
+        await db.execute(delete(ComparisonRun).where(ComparisonRun.id == existing_id))
+    comp_run = ComparisonRun(
+        case_id=case_id,
+        run_key=run_key,
+        archetype_ids=archetype_ids,
+    )
+    db.add(comp_run)
+    await db.flush()
+    _cache_run_id(case_id, run_key, comp_run.id)
+
+    # Collected as plain rows and written with one executemany per table
+    # instead of one ORM object (and INSERT) per row
+    result_rows: list[dict] = []
+    llm_rows: list[dict] = [
+        llm_call_row(case_id, f"cmp:shared:{call_meta['pipeline_step']}", call_meta)
+        for call_meta in (case_analysis["llm_calls"] if case_analysis else [])
+    ]
+    for archetype_id, outcome in zip(archetype_ids, pipeline_results):
+        if isinstance(outcome, BaseException):
             logger.error(
                 "Pipeline failed for archetype %s on case %s: %s",
-                archetype_id, case_id, pipeline_result,
+                archetype_id, case_id, outcome,
             )
             continue
+        pipeline_result, computed = outcome
 
         judgment_data = pipeline_result["judgment"]
-        result = ComparisonResult(
-            run_id=comp_run.id,
-            archetype_id=archetype_id,
-            findings_of_fact=judgment_data.get("findings_of_fact", []),
-            conclusions_of_law=judgment_data.get("conclusions_of_law", []),
-            judgment_text=judgment_data.get("judgment_text", ""),
-            rationale=judgment_data.get("rationale", ""),
-            awarded_amount=judgment_data.get("awarded_amount"),
-            in_favor_of=derive_winner(judgment_data.get("in_favor_of")),
-            evidence_scores=pipeline_result.get("evidence_scores"),
-            reasoning_chain=pipeline_result.get("reasoning_chain"),
-            metadata_={
-                "pipeline_metadata": pipeline_result.get("pipeline_metadata"),
-                "classification": pipeline_result.get("classification"),
-                "advisory": pipeline_result.get("advisory"),
-            },
+        result_rows.append(
+            {
+                "run_id": comp_run.id,
+                "archetype_id": archetype_id,
+                "findings_of_fact": judgment_data.get("findings_of_fact", []),
+                "conclusions_of_law": judgment_data.get("conclusions_of_law", []),
+                "judgment_text": judgment_data.get("judgment_text", ""),
+                "rationale": judgment_data.get("rationale", ""),
+                "awarded_amount": judgment_data.get("awarded_amount"),
+                "in_favor_of": derive_winner(judgment_data.get("in_favor_of")),
+                "evidence_scores": pipeline_result.get("evidence_scores"),
+                "reasoning_chain": pipeline_result.get("reasoning_chain"),
+                "metadata_": {
+                    "pipeline_metadata": pipeline_result.get("pipeline_metadata"),
+                    "classification": pipeline_result.get("classification"),
+                    "advisory": pipeline_result.get("advisory"),
+                },
+            }
         )
-        db.add(result)
 
+        if not computed:
+            continue  # served from the pipeline cache: no new LLM calls to log
         for call_meta in pipeline_result.get("pipeline_metadata", {}).get("llm_calls", []):
-            pipeline_step = f"cmp:{archetype_id}:{call_meta['pipeline_step']}"[:50]
-            llm_call = LLMCall(
-                case_id=case_id,
-                pipeline_step=pipeline_step,
-                model=call_meta["model"],
-                input_tokens=call_meta["input_tokens"],
-                output_tokens=call_meta["output_tokens"],
-                cost_usd=call_meta["cost_usd"],
-                latency_ms=call_meta["latency_ms"],
+            llm_rows.append(
+                llm_call_row(case_id, f"cmp:{archetype_id}:{call_meta['pipeline_step']}", call_meta)
             )
-            db.add(llm_call)
 
-    await db.flush()
-    run_with_results = (
-        await db.execute(
-            select(ComparisonRun)
-            .where(ComparisonRun.id == comp_run.id)
-            .options(selectinload(ComparisonRun.results))
-        )
-    ).scalar_one()
+    # Synthesized from the rows in hand, so it rides along with this request's
+    # writes rather than waiting for them to be read back
+    insights = synthesize_comparison_insights(_insights_input(result_rows, _INSIGHT_ITEMS))
+    comp_run.comparison_insights = insights
 
-    insights_input = [
-        {
-            "archetype_id": r.archetype_id,
-            "in_favor_of": r.in_favor_of.value if r.in_favor_of else "unknown",
-            "awarded_amount": float(r.awarded_amount) if r.awarded_amount else 0,
-            "evidence_scores": r.evidence_scores or {},
-            "reasoning_chain": r.reasoning_chain or {},
-        }
-        for r in run_with_results.results
-    ]
-    insights = synthesize_comparison_insights(insights_input)
+    results: list[ComparisonResult] = []
+    if result_rows:
+        # RETURNING hands back the inserted rows (with server defaults), so
+        # the response needs no second SELECT
+        results = list(
+            await db.scalars(insert(ComparisonResult).returning(ComparisonResult), result_rows)
+        )
+    # Telemetry rows nothing reads back: stream them with COPY
+    await copy_rows(db, LLMCall, llm_rows)
 
     return ComparisonRunResponse.model_validate(
         {
-            "id": run_with_results.id,
-            "case_id": run_with_results.case_id,
-            "archetype_ids": run_with_results.archetype_ids,
-            "created_at": run_with_results.created_at,
-            "results": run_with_results.results,
+            "id": comp_run.id,
+            "case_id": comp_run.case_id,
+            "archetype_ids": comp_run.archetype_ids,
+            "created_at": comp_run.created_at,
+            "results": results,
             "reused": False,
             "comparison_insights": insights,
         }
@@ -214,33 +367,22 @@ async def list_comparison_runs(
     db: AsyncSession = Depends(get_db),
     limit: int = Query(20, ge=1, le=100, description="Max runs to return"),
     offset: int = Query(0, ge=0, description="Number of runs to skip"),
+    stream: bool = Query(False, description="Stream runs as NDJSON"),
 ):
     """List persisted comparison runs for a case (newest first)."""
     await get_owned_case(db, case_id, session_id)
-    runs = (
-        await db.execute(
-            select(ComparisonRun)
-            .where(ComparisonRun.case_id == case_id)
-            .options(selectinload(ComparisonRun.results))
-            .order_by(ComparisonRun.created_at.desc())
-            .limit(limit)
-            .offset(offset)
-        )
-    ).scalars().all()
-
-    return [
-        ComparisonRunResponse.model_validate(
-            {
-                "id": run.id,
-                "case_id": run.case_id,
-                "archetype_ids": run.archetype_ids,
-                "created_at": run.created_at,
-                "results": run.results,
-                "reused": False,
-            }
-        )
-        for run in runs
-    ]
+    stmt = (
+        select(ComparisonRun)
+        .where(ComparisonRun.case_id == case_id)
+        .options(selectinload(ComparisonRun.results), raiseload("*"))
+        .order_by(ComparisonRun.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    if stream:
+        return await ndjson_response(db, stmt, ComparisonRunResponse)
+    runs = (await db.execute(stmt)).scalars().all()
+    return await json_response(_run_list_adapter, runs)
 
 
 @router.get("/cases/{case_id}/comparison-runs/{run_id}", response_model=ComparisonRunResponse)
@@ -256,7 +398,7 @@ async def get_comparison_run(
         await db.execute(
             select(ComparisonRun)
             .where(ComparisonRun.id == run_id, ComparisonRun.case_id == case_id)
-            .options(selectinload(ComparisonRun.results))
+            .options(selectinload(ComparisonRun.results), raiseload("*"))
         )
     ).scalar_one_or_none()
     if not run:
@@ -265,13 +407,4 @@ async def get_comparison_run(
             code="comparison_run_not_found",
             message="Comparison run not found for this case.",
         )
-    return ComparisonRunResponse.model_validate(
-        {
-            "id": run.id,
-            "case_id": run.case_id,
-            "archetype_ids": run.archetype_ids,
-            "created_at": run.created_at,
-            "results": run.results,
-            "reused": False,
-        }
-    )
+    return ComparisonRunResponse.model_validate(run)
@@ -1,10 +1,15 @@
 """Corpus search and management API endpoints."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import delete, func, select
+import json
+import time
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.guardrails import FixedWindowRateLimiter, api_error
+from api.guardrails import api_error, make_rate_limiter
 from api.security import require_admin_session
 from config import get_settings
 from corpus.ingest import embed_and_prepare_chunks
@@ -17,14 +22,20 @@ from models.schemas import ArchetypeResponse
 
 settings = get_settings()
 router = APIRouter()
-search_limiter = FixedWindowRateLimiter(
+search_limiter = make_rate_limiter(
     max_requests=settings.corpus_search_requests_per_minute,
     window_seconds=60,
 )
-ingest_limiter = FixedWindowRateLimiter(
+ingest_limiter = make_rate_limiter(
     max_requests=settings.corpus_ingest_requests_per_hour,
     window_seconds=3600,
 )
+INGEST_PAGE_SIZE = 1000  # rows per bulk INSERT executemany
+
+# The corpus only changes on ingest, which clears this; the TTL just bounds
+# staleness if another worker ran the ingest
+_STATS_TTL_SECONDS = 60
+_stats_cache: tuple[float, bytes] | None = None  # (cached at, encoded body)
 
 
 @router.post("/corpus/search", response_model=list[CorpusSearchResult])
@@ -72,12 +83,14 @@ async def ingest_corpus(
             retryable=True,
         )
 
-    # Insert into database
-    for chunk_data in prepared:
-        chunk = CorpusChunk(**chunk_data)
-        db.add(chunk)
+    # Bulk insert (one executemany per page) instead of an ORM object per chunk
+    for start in range(0, len(prepared), INGEST_PAGE_SIZE):
+        await db.execute(insert(CorpusChunk), prepared[start:start + INGEST_PAGE_SIZE])
 
-    await db.flush()
+    # Commit before dropping the cached stats so the next read sees the new rows
+    await db.commit()
+    global _stats_cache
+    _stats_cache = None
 
     return {
         "status": "success",
@@ -91,6 +104,15 @@ async def corpus_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get statistics about the ingested corpus."""
+    global _stats_cache
+    now = time.monotonic()
+    if _stats_cache is None or now - _stats_cache[0] >= _STATS_TTL_SECONDS:
+        _stats_cache = (now, await _encode_stats(db))
+    return Response(content=_stats_cache[1], media_type="application/json")
+
+
+async def _encode_stats(db: AsyncSession) -> bytes:
+    """Count chunks per source type and encode the /corpus/stats body."""
     result = await db.execute(
         select(CorpusChunk.source_type, func.count())
         .group_by(CorpusChunk.source_type)
@@ -100,20 +122,20 @@ async def corpus_stats(
     stats = {source_type: count for source_type, count in rows}
     total = sum(stats.values())
 
-    return {
+    payload = {
         "total_chunks": total,
         "by_source_type": stats,
     }
+    return json.dumps(payload, separators=(",", ":")).encode()
 
 
 # ─── Archetype Endpoints ──────────────────────────────────────────────────────
 
 
-@router.get("/archetypes", response_model=list[ArchetypeResponse])
-async def get_archetypes():
-    """List all available judge archetypes."""
-    archetypes = list_archetypes()
-    return [
+@lru_cache(maxsize=1)
+def _archetypes_json() -> bytes:
+    """The /archetypes body, encoded once: archetypes are static config."""
+    archetypes = [
         ArchetypeResponse(
             id=a["id"],
             name=a["name"],
@@ -121,5 +143,12 @@ async def get_archetypes():
             tone=a["tone"],
             icon=a["icon"],
         )
-        for a in archetypes
+        for a in list_archetypes()
     ]
+    return TypeAdapter(list[ArchetypeResponse]).dump_json(archetypes)
+
+
+@router.get("/archetypes", response_model=list[ArchetypeResponse])
+async def get_archetypes():
+    """List all available judge archetypes."""
+    return Response(content=_archetypes_json(), media_type="application/json")
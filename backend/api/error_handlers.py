@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
+
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 DEFAULT_MESSAGES = {
     400: ("bad_request", "Request is invalid."),
@@ -36,19 +38,45 @@ def _payload(
     return {"error": error}
 
 
-async def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse:
+def _is_retryable(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+# Encoded once at import (with JSONResponse's own settings, so the bytes are
+# identical) for errors raised without a detail of their own
+_DEFAULT_BODIES = {
+    status_code: json.dumps(
+        _payload(code=code, message=message, retryable=_is_retryable(status_code)),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    for status_code, (code, message) in DEFAULT_MESSAGES.items()
+}
+
+
+async def http_exception_handler(_: Request, exc: HTTPException) -> Response:
     detail = exc.detail
     if isinstance(detail, dict) and "error" in detail:
         return JSONResponse(status_code=exc.status_code, content=detail)
 
+    if not detail and exc.status_code in _DEFAULT_BODIES:
+        return Response(
+            content=_DEFAULT_BODIES[exc.status_code],
+            status_code=exc.status_code,
+            media_type="application/json",
+        )
+
     default_code, default_message = DEFAULT_MESSAGES.get(
         exc.status_code, ("http_error", "Request failed.")
     )
     message = str(detail) if detail else default_message
-    retryable = exc.status_code == 429 or exc.status_code >= 500
     return JSONResponse(
         status_code=exc.status_code,
-        content=_payload(code=default_code, message=message, retryable=retryable),
+        content=_payload(
+            code=default_code, message=message, retryable=_is_retryable(exc.status_code)
+        ),
     )
 
 
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
-from collections import defaultdict, deque
 from collections.abc import Callable
+from functools import lru_cache
 
 from fastapi import HTTPException
 
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
 
 def api_error(
     *,
@@ -30,43 +35,66 @@ def api_error(
     return HTTPException(status_code=status_code, detail=payload)
 
 
-class FixedWindowRateLimiter:
-    """In-memory, per-key fixed-window rate limiter with per-key locking."""
+class SlidingWindowRateLimiter:
+    """In-memory, per-key rate limiter with per-key locking.
+
+    Keeps two counters per key (this window and the previous one) and weights
+    the previous window by how much of it still overlaps the trailing
+    ``window_seconds``: the usual sliding-window approximation, in O(1) time
+    and memory per key instead of one timestamp per request.
+    """
 
     _MAX_LOCKS = 10_000
 
     def __init__(self, max_requests: int, window_seconds: int):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._events: dict[str, deque[float]] = defaultdict(deque)
+        # key -> (window id, previous window count, current window count)
+        self._counters: dict[str, tuple[int, int, int]] = {}
         self._locks: dict[str, asyncio.Lock] = {}
-        self._meta_lock = asyncio.Lock()
-
-    async def _get_lock(self, key: str) -> asyncio.Lock:
-        """Get or create a per-key lock, evicting stale locks if over limit."""
-        if key in self._locks:
-            return self._locks[key]
-        async with self._meta_lock:
-            if key not in self._locks:
-                if len(self._locks) > self._MAX_LOCKS:
-                    stale = [k for k in self._locks if k not in self._events]
-                    for k in stale:
-                        self._locks.pop(k, None)
-                self._locks[key] = asyncio.Lock()
-            return self._locks[key]
+        self._sweep_at = self._MAX_LOCKS
+
+    def _get_lock(self, key: str) -> asyncio.Lock:
+        """Get or create the per-key lock.
+
+        Plain dict operations with no await in between, so there is no global
+        lock for new keys to queue on.  Idle locks are swept only when the
+        table has grown by another ``_MAX_LOCKS`` entries since the last
+        sweep, keeping the scan amortized O(1) per new key.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            if len(self._locks) >= self._sweep_at:
+                self._sweep_idle_locks()
+            lock = self._locks.setdefault(key, asyncio.Lock())
+        return lock
+
+    def _sweep_idle_locks(self) -> None:
+        # Counters older than the previous window no longer affect any check
+        oldest_live = int(time.monotonic() // self.window_seconds) - 1
+        for k in [k for k, (wid, _, _) in self._counters.items() if wid < oldest_live]:
+            del self._counters[k]
+        for k in [k for k, lock in self._locks.items() if k not in self._counters and not lock.locked()]:
+            del self._locks[k]
+        self._sweep_at = len(self._locks) + self._MAX_LOCKS
 
     async def check(self, key: str, *, code: str, message: str) -> None:
-        now = time.monotonic()
-        cutoff = now - self.window_seconds
-        lock = await self._get_lock(key)
+        window_id, offset = divmod(time.monotonic(), self.window_seconds)
+        window_id = int(window_id)
+        lock = self._get_lock(key)
         async with lock:
-            events = self._events[key]
-            while events and events[0] <= cutoff:
-                events.popleft()
-            if not events:
-                self._events.pop(key, None)
-                self._locks.pop(key, None)
-            if len(events) >= self.max_requests:
+            prev_count = cur_count = 0
+            entry = self._counters.get(key)
+            if entry is not None:
+                last_window, last_prev, last_cur = entry
+                if last_window == window_id:
+                    prev_count, cur_count = last_prev, last_cur
+                elif last_window == window_id - 1:
+                    prev_count = last_cur
+
+            weight = 1 - offset / self.window_seconds
+            if prev_count * weight + cur_count >= self.max_requests:
+                self._counters[key] = (window_id, prev_count, cur_count)
                 raise api_error(
                     status_code=429,
                     code=code,
@@ -77,11 +105,97 @@ class FixedWindowRateLimiter:
                         "window_seconds": self.window_seconds,
                     },
                 )
-            self._events[key].append(now)
+            self._counters[key] = (window_id, prev_count, cur_count + 1)
+
+
+@lru_cache(maxsize=None)
+def _redis_client(url: str):
+    """Shared asyncio Redis client (the ``redis`` package is only needed if used)."""
+    import redis.asyncio as redis
+
+    return redis.from_url(url)
+
+
+# Sliding-window check and INCR in one atomic server-side step, same
+# approximation as SlidingWindowRateLimiter: KEYS[1] counts this window,
+# KEYS[2] the previous one, weighted by ARGV[2] (how much of it still overlaps).
+# Rejected requests are not counted.  The TTL covers two windows because a
+# counter is read as "previous" for the whole window after its own; EXPIRE is
+# set only on the first hit, so it is never pushed back.
+_REDIS_SLIDING_WINDOW = """
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+if previous * tonumber(ARGV[2]) + count >= tonumber(ARGV[3]) then
+    return 0
+end
+if redis.call('INCR', KEYS[1]) == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+class RedisSlidingWindowRateLimiter:
+    """Sliding-window rate limiter backed by atomic Redis counters.
+
+    Weights the previous window's count like the in-process limiter, so a
+    client cannot send twice the limit across a window boundary.  One EVALSHA
+    per check (a cached Lua script), shared by every worker.  If Redis is
+    unreachable the check falls back to an in-process limiter rather than
+    failing the request.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: int, *, redis_url: str):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._redis = _redis_client(redis_url)
+        self._hit = self._redis.register_script(_REDIS_SLIDING_WINDOW)
+        self._fallback = SlidingWindowRateLimiter(max_requests, window_seconds)
+
+    async def check(self, key: str, *, code: str, message: str) -> None:
+        window, offset = divmod(time.time(), self.window_seconds)
+        window = int(window)
+        weight = 1 - offset / self.window_seconds
+        try:
+            allowed = await self._hit(
+                keys=[f"rl:{code}:{key}:{window}", f"rl:{code}:{key}:{window - 1}"],
+                args=[2 * self.window_seconds, repr(weight), self.max_requests],
+            )
+        except Exception as exc:
+            logger.warning("Redis rate limiter unavailable, using in-process fallback: %s", exc)
+            await self._fallback.check(key, code=code, message=message)
+            return
+        if not allowed:
+            raise api_error(
+                status_code=429,
+                code=code,
+                message=message,
+                retryable=True,
+                details={
+                    "limit": self.max_requests,
+                    "window_seconds": self.window_seconds,
+                },
+            )
+
+
+def make_rate_limiter(
+    max_requests: int, window_seconds: int
+) -> SlidingWindowRateLimiter | RedisSlidingWindowRateLimiter:
+    """Build a Redis-backed limiter when REDIS_URL is set, else an in-memory one."""
+    redis_url = get_settings().redis_url
+    if redis_url:
+        try:
+            return RedisSlidingWindowRateLimiter(max_requests, window_seconds, redis_url=redis_url)
+        except ImportError:
+            logger.warning(
+                "REDIS_URL is set but the redis package is not installed; "
+                "using in-process rate limiting"
+            )
+    return SlidingWindowRateLimiter(max_requests, window_seconds)
 
 
 def rate_limit_dependency(
-    limiter: FixedWindowRateLimiter,
+    limiter: SlidingWindowRateLimiter | RedisSlidingWindowRateLimiter,
     *,
     key_fn: Callable[[str | None], str] | None = None,
     code: str,
@@ -2,19 +2,37 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from api.guardrails import api_error
+from api.responses import etag, etag_headers, if_none_match, not_modified
 from api.security import get_owned_case, require_session_id, required_session_header
 from db.connection import get_db, AsyncSessionLocal
 from models.database import Case, CaseStatus, Hearing, HearingMessage, HearingMessageRole
 from models.schemas import HearingResponse, HearingStart, HearingMessageCreate
-from personas.archetypes import get_archetype
 from prompts.system_prompts import generate_hearing_message
-from services.hearing_service import build_case_context, process_hearing_exchange
+from services.hearing_service import (
+    JudgeMessageNotSaved,
+    load_case_context,
+    load_transcript,
+    process_hearing_exchange,
+    process_hearing_exchange_detached,
+    stream_transcript,
+)
 
 router = APIRouter()
 
@@ -29,33 +47,25 @@ async def start_hearing(
     db: AsyncSession = Depends(get_db),
 ):
     """Start a hearing simulation for a case."""
-    case = await get_owned_case(
-        db,
-        case_id,
-        session_id,
-        options=(selectinload(Case.parties),),
-    )
-
-    archetype = get_archetype(body.archetype_id)
-
-    # Check if hearing already exists
-    existing = await db.execute(
-        select(Hearing).where(Hearing.case_id == case_id)
+    case = await get_owned_case(db, case_id, session_id)
+
+    # Create hearing; the UNIQUE (case_id) constraint is the duplicate check,
+    # so two concurrent starts cannot both pass a SELECT and then collide
+    hearing = await db.scalar(
+        pg_insert(Hearing)
+        .values(case_id=case_id, archetype_id=body.archetype_id)
+        .on_conflict_do_nothing(index_elements=[Hearing.case_id])
+        .returning(Hearing)
     )
-    if existing.scalar_one_or_none():
+    if hearing is None:
         raise api_error(
             status_code=409,
             code="hearing_exists",
             message="A hearing already exists for this case.",
         )
 
-    # Create hearing
-    hearing = Hearing(case_id=case_id, archetype_id=body.archetype_id)
-    db.add(hearing)
-    await db.flush()
-
     # Generate opening statement
-    case_context = build_case_context(case, case.parties)
+    case_context = await load_case_context(db, case_id)
     opening = await generate_hearing_message(
         archetype_id=body.archetype_id,
         case_context=case_context,
@@ -70,36 +80,68 @@ async def start_hearing(
         sequence=1,
     )
     db.add(msg)
-    await db.flush()
 
-    # Update case status
+    # Update case status; one flush writes it together with the message
     case.status = CaseStatus.hearing
     case.archetype_id = body.archetype_id
     await db.flush()
 
-    # Reload with messages
-    result = await db.execute(
-        select(Hearing)
-        .where(Hearing.id == hearing.id)
-        .options(selectinload(Hearing.messages))
-    )
-    hearing = result.scalar_one()
+    # The opening statement is the hearing's only message, so attach it as the
+    # loaded collection rather than reloading the hearing to fetch it
+    set_committed_value(hearing, "messages", [msg])
     return hearing
 
 
+def _hearing_etag(hearing_id, message_count, last_sequence, completed_at) -> str:
+    # Messages are append-only and completion is one-way, so these change
+    # exactly when the serialized hearing does
+    return etag(hearing_id, message_count, last_sequence, completed_at)
+
+
+# Built once: GET /hearing is polled, so skip per-request statement construction
+_HEARING_VALIDATOR = (
+    select(
+        Hearing.id,
+        func.count(HearingMessage.id),
+        func.max(HearingMessage.sequence),
+        Hearing.completed_at,
+    )
+    .outerjoin(HearingMessage, HearingMessage.hearing_id == Hearing.id)
+    .where(Hearing.case_id == bindparam("case_id"))
+    .group_by(Hearing.id)
+)
+_HEARING_WITH_MESSAGES = (
+    select(Hearing)
+    .where(Hearing.case_id == bindparam("case_id"))
+    .options(selectinload(Hearing.messages))
+)
+
+
 @router.get("/cases/{case_id}/hearing", response_model=HearingResponse)
 async def get_hearing(
     case_id: uuid.UUID,
+    request: Request,
+    response: Response,
     session_id: str = Depends(required_session_header),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get the hearing for a case."""
+    """Get the hearing for a case.
+
+    Supports ``If-None-Match``: a polling client whose copy is current gets
+    a 304 from one aggregate query, without the transcript being loaded.
+    """
     await get_owned_case(db, case_id, session_id)
-    result = await db.execute(
-        select(Hearing)
-        .where(Hearing.case_id == case_id)
-        .options(selectinload(Hearing.messages))
-    )
+
+    known_tags = if_none_match(request)
+    if known_tags:
+        result = await db.execute(_HEARING_VALIDATOR, {"case_id": case_id})
+        row = result.one_or_none()
+        if row is not None:
+            tag = _hearing_etag(*row)
+            if known_tags & {tag, "*"}:
+                return not_modified(tag)
+
+    result = await db.execute(_HEARING_WITH_MESSAGES, {"case_id": case_id})
     hearing = result.scalar_one_or_none()
     if not hearing:
         raise api_error(
@@ -107,6 +149,16 @@ async def get_hearing(
             code="hearing_not_found",
             message="No hearing found for this case.",
         )
+    response.headers.update(
+        etag_headers(
+            _hearing_etag(
+                hearing.id,
+                len(hearing.messages),
+                hearing.messages[-1].sequence if hearing.messages else None,
+                hearing.completed_at,
+            )
+        )
+    )
     return hearing
 
 
@@ -115,8 +167,10 @@ async def hearing_websocket(websocket: WebSocket, case_id: str):
     """
     WebSocket endpoint for real-time hearing simulation.
 
+    On connect the server sends: {"event": "replay", "messages": [{"role", "content", "sequence"}, ...]}
     Client sends: {"role": "plaintiff"|"defendant", "content": "response text"}
-    Server sends: {"role": "judge", "content": "judge's response", "sequence": N}
+    Server streams: {"role": "judge", "delta": "next chunk of text"} ...
+    then sends: {"role": "judge", "content": "judge's full response", "sequence": N}
     """
     try:
         case_uuid = uuid.UUID(case_id)
@@ -142,35 +196,36 @@ async def hearing_websocket(websocket: WebSocket, case_id: str):
     try:
         async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(Hearing)
+                select(Hearing.id, Hearing.archetype_id)
                 .join(Case, Hearing.case_id == Case.id)
                 .where(Hearing.case_id == case_uuid, Case.session_id == session_uuid)
-                .options(selectinload(Hearing.messages))
             )
-            hearing = result.scalar_one_or_none()
-            if not hearing:
+            row = result.one_or_none()
+            if row is None:
                 await websocket.send_json({"error": "No hearing found"})
                 await websocket.close()
                 return
 
-            hearing_id = hearing.id
-            archetype_id = hearing.archetype_id
-
-            case_result = await db.execute(
-                select(Case)
-                .where(Case.id == case_uuid)
-                .options(selectinload(Case.parties))
-            )
-            case = case_result.scalar_one()
-            case_context = build_case_context(case, case.parties)
-
-            existing_messages = [
-                {"role": msg.role.value, "content": msg.content, "sequence": msg.sequence}
-                for msg in sorted(hearing.messages, key=lambda m: m.sequence)
-            ]
-
-        for msg_data in existing_messages:
-            await websocket.send_json(msg_data)
+            hearing_id, archetype_id = row
+            case_context = await load_case_context(db, case_uuid)
+
+            # Replay the transcript one frame per cursor batch, so the first
+            # frame goes out before a long hearing has been read in full.
+            # Track the sequence here instead of asking for MAX(sequence)
+            # every turn; if another writer (a second tab, the HTTP fallback)
+            # gets ahead, the hearing service moves past it
+            history: list[dict] = []
+            last_sequence = 0
+            async for batch in stream_transcript(db, hearing_id):
+                replayed = [
+                    {"role": role.value, "content": content, "sequence": sequence}
+                    for role, content, sequence in batch
+                ]
+                await websocket.send_json({"event": "replay", "messages": replayed})
+                history.extend({"role": m["role"], "content": m["content"]} for m in replayed)
+                last_sequence = replayed[-1]["sequence"]
+            if not history:
+                await websocket.send_json({"event": "replay", "messages": []})
 
     except WebSocketDisconnect:
         return
@@ -181,7 +236,10 @@ async def hearing_websocket(websocket: WebSocket, case_id: str):
             pass
         return
 
-    # Message loop: acquire a fresh DB session per exchange
+    async def send_delta(text: str) -> None:
+        await websocket.send_json({"role": HearingMessageRole.judge.value, "delta": text})
+
+    # Message loop: DB sessions are opened only to write each message
     try:
         while True:
             data = await websocket.receive_json()
@@ -206,22 +264,43 @@ async def hearing_websocket(websocket: WebSocket, case_id: str):
                 await websocket.send_json({"error": f"Invalid role: {role_str}"})
                 continue
 
-            # Delegate to the shared hearing service
-            async with AsyncSessionLocal() as db:
-                try:
-                    exchange = await process_hearing_exchange(
-                        db,
-                        hearing_id=hearing_id,
-                        archetype_id=archetype_id,
-                        case_context=case_context,
-                        user_role=role_enum,
-                        user_content=content,
+            # Delegate to the shared hearing service; it opens a session only
+            # around each write, not for the LLM call in between, and streams
+            # the judge's reply to the client as it is generated
+            try:
+                exchange = await process_hearing_exchange_detached(
+                    AsyncSessionLocal,
+                    hearing_id=hearing_id,
+                    archetype_id=archetype_id,
+                    case_context=case_context,
+                    user_role=role_enum,
+                    user_content=content,
+                    last_sequence=last_sequence,
+                    history=history,
+                    on_delta=send_delta,
+                )
+            except (IntegrityError, JudgeMessageNotSaved) as exc:
+                # Lost the sequence race even after a retry: resync with the
+                # saved transcript and keep the connection open
+                async with AsyncSessionLocal() as db:
+                    transcript = await load_transcript(db, hearing_id)
+                history = [
+                    {"role": role.value, "content": content}
+                    for role, content, _ in transcript
+                ]
+                last_sequence = transcript[-1][2] if transcript else 0
+                if isinstance(exc, JudgeMessageNotSaved):
+                    error = (
+                        "Your message was saved, but the judge's reply could not be. "
+                        "Please send your next message to continue."
                     )
-                    await db.commit()
-                except Exception:
-                    await db.rollback()
-                    raise
+                else:
+                    error = "Your message could not be saved. Please send it again."
+                await websocket.send_json({"error": error})
+                continue
+            last_sequence = exchange.judge_sequence
 
+            # The full, saved reply closes the stream of deltas
             await websocket.send_json({
                 "role": HearingMessageRole.judge.value,
                 "content": exchange.judge_content,
@@ -251,14 +330,10 @@ async def post_hearing_message(
     HTTP fallback for hearing interaction (for clients that can't use WebSocket).
     Accepts a party message and returns the judge's response.
     """
-    await get_owned_case(db, case_id, session_id)
-
-    result = await db.execute(
-        select(Hearing)
-        .where(Hearing.case_id == case_id)
-        .options(selectinload(Hearing.messages))
+    case = await get_owned_case(
+        db, case_id, session_id, options=(joinedload(Case.hearing),)
     )
-    hearing = result.scalar_one_or_none()
+    hearing = case.hearing
     if not hearing:
         raise api_error(
             status_code=404,
@@ -272,15 +347,10 @@ async def post_hearing_message(
             message="This hearing has already concluded.",
         )
 
-    case_result = await db.execute(
-        select(Case)
-        .where(Case.id == case_id)
-        .options(selectinload(Case.parties))
-    )
-    case = case_result.scalar_one()
-    case_context = build_case_context(case, case.parties)
+    case_context = await load_case_context(db, case_id)
 
-    # Delegate to the shared hearing service
+    # Delegate to the shared hearing service, reusing the loaded transcript
+    transcript = await load_transcript(db, hearing.id)
     exchange = await process_hearing_exchange(
         db,
         hearing_id=hearing.id,
@@ -288,6 +358,8 @@ async def post_hearing_message(
         case_context=case_context,
         user_role=HearingMessageRole(body.role.value),
         user_content=body.content,
+        last_sequence=transcript[-1].sequence if transcript else 0,
+        history=[{"role": role.value, "content": content} for role, content, _ in transcript],
     )
 
     return {
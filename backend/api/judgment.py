@@ -3,11 +3,14 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func as sqlfunc, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import bindparam, func as sqlfunc, insert, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from api.guardrails import FixedWindowRateLimiter, api_error
+from api.guardrails import api_error, make_rate_limiter
+from api.responses import etag, etag_headers, if_none_match, not_modified
 from api.security import get_owned_case, required_session_header
 from config import get_settings
 from db.connection import get_db
@@ -22,20 +25,36 @@ from models.database import (
 from models.schemas import JudgmentRequest, JudgmentResponse
 from services.hearing_service import extract_party_names
 from services.judgment_helpers import (
+    cached_pipeline_result,
     derive_winner,
     extract_hearing_transcript,
     get_case_and_hearing_context,
+    llm_call_row,
+    pipeline_cache_key,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 settings = get_settings()
-judgment_limiter = FixedWindowRateLimiter(
+judgment_limiter = make_rate_limiter(
     max_requests=settings.judgment_requests_per_minute,
     window_seconds=60,
 )
 
 
+# Fixed-shape lookups, built once rather than per request
+_JUDGMENT_BY_CASE = select(Judgment).where(Judgment.case_id == bindparam("case_id"))
+_JUDGMENT_ID_BY_CASE = select(Judgment.id).where(Judgment.case_id == bindparam("case_id"))
+
+
+def _judgment_exists() -> HTTPException:
+    return api_error(
+        status_code=409,
+        code="judgment_exists",
+        message="Judgment already exists for this case.",
+    )
+
+
 @router.post("/cases/{case_id}/judgment", response_model=JudgmentResponse)
 async def generate_judgment(
     case_id: uuid.UUID,
@@ -62,59 +81,64 @@ async def generate_judgment(
             message="Both plaintiff and defendant narratives are required.",
         )
 
-    existing = await db.execute(
-        select(Judgment).where(Judgment.case_id == case_id)
-    )
+    # Cheap early exit before the pipeline runs; the insert below still
+    # guards the race between two concurrent requests
+    existing = await db.execute(_JUDGMENT_ID_BY_CASE, {"case_id": case_id})
     if existing.scalar_one_or_none():
-        raise api_error(
-            status_code=409,
-            code="judgment_exists",
-            message="Judgment already exists for this case.",
-        )
+        raise _judgment_exists()
 
     plaintiff_name, defendant_name = extract_party_names(case)
     hearing_transcript = extract_hearing_transcript(hearing)
 
-    pipeline_result = await run_pipeline(
-        db=db,
-        plaintiff_narrative=case.plaintiff_narrative,
-        defendant_narrative=case.defendant_narrative,
-        plaintiff_name=plaintiff_name,
-        defendant_name=defendant_name,
-        claimed_amount=float(case.claimed_amount) if case.claimed_amount is not None else None,
-        archetype_id=body.archetype_id,
-        hearing_transcript=hearing_transcript,
+    pipeline_inputs = {
+        "plaintiff_narrative": case.plaintiff_narrative,
+        "defendant_narrative": case.defendant_narrative,
+        "plaintiff_name": plaintiff_name,
+        "defendant_name": defendant_name,
+        "claimed_amount": float(case.claimed_amount) if case.claimed_amount is not None else None,
+        "archetype_id": body.archetype_id,
+        "hearing_transcript": hearing_transcript,
+    }
+    # A retry (or a judge already run in a comparison on these inputs) is
+    # served from the pipeline cache instead of repeating every LLM step
+    pipeline_result, computed = await cached_pipeline_result(
+        pipeline_cache_key(**pipeline_inputs),
+        lambda: run_pipeline(db=db, **pipeline_inputs),
     )
 
     judgment_data = pipeline_result["judgment"]
     in_favor_of = derive_winner(judgment_data.get("in_favor_of"))
 
-    judgment = Judgment(
-        case_id=case_id,
-        archetype_id=body.archetype_id,
-        findings_of_fact=judgment_data.get("findings_of_fact", []),
-        conclusions_of_law=judgment_data.get("conclusions_of_law", []),
-        judgment_text=judgment_data.get("judgment_text", ""),
-        rationale=judgment_data.get("rationale", ""),
-        awarded_amount=judgment_data.get("awarded_amount"),
-        in_favor_of=in_favor_of,
-        evidence_scores=pipeline_result.get("evidence_scores"),
-        reasoning_chain=pipeline_result.get("reasoning_chain"),
-        advisory=pipeline_result.get("advisory"),
-    )
-    db.add(judgment)
-
-    for call_meta in pipeline_result["pipeline_metadata"]["llm_calls"]:
-        llm_call = LLMCall(
+    judgment = await db.scalar(
+        pg_insert(Judgment)
+        .values(
             case_id=case_id,
-            pipeline_step=call_meta["pipeline_step"],
-            model=call_meta["model"],
-            input_tokens=call_meta["input_tokens"],
-            output_tokens=call_meta["output_tokens"],
-            cost_usd=call_meta["cost_usd"],
-            latency_ms=call_meta["latency_ms"],
+            archetype_id=body.archetype_id,
+            findings_of_fact=judgment_data.get("findings_of_fact", []),
+            conclusions_of_law=judgment_data.get("conclusions_of_law", []),
+            judgment_text=judgment_data.get("judgment_text", ""),
+            rationale=judgment_data.get("rationale", ""),
+            awarded_amount=judgment_data.get("awarded_amount"),
+            in_favor_of=in_favor_of,
+            evidence_scores=pipeline_result.get("evidence_scores"),
+            reasoning_chain=pipeline_result.get("reasoning_chain"),
+            advisory=pipeline_result.get("advisory"),
         )
-        db.add(llm_call)
+        .on_conflict_do_nothing(index_elements=[Judgment.case_id])
+        .returning(Judgment)
+    )
+    if judgment is None:
+        raise _judgment_exists()
+
+    # One executemany for the pipeline's calls.  A cached result (the key
+    # ignores case identity) is still attributed to this case, at zero cost,
+    # so its metadata exists without double-counting what was spent
+    llm_rows = [
+        llm_call_row(case_id, call_meta["pipeline_step"], call_meta, cache_hit=not computed)
+        for call_meta in pipeline_result["pipeline_metadata"]["llm_calls"]
+    ]
+    if llm_rows:
+        await db.execute(insert(LLMCall), llm_rows)
 
     case.status = CaseStatus.decided
     case.archetype_id = body.archetype_id
@@ -126,21 +150,33 @@ async def generate_judgment(
             pass
 
     await db.flush()
-    await db.refresh(judgment)
     return judgment
 
 
 @router.get("/cases/{case_id}/judgment", response_model=JudgmentResponse)
 async def get_judgment(
     case_id: uuid.UUID,
+    request: Request,
+    response: Response,
     session_id: str = Depends(required_session_header),
     db: AsyncSession = Depends(get_db),
 ):
-    """Retrieve the judgment for a case."""
+    """Retrieve the judgment for a case.
+
+    A judgment is never modified once written, so its id is its ETag; a
+    client that already holds it gets a 304 from an id-only lookup.
+    """
     await get_owned_case(db, case_id, session_id)
-    result = await db.execute(
-        select(Judgment).where(Judgment.case_id == case_id)
-    )
+
+    known_tags = if_none_match(request)
+    if known_tags:
+        judgment_id = await db.scalar(_JUDGMENT_ID_BY_CASE, {"case_id": case_id})
+        if judgment_id is not None:
+            tag = etag(judgment_id)
+            if known_tags & {tag, "*"}:
+                return not_modified(tag)
+
+    result = await db.execute(_JUDGMENT_BY_CASE, {"case_id": case_id})
     judgment = result.scalar_one_or_none()
     if not judgment:
         raise api_error(
@@ -148,9 +184,48 @@ async def get_judgment(
             code="judgment_not_found",
             message="No judgment found for this case.",
         )
+    response.headers.update(etag_headers(etag(judgment.id)))
     return judgment
 
 
+# Totals and the requested page in one statement: the one-row aggregate is
+# LEFT JOINed to the page, so it still comes back when the page is empty
+# (offset past the end). Built once; limit/offset are bound per request.
+_metadata_totals = (
+    select(
+        sqlfunc.coalesce(sqlfunc.sum(LLMCall.cost_usd), 0).label("cost"),
+        sqlfunc.coalesce(sqlfunc.sum(LLMCall.latency_ms), 0).label("latency"),
+        sqlfunc.coalesce(sqlfunc.sum(LLMCall.input_tokens), 0).label("input"),
+        sqlfunc.coalesce(sqlfunc.sum(LLMCall.output_tokens), 0).label("output"),
+        # count(*), not count(id): id isn't in the covering index
+        sqlfunc.count().label("count"),
+    )
+    .where(LLMCall.case_id == bindparam("case_id"))
+    .cte("totals")
+)
+_metadata_page = (
+    select(LLMCall)
+    .where(LLMCall.case_id == bindparam("case_id"))
+    .order_by(LLMCall.created_at)
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+    .cte("page")
+)
+_JUDGMENT_METADATA = (
+    select(
+        _metadata_totals.c.cost,
+        _metadata_totals.c.latency,
+        _metadata_totals.c.input,
+        _metadata_totals.c.output,
+        _metadata_totals.c.count,
+        aliased(LLMCall, _metadata_page),
+    )
+    .select_from(_metadata_totals)
+    .outerjoin(_metadata_page, true())
+    .order_by(_metadata_page.c.created_at)
+)
+
+
 @router.get("/cases/{case_id}/judgment/metadata")
 async def get_judgment_metadata(
     case_id: uuid.UUID,
@@ -166,16 +241,11 @@ async def get_judgment_metadata(
     """
     await get_owned_case(db, case_id, session_id)
 
-    totals_result = await db.execute(
-        select(
-            sqlfunc.coalesce(sqlfunc.sum(LLMCall.cost_usd), 0),
-            sqlfunc.coalesce(sqlfunc.sum(LLMCall.latency_ms), 0),
-            sqlfunc.coalesce(sqlfunc.sum(LLMCall.input_tokens), 0),
-            sqlfunc.coalesce(sqlfunc.sum(LLMCall.output_tokens), 0),
-            sqlfunc.count(LLMCall.id),
-        ).where(LLMCall.case_id == case_id)
+    result = await db.execute(
+        _JUDGMENT_METADATA, {"case_id": case_id, "limit": limit, "offset": offset}
     )
-    total_cost, total_latency, total_input, total_output, total_count = totals_result.one()
+    rows = result.all()
+    total_cost, total_latency, total_input, total_output, total_count, _ = rows[0]
 
     if total_count == 0:
         raise api_error(
@@ -184,14 +254,7 @@ async def get_judgment_metadata(
             message="No LLM call records found for this case.",
         )
 
-    calls_result = await db.execute(
-        select(LLMCall)
-        .where(LLMCall.case_id == case_id)
-        .order_by(LLMCall.created_at)
-        .limit(limit)
-        .offset(offset)
-    )
-    calls = calls_result.scalars().all()
+    calls = [row[-1] for row in rows if row[-1] is not None]
 
     return {
         "total_cost_usd": float(round(total_cost, 6)),
@@ -0,0 +1,110 @@
+"""Response helpers for endpoints that return large ORM result sets.
+
+- ``json_response``: validate and encode in a worker thread, so a big case
+  graph or list does not pause the event loop while it is serialized.
+- ``json_array_response``: the same, for a list query, but fetched from a
+  server-side cursor and encoded and sent one batch at a time.
+- ``ndjson_response``: for list endpoints called with ``?stream=true``, one
+  JSON object per line as rows come off a server-side cursor.
+- ``etag`` / ``not_modified``: conditional GETs for records that only change
+  in ways a few cheap fields reveal (append-only transcripts, immutable rows).
+"""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 100  # rows fetched from the cursor per round-trip
+
+
+def _encode(adapter: TypeAdapter, data: Any) -> bytes:
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True), by_alias=True)
+
+
+async def json_response(adapter: TypeAdapter, data: Any) -> Response:
+    """Serialize ``data`` (ORM objects) as ``adapter``'s type off the event loop.
+
+    Only safe for fully loaded objects: a lazy load from the worker thread
+    would fail.  Returns the same JSON FastAPI's ``response_model`` would.
+    """
+    content = await run_in_threadpool(_encode, adapter, data)
+    return Response(content=content, media_type="application/json")
+
+
+async def json_array_response(
+    db: AsyncSession, stmt: Select, adapter: TypeAdapter
+) -> StreamingResponse:
+    """Stream ``stmt``'s rows as one JSON array, ``adapter`` being ``list[Schema]``.
+
+    At most ``STREAM_BATCH_SIZE`` ORM objects are alive at once, and each
+    batch is encoded in a worker thread.  A database error mid-stream cuts
+    the array short, so keep this for queries that cannot fail halfway.
+    """
+    result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+
+    async def _chunks():
+        try:
+            yield b"["
+            separator = b""
+            async for rows in result.scalars().partitions():
+                # Strip each encoded batch's own brackets and splice it in
+                items = (await run_in_threadpool(_encode, adapter, rows))[1:-1]
+                if items:
+                    yield separator + items
+                    separator = b","
+            yield b"]"
+        finally:
+            await result.close()
+
+    return StreamingResponse(_chunks(), media_type="application/json")
+
+
+async def ndjson_response(
+    db: AsyncSession, stmt: Select, schema: type[BaseModel]
+) -> StreamingResponse:
+    """Run ``stmt`` on a server-side cursor and stream each row as ``schema``."""
+    result = await db.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+
+    async def _lines():
+        try:
+            async for row in result.scalars():
+                yield schema.model_validate(row).model_dump_json(by_alias=True) + "\n"
+        finally:
+            await result.close()
+
+    return StreamingResponse(_lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def etag(*parts: object) -> str:
+    """A strong ETag for a representation identified by ``parts``.
+
+    ``parts`` must change whenever the response body would (ids, counts,
+    last sequence numbers, completion timestamps).
+    """
+    digest = hashlib.sha256(":".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def if_none_match(request: Request) -> set[str]:
+    """The entity tags in ``If-None-Match``, with any weak ``W/`` prefix dropped."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return set()
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def not_modified(tag: str) -> Response:
+    """An empty 304 carrying ``tag`` and the caching policy of the full response."""
+    return Response(status_code=304, headers=etag_headers(tag))
+
+
+def etag_headers(tag: str) -> dict[str, str]:
+    # no-cache: clients may keep the body but must revalidate before reuse
+    return {"ETag": tag, "Cache-Control": "private, no-cache"}
@@ -1,60 +1,126 @@
 """Session and case ownership helpers for API routes."""
 
-import hmac
+import asyncio
+import hashlib
 import logging
 import time
 import uuid
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Annotated
 from typing import Any
 
 from fastapi import Cookie, Depends, Header, Request
 
 from api.guardrails import api_error
-from sqlalchemy import select, text
+from sqlalchemy import bindparam, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import get_settings
-from db.connection import get_db
+from db.connection import AsyncSessionLocal, get_db
 from models.database import Case, OperatorRole, Session
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
 SESSION_COOKIE_NAME = "session_id"
 SESSION_COOKIE_MAX_AGE = 30 * 24 * 3600  # 30 days (matches session_max_idle_days)
 
 # ─── Session activity tracking ────────────────────────────────────────────────
-# In-memory cache of recently-touched session IDs.  We only issue a DB UPDATE
-# once per _ACTIVITY_TOUCH_INTERVAL seconds per session, keeping the overhead
-# of activity tracking near zero on the hot path.
+# In-memory cache of recently-touched session IDs.  A session is queued for a
+# last_active write at most once per _ACTIVITY_TOUCH_INTERVAL seconds, and the
+# queue is written behind the request path by flush_session_activity, so
+# activity tracking costs no round trip on the hot path.
 _session_activity_cache: dict[uuid.UUID, float] = {}
 _ACTIVITY_TOUCH_INTERVAL = 3600  # 1 hour
 _ACTIVITY_CACHE_MAX_SIZE = 10_000
+_pending_activity: set[uuid.UUID] = set()
+ACTIVITY_FLUSH_INTERVAL = 30  # seconds between flush_session_activity runs
 
 
-async def _touch_session_activity(db: AsyncSession, session_uuid: uuid.UUID) -> None:
-    """Update sessions.last_active, throttled to at most once per hour."""
+def _touch_session_activity(session_uuid: uuid.UUID) -> None:
+    """Queue a sessions.last_active update, throttled to at most once per hour."""
     now = time.monotonic()
-    if now - _session_activity_cache.get(session_uuid, 0) < _ACTIVITY_TOUCH_INTERVAL:
+    # A missing entry means "touch now": monotonic() can be below the
+    # interval on a freshly booted host, so 0 is no safe default
+    last = _session_activity_cache.get(session_uuid)
+    if last is not None and now - last < _ACTIVITY_TOUCH_INTERVAL:
         return
 
-    try:
-        await db.execute(
-            text("UPDATE sessions SET last_active = now() WHERE id = :sid"),
-            {"sid": session_uuid},
-        )
-    except Exception:
-        logger.debug("Failed to touch session activity for %s", session_uuid)
-        return
+    _pending_activity.add(session_uuid)
 
+    # Re-insert so dict order stays oldest-touch-first
+    _session_activity_cache.pop(session_uuid, None)
     _session_activity_cache[session_uuid] = now
 
-    # Prevent unbounded cache growth: evict oldest entries when oversized
+    # Prevent unbounded cache growth: drop the oldest half (no sort needed)
     if len(_session_activity_cache) > _ACTIVITY_CACHE_MAX_SIZE:
-        sorted_entries = sorted(_session_activity_cache.items(), key=lambda kv: kv[1])
-        for key, _ in sorted_entries[: len(sorted_entries) // 2]:
+        for key in list(_session_activity_cache)[: len(_session_activity_cache) // 2]:
             _session_activity_cache.pop(key, None)
 
+
+async def flush_session_activity() -> int:
+    """Write queued last_active touches as one UPDATE. Returns the session count.
+
+    On failure the sessions are re-queued for the next flush.
+    """
+    if not _pending_activity:
+        return 0
+    # Swapped out without an await in between, so touches queued while the
+    # UPDATE runs land in the next batch
+    session_ids = list(_pending_activity)
+    _pending_activity.clear()
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                text("UPDATE sessions SET last_active = now() WHERE id = ANY(:ids)"),
+                {"ids": session_ids},
+            )
+            await db.commit()
+    except Exception:
+        _pending_activity.update(session_ids)
+        raise
+    return len(session_ids)
+
+
+# ─── Session role cache ───────────────────────────────────────────────────────
+# Roles change only on admin login, so /auth/me can answer from memory for a
+# short TTL instead of loading the session row on every call.  Misses are
+# coalesced per shard so a burst for one session issues a single SELECT.
+_session_role_cache: dict[uuid.UUID, tuple[OperatorRole, float]] = {}
+_ROLE_CACHE_TTL = 30  # seconds
+_ROLE_CACHE_MAX_SIZE = 10_000
+_role_cache_locks = tuple(asyncio.Lock() for _ in range(32))
+
+
+def _get_cached_role(session_uuid: uuid.UUID) -> OperatorRole | None:
+    entry = _session_role_cache.get(session_uuid)
+    if entry is None:
+        return None
+    role, expires_at = entry
+    if expires_at <= time.monotonic():
+        _session_role_cache.pop(session_uuid, None)
+        return None
+    return role
+
+
+def _cache_role(session_uuid: uuid.UUID, role: OperatorRole) -> None:
+    # Re-insert so dict order stays soonest-expiry-first (the TTL is fixed)
+    _session_role_cache.pop(session_uuid, None)
+    _session_role_cache[session_uuid] = (role, time.monotonic() + _ROLE_CACHE_TTL)
+
+    # Prevent unbounded cache growth: drop the oldest half (no sort needed)
+    if len(_session_role_cache) > _ROLE_CACHE_MAX_SIZE:
+        for key in list(_session_role_cache)[: len(_session_role_cache) // 2]:
+            _session_role_cache.pop(key, None)
+
+
+def invalidate_session_role(session_uuid: uuid.UUID) -> None:
+    """Drop a cached role so the next lookup reads it from the database."""
+    _session_role_cache.pop(session_uuid, None)
+
+
 SessionHeader = Annotated[str | None, Header(alias="X-Session-Id")]
 AdminKeyHeader = Annotated[str | None, Header(alias="X-Admin-Key")]
 
@@ -146,7 +212,6 @@ async def get_or_create_session(db: AsyncSession, session_id: str | None) -> Ses
 
 def set_session_cookie(response, session_id: str) -> None:
     """Set the session ID as an httpOnly, SameSite=Strict cookie."""
-    settings = get_settings()
     is_production = not settings.debug
     response.set_cookie(
         key=SESSION_COOKIE_NAME,
@@ -159,15 +224,22 @@ def set_session_cookie(response, session_id: str) -> None:
     )
 
 
+@lru_cache(maxsize=4)
+def _admin_key_digests(admin_keys: tuple[str, ...]) -> frozenset[bytes]:
+    return frozenset(hashlib.sha256(key.encode()).digest() for key in admin_keys)
+
+
 def is_admin_key_valid(admin_key: str | None) -> bool:
-    """Validate an admin bootstrap key from config (constant-time)."""
+    """Validate an admin bootstrap key from config.
+
+    One set lookup on SHA-256 digests, whatever the number of keys.  The
+    lookup only ever compares digests, which an attacker cannot steer toward
+    a stored one, so its timing reveals nothing about the configured keys.
+    """
     if not admin_key:
         return False
-    settings = get_settings()
-    return any(
-        hmac.compare_digest(admin_key, stored_key)
-        for stored_key in settings.admin_api_keys
-    )
+    digests = _admin_key_digests(tuple(settings.admin_api_keys))
+    return hashlib.sha256(admin_key.encode()).digest() in digests
 
 
 def apply_admin_claim(session: Session, admin_key: str | None) -> bool:
@@ -191,10 +263,31 @@ async def get_session_by_header(
             code="session_not_found",
             message="Session not found",
         )
-    await _touch_session_activity(db, session_uuid)
+    _touch_session_activity(session_uuid)
     return session
 
 
+async def get_session_role(db: AsyncSession, session_id: str | None) -> tuple[uuid.UUID, OperatorRole]:
+    """Resolve the role of an existing session, served from a short-lived cache."""
+    session_uuid = require_session_id(session_id)
+    role = _get_cached_role(session_uuid)
+    if role is None:
+        async with _role_cache_locks[hash(session_uuid) % len(_role_cache_locks)]:
+            role = _get_cached_role(session_uuid)
+            if role is None:
+                session = await db.get(Session, session_uuid)
+                if not session:
+                    raise api_error(
+                        status_code=404,
+                        code="session_not_found",
+                        message="Session not found",
+                    )
+                role = session.role
+                _cache_role(session_uuid, role)
+    _touch_session_activity(session_uuid)
+    return session_uuid, role
+
+
 async def require_admin_session(
     db: AsyncSession = Depends(get_db),
     session_id: str = Depends(required_session_header),
@@ -210,6 +303,12 @@ async def require_admin_session(
     return session
 
 
+# Built once: the ownership check runs on nearly every request
+_OWNED_CASE = select(Case).where(
+    Case.id == bindparam("case_id"), Case.session_id == bindparam("session_id")
+)
+
+
 async def get_owned_case(
     db: AsyncSession,
     case_id: uuid.UUID,
@@ -218,11 +317,9 @@ async def get_owned_case(
 ) -> Case:
     """Load a case only if it belongs to the current session."""
     session_uuid = require_session_id(session_id)
-    stmt = select(Case).where(Case.id == case_id, Case.session_id == session_uuid)
-    if options:
-        stmt = stmt.options(*options)
+    stmt = _OWNED_CASE.options(*options) if options else _OWNED_CASE
 
-    result = await db.execute(stmt)
+    result = await db.execute(stmt, {"case_id": case_id, "session_id": session_uuid})
     case = result.scalar_one_or_none()
     if not case:
         raise api_error(
@@ -231,7 +328,7 @@ async def get_owned_case(
             message="Case not found",
         )
 
-    # Lightweight activity tracking (at most 1 DB write per hour per session)
-    await _touch_session_activity(db, session_uuid)
+    # Lightweight activity tracking (queued; written behind the request)
+    _touch_session_activity(session_uuid)
 
     return case
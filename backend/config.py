@@ -11,6 +11,12 @@ class Settings(BaseSettings):
 
     # Database — no default credentials; must be set via DATABASE_URL env var or .env
     database_url: str = ""
+    db_pool_size: int = 25  # persistent connections per worker
+    db_max_overflow: int = 25  # extra connections under burst load
+    db_prepared_statement_cache_size: int = 256  # per connection (asyncpg only)
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode:
+    # server-side prepared statements don't survive a backend switch there
+    db_pgbouncer_transaction_mode: bool = False
 
     # LLM API Keys
     openai_api_key: str = ""
@@ -21,10 +27,27 @@ class Settings(BaseSettings):
     reasoning_model: str = "claude-sonnet-4-20250514"
     embedding_model: str = "text-embedding-3-small"
     embedding_dimensions: int = 1536
+    corpus_embed_concurrency: int = 8  # embedding batch requests in flight during ingestion
+
+    # Embedding storage: "fp32" (vector) or "fp16" (halfvec, pgvector >= 0.7 —
+    # half the storage and index I/O, negligible recall loss at 1536 dims)
+    vector_precision: str = "fp32"
+
+    # Vector index on corpus_chunks.embedding: "hnsw", "ivfflat" or "flat" (no
+    # index — exact scan, fine for small corpora)
+    vector_index_type: str = "hnsw"
+    hnsw_m: int = 16
+    hnsw_ef_construction: int = 64
+    ivfflat_lists: int = 0  # 0 = derive from row count at build time
+
+    # Vector index build (applied only while the migration builds the index)
+    index_build_maintenance_work_mem: str = "4GB"
+    index_build_parallel_workers: int = 8
 
     # File Storage
     upload_dir: str = "uploads"
     max_upload_size_mb: int = 10
+    decrypted_file_cache_mb: int = 256  # LRU of decrypted evidence for repeat downloads; 0 = off
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000"]
@@ -36,11 +59,24 @@ class Settings(BaseSettings):
     # Generate with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
     field_encryption_key: str = ""
 
+    # Optional separate URL for `alembic` CLI runs, e.g. postgresql+psycopg://...
+    # (psycopg 3 runs migrations in pipeline mode); defaults to DATABASE_URL
+    migration_database_url: str = ""
+
+    # Migrations at app startup: "skip" (run `alembic upgrade head` separately),
+    # "sync" (block startup until done) or "async" (run in the background)
+    migration_mode: str = "skip"
+    migration_lock_timeout_seconds: int = 300
+    # Fresh databases only: load alembic/baseline.sql, then upgrade from the
+    # revision it records instead of replaying every revision
+    fast_bootstrap: bool = False
+
     # Session cleanup
     session_max_idle_days: int = 30  # purge sessions inactive for this many days
     session_cleanup_interval_hours: int = 6  # how often the cleanup task runs
 
     # Rate Limiting
+    redis_url: str = ""  # e.g. redis://redis:6379/0 — shares limits across workers (needs `redis` package)
     max_cases_per_session: int = 20
     max_judgments_per_hour: int = 10
     judgment_requests_per_minute: int = 30
@@ -60,6 +96,6 @@ class Settings(BaseSettings):
     }
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
@@ -1,5 +1,5 @@
 """Embedding utilities for corpus management."""
 
-from engine.llm_client import generate_embedding
+from engine.llm_client import generate_embedding, generate_embeddings_batch
 
-__all__ = ["generate_embedding"]
+__all__ = ["generate_embedding", "generate_embeddings_batch"]
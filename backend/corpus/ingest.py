@@ -5,16 +5,24 @@ Loads, chunks, embeds, and stores Wyoming legal materials for RAG retrieval.
 Sources include statutes, court rules, bench guides, and self-help materials.
 """
 
+import asyncio
+import hashlib
 import json
+import logging
+import os
 import uuid
 from pathlib import Path
 
 from config import get_settings
-from engine.llm_client import generate_embedding
+from engine.llm_client import generate_embeddings_batch
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 SOURCES_DIR = Path(__file__).parent / "sources"
+# Vectors from earlier ingests, keyed by model + dimensions + embed text, so a
+# re-ingest of an unchanged corpus makes no embedding requests
+EMBEDDING_CACHE_PATH = SOURCES_DIR / "embedding_cache" / "embeddings.json"
 
 
 def _load_corpus_data() -> dict:
@@ -33,15 +41,65 @@ def get_all_corpus_chunks() -> list[dict]:
     return chunks
 
 
+def _embed_text(chunk: dict) -> str:
+    return f"{chunk['source_title']} {chunk.get('section_number', '')} {chunk.get('topic', '')}\n\n{chunk['content']}"
+
+
+def _embedding_cache_key(text: str) -> str:
+    payload = f"{settings.embedding_model}\0{settings.embedding_dimensions}\0{text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_embedding_cache() -> dict[str, list[float]]:
+    try:
+        with open(EMBEDDING_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable embedding cache %s: %s", EMBEDDING_CACHE_PATH, exc)
+        return {}
+
+
+def _save_embedding_cache(cache: dict[str, list[float]]) -> None:
+    # Write-then-rename so an interrupted save never leaves a truncated file
+    EMBEDDING_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = EMBEDDING_CACHE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(tmp_path, EMBEDDING_CACHE_PATH)
+
+
 async def embed_and_prepare_chunks() -> list[dict]:
     """Generate embeddings for all corpus chunks. Returns list ready for DB insert."""
     chunks = get_all_corpus_chunks()
-    prepared = []
+    texts = [_embed_text(chunk) for chunk in chunks]
+    keys = [_embedding_cache_key(text) for text in texts]
+    cache = await asyncio.to_thread(_load_embedding_cache)
 
-    for chunk in chunks:
-        embed_text = f"{chunk['source_title']} {chunk.get('section_number', '')} {chunk.get('topic', '')}\n\n{chunk['content']}"
-        embedding = await generate_embedding(embed_text)
+    # Only cache misses go to the API: one request per batch of chunks rather
+    # than per chunk, each retrying transient failures on its own (see
+    # llm_client._with_retries)
+    misses = [i for i, key in enumerate(keys) if key not in cache]
+    if misses:
+        fresh = await generate_embeddings_batch(
+            [texts[i] for i in misses],
+            concurrency=settings.corpus_embed_concurrency,
+        )
+        for i, embedding in zip(misses, fresh):
+            cache[keys[i]] = embedding
+
+    embeddings = [cache[key] for key in keys]
+    if misses or len(cache) != len(set(keys)):
+        # Keep only the current corpus's vectors; a failed save just means
+        # the next ingest re-embeds
+        try:
+            await asyncio.to_thread(_save_embedding_cache, dict(zip(keys, embeddings)))
+        except OSError as exc:
+            logger.warning("Could not write embedding cache %s: %s", EMBEDDING_CACHE_PATH, exc)
 
+    prepared = []
+    for chunk, embedding in zip(chunks, embeddings):
         prepared.append(
             {
                 "id": uuid.uuid4(),
@@ -5,6 +5,7 @@ from uuid import UUID
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import get_settings
 from engine.llm_client import generate_embedding
 
 
@@ -46,13 +47,15 @@ async def search_corpus(
     if filters:
         where_clause = "WHERE " + " AND ".join(filters)
 
+    # Cast the query vector to the column's type so the index opclass applies
+    vector_type = "halfvec" if get_settings().vector_precision == "fp16" else "vector"
     sql = text(f"""
         SELECT
             id, source_type, source_title, section_number, topic, content,
-            1 - (embedding <=> :embedding::vector) AS similarity
+            1 - (embedding <=> CAST(:embedding AS {vector_type})) AS similarity
         FROM corpus_chunks
         {where_clause}
-        ORDER BY embedding <=> :embedding::vector
+        ORDER BY embedding <=> CAST(:embedding AS {vector_type})
         LIMIT :limit
     """)
 
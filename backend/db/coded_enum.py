@@ -0,0 +1,39 @@
+"""SQLAlchemy column type storing a Python enum as a SMALLINT code.
+
+Application code keeps working with the (string) enum members; only the
+database sees the integer, which is cheaper to store, compare and decode
+than a Postgres ENUM.
+"""
+
+import enum
+
+from sqlalchemy import SmallInteger, TypeDecorator
+
+
+class SmallIntCodedEnum(TypeDecorator):
+    """Map enum members to fixed SMALLINT codes.
+
+    ``codes`` pins each member to its integer explicitly so that reordering
+    the enum class can never silently change what is stored.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum], codes: dict[enum.Enum, int]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._to_code = {member.value: code for member, code in codes.items()}
+        self._from_code = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        """Encode an enum member (or its value) as its integer code."""
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value).value]
+
+    def process_result_value(self, value, dialect):
+        """Decode an integer code back into the enum member."""
+        if value is None:
+            return None
+        return self._from_code[value]
@@ -1,17 +1,48 @@
+import logging
+import uuid
+from collections.abc import Sequence
+from contextvars import ContextVar
+
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# ID of the HTTP request being served; set by RequestIdMiddleware in main.py
+current_request_id: ContextVar[str | None] = ContextVar("current_request_id", default=None)
+
+# DEBUG only: open get_db sessions per request ID, to catch a request that
+# checks out more than one pooled connection
+_open_sessions_by_request: dict[str, int] = {}
+
+connect_args = {}
+if settings.database_url.startswith("postgresql+asyncpg"):
+    if settings.db_pgbouncer_transaction_mode:
+        # Each transaction may land on a different server backend: prepare
+        # nothing ahead, and give the statements asyncpg must still prepare
+        # unique names so they cannot collide with another client's
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+    else:
+        # Per-connection prepared statement cache; with LIFO checkout the same
+        # few connections serve most short requests, so their caches stay warm
+        # and the hot case/hearing SELECTs skip parse and plan
+        connect_args["prepared_statement_cache_size"] = settings.db_prepared_statement_cache_size
 
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
+    connect_args=connect_args,
     pool_pre_ping=True,
-    pool_size=10,          # persistent connections in the pool
-    max_overflow=20,       # additional connections under burst load
+    pool_size=settings.db_pool_size,          # persistent connections in the pool
+    max_overflow=settings.db_max_overflow,    # additional connections under burst load
     pool_timeout=30,       # seconds to wait for a connection before erroring
     pool_recycle=1800,     # recycle connections after 30 min to avoid stale handles
+    pool_use_lifo=True,    # reuse the most recent connection; idle extras age out
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -27,6 +58,9 @@ async def get_db():
     Commits on success, rolls back on error.  Use ``get_db_readonly`` for
     endpoints that only read data (avoids an unnecessary COMMIT round-trip).
     """
+    request_id = current_request_id.get() if settings.debug else None
+    if request_id is not None:
+        _track_request_session(request_id, +1)
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -36,6 +70,26 @@ async def get_db():
             raise
         finally:
             await session.close()
+            if request_id is not None:
+                _track_request_session(request_id, -1)
+
+
+def _track_request_session(request_id: str, delta: int) -> None:
+    """Warn when one request holds more than one get_db session at a time.
+
+    FastAPI caches ``Depends(get_db)`` per request, so routes and their
+    security dependencies share one session; a second one means something
+    bypassed the cache (e.g. ``use_cache=False`` or a direct call).
+    """
+    count = _open_sessions_by_request.get(request_id, 0) + delta
+    if count <= 0:
+        _open_sessions_by_request.pop(request_id, None)
+        return
+    _open_sessions_by_request[request_id] = count
+    if count > 1:
+        logger.warning(
+            "Request %s opened %d concurrent database sessions", request_id, count
+        )
 
 
 async def get_db_readonly():
@@ -52,6 +106,15 @@ async def get_db_readonly():
             await session.close()
 
 
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """FastAPI dependency for endpoints that need extra, independent sessions.
+
+    An ``AsyncSession`` cannot be used by concurrent tasks, so work fanned out
+    with ``asyncio.gather`` opens one session per task from this factory.
+    """
+    return AsyncSessionLocal
+
+
 def get_pool_status() -> dict:
     """Return current connection pool metrics for monitoring."""
     pool = engine.pool
@@ -62,3 +125,43 @@ def get_pool_status() -> dict:
         "overflow": pool.overflow(),
         "invalid": pool.status(),
     }
+
+
+async def copy_rows(db: AsyncSession, model, rows: Sequence[dict]) -> None:
+    """Insert ``rows`` (dicts sharing the same keys) into ``model``'s table.
+
+    On asyncpg the rows are streamed with one binary ``COPY ... FROM STDIN``
+    on the session's connection, inside its transaction and without the
+    ORM; other drivers get one ``executemany``.  COPY skips Python-side
+    column defaults, so those (e.g. ``uuid.uuid4`` ids) are filled in here.
+    Values must be in the driver's native types.
+    """
+    if not rows:
+        return
+    conn = await db.connection()
+    driver_connection = (await conn.get_raw_connection()).driver_connection
+    if not hasattr(driver_connection, "copy_records_to_table"):
+        await db.execute(insert(model), list(rows))
+        return
+
+    table = model.__table__
+    columns = list(rows[0])
+    defaults = [
+        column for column in table.columns
+        if column.name not in columns
+        and column.default is not None
+        and (column.default.is_scalar or column.default.is_callable)
+    ]
+    records = [
+        tuple(row[c] for c in columns) + tuple(
+            # SQLAlchemy wraps callable defaults to take an execution context
+            column.default.arg(None) if column.default.is_callable else column.default.arg
+            for column in defaults
+        )
+        for row in rows
+    ]
+    await driver_connection.copy_records_to_table(
+        table.name,
+        records=records,
+        columns=columns + [column.name for column in defaults],
+    )
@@ -0,0 +1,145 @@
+"""Run Alembic migrations from inside the application process.
+
+Used at startup when ``MIGRATION_MODE`` is ``sync`` or ``async``.  A Postgres
+advisory lock serialises concurrent workers so only one of them upgrades the
+schema; the others wait for it and then find nothing left to do.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+
+from config import get_settings
+from db.connection import engine
+
+logger = logging.getLogger(__name__)
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+_LOCK_KEY = "alembic_migrations"
+
+# Schema dump plus its alembic_version row, used by FAST_BOOTSTRAP on fresh installs
+BASELINE_SQL = _BACKEND_DIR / "alembic" / "baseline.sql"
+_BASELINE_REVISION_RE = re.compile(r"^INSERT INTO (?:public\.)?alembic_version\b", re.MULTILINE)
+
+# Shared with the /health endpoint.  state: pending | running | done | failed | skipped
+migration_status: dict[str, str | None] = {
+    "state": "pending",
+    "revision": None,
+    "error": None,
+}
+
+
+def _alembic_config(sync_connection) -> Config:
+    cfg = Config(str(_BACKEND_DIR / "alembic.ini"))
+    cfg.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    # env.py picks this up instead of opening its own connection
+    cfg.attributes["connection"] = sync_connection
+    return cfg
+
+
+def _upgrade_head(sync_connection) -> str | None:
+    """Upgrade to head on an existing connection and return the new revision."""
+    command.upgrade(_alembic_config(sync_connection), "head")
+    return MigrationContext.configure(sync_connection).get_current_revision()
+
+
+async def _load_baseline(conn) -> bool:
+    """Load alembic/baseline.sql into an empty database.
+
+    The dump carries its own ``alembic_version`` row, so a following upgrade
+    applies only the revisions added since it was taken.  Returns False (and
+    does nothing) if the database already has an Alembic version table, or
+    the baseline file is missing or records no revision.
+    """
+    if not BASELINE_SQL.exists():
+        logger.warning("FAST_BOOTSTRAP is set but %s is missing", BASELINE_SQL)
+        return False
+    script = BASELINE_SQL.read_text()
+    if not _BASELINE_REVISION_RE.search(script):
+        # Without it the upgrade would replay every revision over the loaded schema
+        logger.warning(
+            "FAST_BOOTSTRAP is set but %s has no alembic_version row", BASELINE_SQL
+        )
+        return False
+    is_fresh = (
+        await conn.execute(sa.text("SELECT to_regclass('alembic_version') IS NULL"))
+    ).scalar_one()
+    await conn.commit()
+    if not is_fresh:
+        return False
+
+    # Drop psql meta-commands (e.g. \restrict) that newer pg_dump versions emit
+    script = "\n".join(
+        line for line in script.splitlines() if not line.startswith("\\")
+    )
+    # The raw asyncpg connection runs the multi-statement dump in one exchange
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.execute(script)
+    # pg_dump scripts set session GUCs (notably an empty search_path) that
+    # would otherwise leak into the upgrade and back into the pool
+    await raw.driver_connection.execute("RESET ALL")
+    logger.info("Loaded schema baseline from %s", BASELINE_SQL)
+    return True
+
+
+async def _acquire_lock(conn, timeout_seconds: int) -> None:
+    lock_sql = sa.text("SELECT pg_try_advisory_lock(hashtext(:key))")
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        acquired = (await conn.execute(lock_sql, {"key": _LOCK_KEY})).scalar_one()
+        await conn.commit()
+        if acquired:
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"Timed out after {timeout_seconds}s waiting for the migration lock"
+            )
+        await asyncio.sleep(1)
+
+
+async def run_migrations_with_lock() -> None:
+    """Upgrade the schema to head while holding a cluster-wide advisory lock.
+
+    Records progress in ``migration_status`` and re-raises on failure.
+    """
+    settings = get_settings()
+    migration_status.update(state="running", error=None)
+    try:
+        async with engine.connect() as conn:
+            await _acquire_lock(conn, settings.migration_lock_timeout_seconds)
+            try:
+                if settings.fast_bootstrap:
+                    await _load_baseline(conn)
+                revision = await conn.run_sync(_upgrade_head)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+            finally:
+                await conn.execute(
+                    sa.text("SELECT pg_advisory_unlock(hashtext(:key))"),
+                    {"key": _LOCK_KEY},
+                )
+                await conn.commit()
+    except Exception as exc:
+        migration_status.update(state="failed", error=str(exc))
+        logger.exception("Database migration failed")
+        raise
+
+    migration_status.update(state="done", revision=revision)
+    logger.info("Database schema at revision %s", revision)
+
+
+async def run_migrations_in_background() -> None:
+    """Task wrapper for ``async`` mode — failures are surfaced via /health."""
+    try:
+        await run_migrations_with_lock()
+    except Exception:
+        pass
@@ -0,0 +1,195 @@
+"""Helpers shared by Alembic revision scripts.
+
+Lives outside ``alembic/`` because that directory name shadows the installed
+``alembic`` package and cannot be imported from revision files.
+"""
+
+import math
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+
+def _in_pipeline_mode(bind) -> bool:
+    """True when the underlying psycopg 3 connection is in pipeline mode."""
+    pgconn = getattr(bind.connection.driver_connection, "pgconn", None)
+    return bool(getattr(pgconn, "pipeline_status", 0))
+
+
+def _split_sql_script(sql: str) -> list[str]:
+    """Split a DDL script on statement-terminating semicolons.
+
+    Only for the plain DDL scripts in our revisions: no function bodies or
+    string literals containing ";" at end of line.
+    """
+    statements = []
+    for chunk in sql.split(";\n"):
+        lines = [line for line in chunk.splitlines() if not line.strip().startswith("--")]
+        statement = "\n".join(lines).strip().rstrip(";")
+        if statement:
+            statements.append(statement)
+    return statements
+
+
+def execute_sql_script(sql: str) -> None:
+    """Execute a multi-statement SQL script in a single round-trip.
+
+    asyncpg runs every statement issued through SQLAlchemy as a prepared
+    statement, and prepared statements cannot contain more than one command.
+    The raw driver connection's ``execute()`` uses the simple-query protocol
+    instead, so the whole script is parsed and run by Postgres in one
+    exchange.  Offline (``--sql``) mode just emits the script verbatim.
+    """
+    if context.is_offline_mode():
+        op.execute(sql)
+        return
+
+    bind = op.get_bind()
+    if _in_pipeline_mode(bind):
+        # Pipeline mode only allows single statements, but they are sent
+        # without waiting for each other, so the script still costs ~1 RTT
+        for statement in _split_sql_script(sql):
+            bind.exec_driver_sql(statement)
+        return
+
+    dbapi_connection = bind.connection.dbapi_connection
+    run_async = getattr(dbapi_connection, "run_async", None)
+    if run_async is not None:
+        run_async(lambda driver_connection: driver_connection.execute(sql))
+    else:
+        # Sync drivers (psycopg, psycopg2) accept multi-statement strings as-is
+        bind.exec_driver_sql(sql)
+
+
+def add_check_constraint_nonblocking(table: str, name: str, expression: str) -> None:
+    """Add a CHECK constraint without a long exclusive lock on ``table``.
+
+    The constraint is added NOT VALID inside the migration transaction (a
+    brief lock, no scan) and validated afterwards in autocommit mode, where
+    VALIDATE CONSTRAINT only takes a SHARE UPDATE EXCLUSIVE lock, so reads
+    and writes continue while existing rows are checked.
+    """
+    op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({expression}) NOT VALID")
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+VECTOR_INDEX_NAMES = {
+    "hnsw": "ix_corpus_chunks_embedding_hnsw",
+    "ivfflat": "ix_corpus_chunks_embedding_ivfflat",
+}
+
+
+def ivfflat_lists_for(row_count: int) -> int:
+    """pgvector's recommended IVFFlat list count for a table of ``row_count`` rows.
+
+    rows / 1000 up to one million rows, sqrt(rows) beyond that.
+    """
+    if row_count > 1_000_000:
+        return int(math.sqrt(row_count))
+    return max(1, row_count // 1000)
+
+
+def resolve_ivfflat_lists(configured: int) -> int:
+    """Use IVFFLAT_LISTS if set, else size from the current corpus_chunks row count."""
+    if configured > 0:
+        return configured
+    if context.is_offline_mode():
+        return 100
+    row_count = op.get_bind().execute(sa.text("SELECT count(*) FROM corpus_chunks")).scalar_one()
+    return ivfflat_lists_for(row_count)
+
+
+def corpus_vector_index_ddl(
+    index_type: str,
+    *,
+    hnsw_m: int = 16,
+    hnsw_ef_construction: int = 64,
+    ivfflat_lists: int = 100,
+    precision: str = "fp32",
+) -> str | None:
+    """Return the CREATE INDEX CONCURRENTLY statement for corpus_chunks.embedding.
+
+    Returns ``None`` for ``"flat"``, which means no ANN index: queries fall
+    back to an exact sequential scan.
+    """
+    opclass = "halfvec_cosine_ops" if precision == "fp16" else "vector_cosine_ops"
+    if index_type == "flat":
+        return None
+    if index_type == "hnsw":
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {VECTOR_INDEX_NAMES['hnsw']} "
+            f"ON corpus_chunks USING hnsw (embedding {opclass}) "
+            f"WITH (m = {int(hnsw_m)}, ef_construction = {int(hnsw_ef_construction)})"
+        )
+    if index_type == "ivfflat":
+        return (
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {VECTOR_INDEX_NAMES['ivfflat']} "
+            f"ON corpus_chunks USING ivfflat (embedding {opclass}) "
+            f"WITH (lists = {int(ivfflat_lists)})"
+        )
+    raise ValueError(f"Unknown vector_index_type: {index_type!r}")
+
+
+def build_index_with_tuning(ddl: str, *, maintenance_work_mem: str, parallel_workers: int) -> None:
+    """Run a CREATE INDEX CONCURRENTLY with build memory and parallelism raised.
+
+    Index construction is memory-bound; this gives the build room to keep the
+    graph in memory and lets pgvector parallelise it.  CONCURRENTLY cannot run
+    inside a transaction block, so the build steps outside Alembic's migration
+    transaction and the settings are session-level SETs.  They are RESET even
+    when the build fails: in MIGRATION_MODE=sync|async the connection goes
+    back to the app's pool afterwards.
+    """
+    workers = int(parallel_workers)
+    work_mem = maintenance_work_mem.replace("'", "''")
+    with op.get_context().autocommit_block():
+        op.execute(f"SET maintenance_work_mem = '{work_mem}'")
+        op.execute(f"SET max_parallel_maintenance_workers = {workers}")
+        op.execute(f"SET max_parallel_workers = {workers}")
+        try:
+            op.execute(ddl)
+        finally:
+            op.execute("RESET max_parallel_workers")
+            op.execute("RESET max_parallel_maintenance_workers")
+            op.execute("RESET maintenance_work_mem")
+
+
+def bulk_insert_rows(table: str, rows: Sequence[dict], *, page_size: int = 1000) -> None:
+    """Insert ``rows`` (dicts sharing the same keys) into ``table`` in bulk.
+
+    Use this from data-backfill revisions instead of per-row INSERTs.  On
+    asyncpg the rows are streamed with binary ``COPY ... FROM STDIN``; other
+    drivers get one multi-row ``executemany`` per ``page_size`` rows.  Values
+    must be in the driver's native types (e.g. embeddings as the pgvector
+    type registered on the connection when using COPY).
+    """
+    if not rows:
+        return
+    columns = list(rows[0])
+
+    if context.is_offline_mode():
+        op.bulk_insert(sa.table(table, *(sa.column(c) for c in columns)), list(rows))
+        return
+
+    bind = op.get_bind()
+    run_async = getattr(bind.connection.dbapi_connection, "run_async", None)
+    for start in range(0, len(rows), page_size):
+        page = rows[start:start + page_size]
+        if run_async is not None:
+            records = [tuple(row[c] for c in columns) for row in page]
+            # Bind this page's records explicitly rather than closing over the
+            # loop variable
+            run_async(
+                lambda driver_connection, records=records: (
+                    driver_connection.copy_records_to_table(
+                        table, records=records, columns=columns
+                    )
+                )
+            )
+        else:
+            bind.execute(
+                sa.table(table, *(sa.column(c) for c in columns)).insert(),
+                list(page),
+            )
@@ -170,12 +170,13 @@ def synthesize_comparison_insights(comparison_results: list[dict]) -> dict | Non
         consensus = "split"
         consensus_text = "Judges are evenly split. This case could go either way depending on presentation."
 
-    # Award range
+    # Award range (at least two results here, so one sort serves every stat)
+    ordered = sorted(amounts)
     award_range = {
-        "min": min(amounts),
-        "max": max(amounts),
-        "avg": round(sum(amounts) / len(amounts), 2) if amounts else 0,
-        "median": sorted(amounts)[len(amounts) // 2] if amounts else 0,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "avg": round(sum(ordered) / total, 2),
+        "median": ordered[total // 2],
     }
 
     # Identify the swing judges and risks
@@ -7,6 +7,8 @@ the system fails fast instead of burning retries on every request.
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
+from operator import attrgetter
 from typing import Any
 
 import anthropic
@@ -26,9 +28,25 @@ PRICING = {
 }
 
 
-def _calculate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+# Anthropic prompt caching bills cache writes and reads relative to the input price
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+
+def _calculate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_write_tokens: int = 0,
+    cache_read_tokens: int = 0,
+) -> float:
     pricing = PRICING.get(model, {"input": 5.0, "output": 15.0})
-    return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+    billed_input = (
+        input_tokens
+        + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+        + cache_read_tokens * CACHE_READ_MULTIPLIER
+    )
+    return (billed_input * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
 
 
 # ── Circuit Breaker ──────────────────────────────────────────────────────────
@@ -104,6 +122,8 @@ def _get_circuit(provider: str) -> CircuitBreaker:
 
 
 # ── Client singletons ────────────────────────────────────────────────────────
+# One client per provider for the process lifetime: each keeps an HTTP
+# keep-alive pool, so calls after the first skip the TCP and TLS handshakes.
 
 _openai_client: openai.AsyncOpenAI | None = None
 _anthropic_client: anthropic.AsyncAnthropic | None = None
@@ -123,6 +143,16 @@ def get_anthropic_client() -> anthropic.AsyncAnthropic:
     return _anthropic_client
 
 
+async def close_clients() -> None:
+    """Close the shared clients' connection pools (called on app shutdown)."""
+    global _openai_client, _anthropic_client
+    for client in (_openai_client, _anthropic_client):
+        if client is not None:
+            await client.close()
+    _openai_client = None
+    _anthropic_client = None
+
+
 # ── Retry + circuit-breaker wrapper ──────────────────────────────────────────
 
 def _is_retryable_exception(exc: Exception) -> bool:
@@ -211,12 +241,17 @@ async def call_openai(
 
 async def call_anthropic(
     messages: list[dict],
-    system: str = "",
+    system: str | list[dict] = "",
     model: str | None = None,
     temperature: float = 0.3,
     max_tokens: int = 4096,
 ) -> dict:
-    """Call Anthropic API and return response with metadata."""
+    """Call Anthropic API and return response with metadata.
+
+    ``system`` may be a list of text blocks; blocks marked with
+    ``cache_control`` are cached by the provider, so calls that share that
+    prefix are billed for it at the cache-read rate.
+    """
     client = get_anthropic_client()
     model = model or settings.reasoning_model
     start = time.monotonic()
@@ -234,19 +269,61 @@ async def call_anthropic(
     elapsed_ms = int((time.monotonic() - start) * 1000)
 
     content = response.content[0].text if response.content else ""
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
+    usage = response.usage
+    cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+    cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+    # usage.input_tokens excludes cached tokens; report the whole prompt
+    input_tokens = usage.input_tokens + cache_write_tokens + cache_read_tokens
+    output_tokens = usage.output_tokens
 
     return {
         "content": content,
         "model": model,
         "input_tokens": input_tokens,
         "output_tokens": output_tokens,
-        "cost_usd": _calculate_cost(model, input_tokens, output_tokens),
+        "cost_usd": _calculate_cost(
+            model, usage.input_tokens, output_tokens, cache_write_tokens, cache_read_tokens
+        ),
         "latency_ms": elapsed_ms,
     }
 
 
+async def stream_anthropic(
+    messages: list[dict],
+    system: str | list[dict] = "",
+    model: str | None = None,
+    temperature: float = 0.3,
+    max_tokens: int = 4096,
+) -> AsyncIterator[str]:
+    """Call Anthropic API and yield the response text as it is generated.
+
+    Not retried: once text has been yielded the call cannot be replayed
+    transparently.  The circuit breaker still applies, and the configured
+    timeout bounds each wait on the provider rather than the whole reply.
+    """
+    client = get_anthropic_client()
+    model = model or settings.reasoning_model
+    circuit = _get_circuit("anthropic")
+    circuit.check()
+
+    try:
+        async with client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=messages,
+            temperature=temperature,
+            timeout=settings.llm_call_timeout_seconds,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+    except Exception as exc:
+        if _is_retryable_exception(exc):
+            circuit.record_failure()
+        raise
+    circuit.record_success()
+
+
 async def generate_embedding(text: str) -> list[float]:
     """Generate an embedding vector for a text string."""
     client = get_openai_client()
@@ -259,3 +336,37 @@ async def generate_embedding(text: str) -> list[float]:
         provider="openai",
     )
     return response.data[0].embedding
+
+
+# Inputs per embeddings request; well under the API's 2048-input and
+# 300k-token per-request limits for corpus-sized chunks
+EMBEDDING_BATCH_SIZE = 256
+
+
+async def generate_embeddings_batch(
+    texts: list[str], batch_size: int = EMBEDDING_BATCH_SIZE, concurrency: int = 1
+) -> list[list[float]]:
+    """Embed many texts with one request per ``batch_size`` inputs.
+
+    Up to ``concurrency`` requests are in flight at once; vectors come back
+    in the order of ``texts``.
+    """
+    client = get_openai_client()
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _embed_batch(batch: list[str]) -> list[list[float]]:
+        async with sem:
+            response = await _with_retries(
+                lambda: client.embeddings.create(
+                    model=settings.embedding_model,
+                    input=batch,
+                    dimensions=settings.embedding_dimensions,
+                ),
+                provider="openai",
+            )
+        # Each item carries the index of its input
+        return [item.embedding for item in sorted(response.data, key=attrgetter("index"))]
+
+    batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+    results = await asyncio.gather(*(_embed_batch(batch) for batch in batches))
+    return [embedding for batch in results for embedding in batch]
@@ -22,37 +22,25 @@ from engine.rule_engine import get_applicable_rules
 from personas.archetypes import get_archetype
 
 
-async def run_pipeline(
+async def analyze_case(
     db: AsyncSession,
     plaintiff_narrative: str,
     defendant_narrative: str,
     plaintiff_name: str = "Plaintiff",
     defendant_name: str = "Defendant",
     claimed_amount: float | None = None,
-    archetype_id: str = "common_sense",
-    hearing_transcript: list[dict] | None = None,
 ) -> dict:
     """
-    Execute the full judicial reasoning pipeline.
+    Run pipeline steps 1-3, the ones that do not depend on the judge.
 
-    Steps 1-5 run sequentially (each depends on the previous).
-    Steps 6 (decision) and 7 (advisory) run concurrently.
-
-    Args:
-        db: Database session for RAG retrieval
-        plaintiff_narrative: Plaintiff's account of events
-        defendant_narrative: Defendant's account of events
-        plaintiff_name: Plaintiff's name
-        defendant_name: Defendant's name
-        claimed_amount: Dollar amount being claimed
-        archetype_id: Which judge archetype to use
-        hearing_transcript: Optional hearing messages
+    A multi-judge comparison runs these once and hands the result to each
+    judge's ``run_pipeline``, so every judge reasons over the same facts and
+    the reasoning prompts share a cacheable prefix.
 
     Returns:
-        Complete pipeline output with judgment and all intermediate results
+        dict with ``facts``, ``classification``, ``rules`` and ``llm_calls``
     """
-    archetype = get_archetype(archetype_id)
-    all_llm_calls: list[dict] = []
+    llm_calls: list[dict] = []
 
     # ── Step 1: Fact Extraction ────────────────────────────────────────────
     fact_result = await extract_facts(
@@ -62,12 +50,12 @@ async def run_pipeline(
         defendant_name=defendant_name,
         claimed_amount=claimed_amount,
     )
-    all_llm_calls.append(fact_result["llm_metadata"])
+    llm_calls.append(fact_result["llm_metadata"])
     facts = fact_result["facts"]
 
     # ── Step 2: Issue Classification (depends on facts) ─────────────────
     classification_result = await classify_issues(facts)
-    all_llm_calls.append(classification_result["llm_metadata"])
+    llm_calls.append(classification_result["llm_metadata"])
     classification = classification_result["classification"]
 
     # ── Step 3: Rule Retrieval ─────────────────────────────────────────────
@@ -82,6 +70,64 @@ async def run_pipeline(
         disputed_issues=disputed,
     )
 
+    return {
+        "facts": facts,
+        "classification": classification,
+        "rules": rules,
+        "llm_calls": llm_calls,
+    }
+
+
+async def run_pipeline(
+    db: AsyncSession,
+    plaintiff_narrative: str,
+    defendant_narrative: str,
+    plaintiff_name: str = "Plaintiff",
+    defendant_name: str = "Defendant",
+    claimed_amount: float | None = None,
+    archetype_id: str = "common_sense",
+    hearing_transcript: list[dict] | None = None,
+    case_analysis: dict | None = None,
+) -> dict:
+    """
+    Execute the full judicial reasoning pipeline.
+
+    Steps 1-5 run sequentially (each depends on the previous).
+    Steps 6 (decision) and 7 (advisory) run concurrently.
+
+    Args:
+        db: Database session for RAG retrieval
+        plaintiff_narrative: Plaintiff's account of events
+        defendant_narrative: Defendant's account of events
+        plaintiff_name: Plaintiff's name
+        defendant_name: Defendant's name
+        claimed_amount: Dollar amount being claimed
+        archetype_id: Which judge archetype to use
+        hearing_transcript: Optional hearing messages
+        case_analysis: Result of ``analyze_case`` to reuse for steps 1-3;
+            its LLM calls are then not repeated in ``pipeline_metadata``
+
+    Returns:
+        Complete pipeline output with judgment and all intermediate results
+    """
+    archetype = get_archetype(archetype_id)
+    all_llm_calls: list[dict] = []
+
+    # ── Steps 1-3: Facts, classification, rules (judge-independent) ───────
+    if case_analysis is None:
+        case_analysis = await analyze_case(
+            db=db,
+            plaintiff_narrative=plaintiff_narrative,
+            defendant_narrative=defendant_narrative,
+            plaintiff_name=plaintiff_name,
+            defendant_name=defendant_name,
+            claimed_amount=claimed_amount,
+        )
+        all_llm_calls.extend(case_analysis["llm_calls"])
+    facts = case_analysis["facts"]
+    classification = case_analysis["classification"]
+    rules = case_analysis["rules"]
+
     # ── Step 4: Evidence Scoring ───────────────────────────────────────────
     scoring_result = await score_evidence(
         extracted_facts=facts,
@@ -10,11 +10,8 @@ import json
 from engine.llm_client import call_anthropic
 
 REASONING_PROMPT = """\
-You are {judge_name}, a Wyoming small claims court judge.
-
-{judge_personality}
-
-You are deliberating on a case and must produce a structured reasoning chain.
+You are a Wyoming small claims court judge deliberating on a case. You must
+produce a structured reasoning chain.
 Follow the standard Wyoming small claims judicial reasoning framework:
 
 1. WHAT HAPPENED — Establish the factual narrative from both perspectives
@@ -31,38 +28,44 @@ Important Wyoming-specific considerations:
 - Maximum recovery is $6,000 exclusive of interest and costs
 
 Return valid JSON with this exact structure:
-{{
+{
   "factual_narrative": "what the judge finds actually happened, resolving disputed facts",
   "credibility_assessment": "assessment of each party's credibility",
-  "evidence_analysis": {{
+  "evidence_analysis": {
     "strongest_plaintiff_evidence": "description",
     "strongest_defendant_evidence": "description",
     "key_evidence_conflicts": "how conflicts were resolved"
-  }},
+  },
   "liability_analysis": [
-    {{
+    {
       "element": "the legal element",
       "finding": "proven | not_proven",
       "reasoning": "why the judge finds this element proven or not"
-    }}
+    }
   ],
-  "damages_analysis": {{
+  "damages_analysis": {
     "damages_proven": true/false,
     "amount_claimed": 0.00,
     "amount_justified": 0.00,
     "reasoning": "how the damage amount was determined"
-  }},
-  "counterclaim_analysis": {{
+  },
+  "counterclaim_analysis": {
     "counterclaim_exists": false,
     "counterclaim_merit": null,
     "counterclaim_amount": null
-  }},
-  "final_determination": {{
+  },
+  "final_determination": {
     "prevailing_party": "plaintiff | defendant",
     "reasoning_summary": "concise explanation of why this party prevails",
     "confidence": "high | moderate | low"
-  }}
-}}
+  }
+}
+"""
+
+JUDGE_PROMPT = """\
+You are {judge_name}, the judge deciding the case above.
+
+{judge_personality}
 """
 
 
@@ -88,13 +91,8 @@ async def generate_reasoning(
     Returns:
         dict with reasoning chain and LLM metadata
     """
-    # Build the system prompt with judge personality
-    system = REASONING_PROMPT.format(
-        judge_name=archetype.get("name", "The Court"),
-        judge_personality=archetype.get("personality_prompt", "You are fair and impartial."),
-    )
-
-    # Build the case context
+    # Build the case context.  Everything here is the same for every judge
+    # in a comparison run, so it goes ahead of the judge-specific parts.
     context_parts = [
         f"CASE TYPE: {classification.get('primary_type', 'unknown')}",
         f"CASE SUMMARY: {classification.get('summary', 'N/A')}",
@@ -127,14 +125,6 @@ async def generate_reasoning(
             f"{chunk['source_title']}\n  {chunk['content'][:500]}"
         )
 
-    context_parts.extend(
-        [
-            "",
-            "EVIDENCE SCORES:",
-            json.dumps(evidence_scores, indent=2),
-        ]
-    )
-
     if hearing_transcript:
         context_parts.extend(
             [
@@ -145,7 +135,25 @@ async def generate_reasoning(
         for msg in hearing_transcript:
             context_parts.append(f"  {msg['role'].upper()}: {msg['content']}")
 
-    context = "\n".join(context_parts)
+    # System blocks run from most to least shared; the cache breakpoint on
+    # the case block lets the other judges' calls reuse that whole prefix
+    system = [
+        {"type": "text", "text": REASONING_PROMPT},
+        {
+            "type": "text",
+            "text": "\n".join(context_parts),
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": JUDGE_PROMPT.format(
+                judge_name=archetype.get("name", "The Court"),
+                judge_personality=archetype.get("personality_prompt", "You are fair and impartial."),
+            ),
+        },
+    ]
+    # Evidence scores depend on the judge's evidence modifiers
+    context = "EVIDENCE SCORES:\n" + json.dumps(evidence_scores, indent=2)
 
     response = await call_anthropic(
         system=system,
@@ -25,9 +25,13 @@ asyncio.run(check())
   sleep 1
 done
 
-echo "==> Running database migrations..."
-alembic upgrade head
-echo "==> Migrations complete."
+if [ "${MIGRATION_MODE:-skip}" = "skip" ]; then
+  echo "==> Running database migrations..."
+  alembic upgrade head
+  echo "==> Migrations complete."
+else
+  echo "==> MIGRATION_MODE=$MIGRATION_MODE — the app applies migrations at startup."
+fi
 
 echo "==> Starting application server..."
 exec uvicorn main:app --host 0.0.0.0 --port 8000
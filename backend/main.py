@@ -19,9 +19,16 @@ from api.error_handlers import (
     unhandled_exception_handler,
     validation_exception_handler,
 )
+from api.security import ACTIVITY_FLUSH_INTERVAL, flush_session_activity
 from config import get_settings
-from db.connection import engine, AsyncSessionLocal, get_pool_status
+from db.connection import engine, AsyncSessionLocal, current_request_id, get_pool_status
+from db.migrate import (
+    migration_status,
+    run_migrations_in_background,
+    run_migrations_with_lock,
+)
 import db.events  # noqa: F401 — registers SQLAlchemy event listeners
+from engine.llm_client import close_clients as close_llm_clients
 from logging_config import setup_logging
 from models.database import Session as SessionModel
 
@@ -79,6 +86,16 @@ async def _session_cleanup_loop() -> None:
             logger.warning("Session cleanup failed: %s", exc)
 
 
+async def _session_activity_flush_loop() -> None:
+    """Background loop that writes queued session last_active touches."""
+    while True:
+        await asyncio.sleep(ACTIVITY_FLUSH_INTERVAL)
+        try:
+            await flush_session_activity()
+        except Exception as exc:
+            logger.warning("Session activity flush failed: %s", exc)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: verify database connection (tables managed by Alembic migrations)
@@ -92,24 +109,51 @@ async def lifespan(app: FastAPI):
         logger.warning(f"Could not connect to database: {e}")
         logger.warning("App starting without DB — configure DATABASE_URL in .env")
 
+    # Apply pending migrations if configured to do so at startup
+    migration_task = None
+    if not db_available or settings.migration_mode == "skip":
+        migration_status["state"] = "skipped"
+    elif settings.migration_mode == "sync":
+        await run_migrations_with_lock()
+    elif settings.migration_mode == "async":
+        migration_task = asyncio.create_task(run_migrations_in_background())
+    else:
+        logger.warning("Unknown MIGRATION_MODE %r — not running migrations.", settings.migration_mode)
+        migration_status["state"] = "skipped"
+
     # Ensure upload directory exists
     os.makedirs(settings.upload_dir, exist_ok=True)
 
-    # Start the background session-cleanup task
-    cleanup_task = None
+    # Start the background session-cleanup and activity-flush tasks
+    cleanup_task = activity_task = None
     if db_available:
         cleanup_task = asyncio.create_task(_session_cleanup_loop())
+        activity_task = asyncio.create_task(_session_activity_flush_loop())
 
     yield
 
     # Shutdown
-    if cleanup_task is not None:
-        cleanup_task.cancel()
+    for task in (cleanup_task, activity_task, migration_task):
+        if task is None:
+            continue
+        task.cancel()
         try:
-            await cleanup_task
+            await task
         except asyncio.CancelledError:
             pass
 
+    # Write whatever touches are still queued before the engine goes away
+    if activity_task is not None:
+        try:
+            await flush_session_activity()
+        except Exception as exc:
+            logger.warning("Session activity flush failed: %s", exc)
+
+    try:
+        await close_llm_clients()
+    except Exception:
+        pass
+
     try:
         await engine.dispose()
     except Exception:
@@ -132,7 +176,11 @@ class RequestIdMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next) -> Response:
         request_id = request.headers.get("X-Request-Id") or str(uuid.uuid4())
         request.state.request_id = request_id
-        response = await call_next(request)
+        token = current_request_id.set(request_id)
+        try:
+            response = await call_next(request)
+        finally:
+            current_request_id.reset(token)
         response.headers["X-Request-Id"] = request_id
         return response
 
@@ -184,7 +232,7 @@ async def health_check(detail: bool = False):
     except Exception:
         pass
 
-    status = "healthy" if db_ok else "degraded"
+    status = "healthy" if db_ok and migration_status["state"] != "failed" else "degraded"
     response: dict[str, object] = {
         "status": status,
         "service": settings.app_name,
@@ -195,6 +243,7 @@ async def health_check(detail: bool = False):
         response["version"] = "0.1.0"
         response["checks"] = {
             "database": "ok" if db_ok else "unreachable",
+            "migrations": dict(migration_status),
         }
         try:
             response["pool"] = get_pool_status()
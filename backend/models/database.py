@@ -3,7 +3,7 @@
 import enum
 import uuid
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, Vector
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
@@ -19,11 +19,14 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 
+from config import get_settings
+from db.coded_enum import SmallIntCodedEnum
 from db.encrypted_type import EncryptedString
 
 
@@ -70,6 +73,9 @@ class OperatorRole(str, enum.Enum):
     admin = "admin"
 
 
+OPERATOR_ROLE_CODES = {OperatorRole.viewer: 0, OperatorRole.admin: 1}
+
+
 class HearingMessageRole(str, enum.Enum):
     judge = "judge"
     plaintiff = "plaintiff"
@@ -84,15 +90,21 @@ class Session(Base):
 
     __tablename__ = "sessions"
     __table_args__ = (
+        # Deliberately a full index: the only range query is the stale-session
+        # purge (last_active < cutoff), which a "recent sessions" partial index
+        # could not serve, and Postgres rejects now() in index predicates anyway.
         Index("ix_sessions_last_active", "last_active"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Stored as a SMALLINT code (see OPERATOR_ROLE_CODES); the API still sees
+    # the string enum.
     role = Column(
-        Enum(OperatorRole),
+        "role_code",
+        SmallIntCodedEnum(OperatorRole, OPERATOR_ROLE_CODES),
         nullable=False,
         default=OperatorRole.viewer,
-        server_default=OperatorRole.viewer.value,
+        server_default=str(OPERATOR_ROLE_CODES[OperatorRole.viewer]),
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     last_active = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -105,8 +117,8 @@ class Case(Base):
 
     __tablename__ = "cases"
     __table_args__ = (
-        Index("ix_cases_session_id", "session_id"),
         Index("ix_cases_status", "status"),
+        # Also serves session_id-only lookups via its leading column
         Index("ix_cases_session_status", "session_id", "status"),
         CheckConstraint("claimed_amount >= 0 AND claimed_amount <= 6000", name="ck_cases_claimed_amount_range"),
     )
@@ -126,6 +138,19 @@ class Case(Base):
 
     session = relationship("Session", back_populates="cases")
     parties = relationship("Party", back_populates="case", cascade="all, delete-orphan")
+    # Read-only single-party views; uq_parties_case_role makes each one-to-one
+    plaintiff = relationship(
+        "Party",
+        primaryjoin="and_(Case.id == Party.case_id, Party.role == 'plaintiff')",
+        uselist=False,
+        viewonly=True,
+    )
+    defendant = relationship(
+        "Party",
+        primaryjoin="and_(Case.id == Party.case_id, Party.role == 'defendant')",
+        uselist=False,
+        viewonly=True,
+    )
     evidence = relationship("Evidence", back_populates="case", cascade="all, delete-orphan")
     timeline_events = relationship("TimelineEvent", back_populates="case", cascade="all, delete-orphan")
     hearing = relationship("Hearing", back_populates="case", uselist=False, cascade="all, delete-orphan")
@@ -230,7 +255,8 @@ class HearingMessage(Base):
 
     __tablename__ = "hearing_messages"
     __table_args__ = (
-        Index("ix_hearing_messages_hearing_id", "hearing_id"),
+        # Its (hearing_id, sequence) index also serves hearing_id lookups,
+        # MAX(sequence) and transcript reads in sequence order
         UniqueConstraint("hearing_id", "sequence", name="uq_hearing_messages_hearing_seq"),
     )
 
@@ -295,6 +321,8 @@ class ComparisonRun(Base):
     case_id = Column(UUID(as_uuid=True), ForeignKey("cases.id", ondelete="CASCADE"), nullable=False)
     run_key = Column(String(128), nullable=False)
     archetype_ids = Column(JSONB, nullable=False)
+    # synthesize_comparison_insights output, stored so reuse skips recomputing it
+    comparison_insights = Column(JSONB, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     case = relationship("Case", back_populates="comparison_runs")
@@ -325,6 +353,10 @@ class ComparisonResult(JudgmentColumnsMixin, Base):
     run = relationship("ComparisonRun", back_populates="results")
 
 
+# FP16 (halfvec) or FP32 (vector) embedding storage — see VECTOR_PRECISION
+_EMBEDDING_FP16 = get_settings().vector_precision == "fp16"
+
+
 class CorpusChunk(Base):
     """A chunk of the Wyoming legal corpus with vector embedding for RAG."""
 
@@ -333,14 +365,16 @@ class CorpusChunk(Base):
         Index("ix_corpus_chunks_source_type", "source_type"),
         Index("ix_corpus_chunks_topic", "topic"),
         # HNSW index for fast approximate nearest-neighbor search on embeddings.
-        # vector_cosine_ops matches the <=> (cosine distance) operator used in queries.
+        # The cosine opclass matches the <=> (cosine distance) operator used in queries.
         # m=16 and ef_construction=64 are good defaults for moderate corpus sizes.
         Index(
             "ix_corpus_chunks_embedding_hnsw",
             "embedding",
             postgresql_using="hnsw",
             postgresql_with={"m": 16, "ef_construction": 64},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_ops={
+                "embedding": "halfvec_cosine_ops" if _EMBEDDING_FP16 else "vector_cosine_ops"
+            },
         ),
     )
 
@@ -350,7 +384,7 @@ class CorpusChunk(Base):
     section_number = Column(String(50), nullable=True)
     topic = Column(String(100), nullable=True)
     content = Column(Text, nullable=False)
-    embedding = Column(Vector(1536))  # text-embedding-3-small dimensions
+    embedding = Column(HALFVEC(1536) if _EMBEDDING_FP16 else Vector(1536))  # text-embedding-3-small dimensions
     metadata_ = Column("metadata", JSONB, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
@@ -360,9 +394,20 @@ class LLMCall(Base):
 
     __tablename__ = "llm_calls"
     __table_args__ = (
-        Index("ix_llm_calls_case_id", "case_id"),
-        Index("ix_llm_calls_created_at", "created_at"),
-        Index("ix_llm_calls_pipeline_step", "pipeline_step"),
+        # Covering index for per-case totals and the call list in time order
+        Index(
+            "ix_llm_calls_case_time",
+            "case_id",
+            "created_at",
+            postgresql_include=["cost_usd", "latency_ms", "input_tokens", "output_tokens"],
+        ),
+        # Covering index for per-step cost/latency reporting (index-only scans)
+        Index(
+            "ix_llm_calls_step_time",
+            "pipeline_step",
+            text("created_at DESC"),
+            postgresql_include=["cost_usd", "latency_ms", "input_tokens", "output_tokens"],
+        ),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
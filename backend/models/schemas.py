@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from models.database import (
     CaseStatus,
@@ -240,6 +240,13 @@ class JudgmentResponse(BaseModel):
 class ComparisonRunRequest(BaseModel):
     archetype_ids: list[str] = Field(..., min_length=1, max_length=8)
     force_refresh: bool = False
+    force_refresh_insights: bool = False
+
+    @field_validator("archetype_ids")
+    @classmethod
+    def _normalize_archetype_ids(cls, value: list[str]) -> list[str]:
+        """Strip whitespace and drop blanks and duplicates (sorted for a stable order)."""
+        return sorted({archetype_id.strip() for archetype_id in value} - {""})
 
 
 class ComparisonResultResponse(BaseModel):
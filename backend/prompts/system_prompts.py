@@ -1,21 +1,18 @@
 """System prompts and hearing conversation logic."""
 
 import json
-from engine.llm_client import call_anthropic
-from personas.archetypes import get_archetype
+from collections.abc import AsyncIterator
 
+from engine.llm_client import call_anthropic, stream_anthropic
+from personas.archetypes import ARCHETYPES, get_archetype
 
+
+# The judge's persona and rules: fixed per archetype, rendered once below
 HEARING_SYSTEM_PROMPT = """\
 You are {judge_name}, presiding over a Wyoming small claims hearing.
 
 {judge_personality}
 
-CASE CONTEXT:
-- Case Type: {case_type}
-- Plaintiff: {plaintiff_name} — {plaintiff_narrative_summary}
-- Defendant: {defendant_name} — {defendant_narrative_summary}
-- Amount Claimed: ${claimed_amount:,.2f}
-
 Your role is to conduct an informal but structured hearing. You should:
 1. Ask focused questions to clarify disputed facts
 2. Request specific evidence when claims need support
@@ -35,45 +32,67 @@ Respond with ONLY the judge's next statement or question. Do not include any
 meta-commentary or out-of-character text.
 """
 
+HEARING_CASE_PROMPT = """\
+CASE CONTEXT:
+- Case Type: {case_type}
+- Plaintiff: {plaintiff_name} — {plaintiff_narrative_summary}
+- Defendant: {defendant_name} — {defendant_narrative_summary}
+- Amount Claimed: ${claimed_amount:,.2f}
+"""
 
-async def generate_hearing_message(
+
+def _render_hearing_persona(archetype: dict) -> tuple[str, str]:
+    """The (system prompt prefix, scripted opening line) for one archetype."""
+    hearing_style = archetype.get("hearing_style", {})
+    prefix = HEARING_SYSTEM_PROMPT.format(
+        judge_name=archetype["name"],
+        judge_personality=archetype["personality_prompt"],
+        tone=hearing_style.get("tone", "fair and measured"),
+        question_focus=", ".join(hearing_style.get("question_focus", ["relevant facts"])),
+    )
+    opening = hearing_style.get("opening", "Good morning. Plaintiff, please present your case.")
+    return prefix, opening
+
+
+# Archetypes are static config, so every persona prefix is rendered at import;
+# each is byte-identical across cases, which keeps provider prompt caching
+# effective for everything up to the case block
+_HEARING_PERSONAS: dict[str, tuple[str, str]] = {
+    archetype_id: _render_hearing_persona(archetype)
+    for archetype_id, archetype in ARCHETYPES.items()
+}
+
+
+def _hearing_request(
     archetype_id: str,
     case_context: dict,
     conversation_history: list[dict],
-) -> dict:
-    """
-    Generate the judge's next hearing message.
+) -> tuple[list[dict], list[dict] | None, str]:
+    """Build the (system prompt, API messages, opening line) for a hearing turn.
 
-    Args:
-        archetype_id: Which judge personality to use
-        case_context: Case details for context
-        conversation_history: Previous messages in the hearing
-
-    Returns:
-        dict with judge's message and LLM metadata
+    ``messages`` is None for the first turn, which uses the scripted opening
+    instead of an LLM call.
     """
-    archetype = get_archetype(archetype_id)
-    hearing_style = archetype.get("hearing_style", {})
+    prefix, opening = _HEARING_PERSONAS[get_archetype(archetype_id)["id"]]
 
-    system = HEARING_SYSTEM_PROMPT.format(
-        judge_name=archetype["name"],
-        judge_personality=archetype["personality_prompt"],
+    case_block = HEARING_CASE_PROMPT.format(
         case_type=case_context.get("case_type", "unknown"),
         plaintiff_name=case_context.get("plaintiff_name", "Plaintiff"),
         plaintiff_narrative_summary=case_context.get("plaintiff_narrative", "")[:300],
         defendant_name=case_context.get("defendant_name", "Defendant"),
         defendant_narrative_summary=case_context.get("defendant_narrative", "")[:300],
         claimed_amount=case_context.get("claimed_amount", 0),
-        tone=hearing_style.get("tone", "fair and measured"),
-        question_focus=", ".join(hearing_style.get("question_focus", ["relevant facts"])),
     )
+    # The case block is last and marked cacheable: the whole system prompt is
+    # the same on every turn of a hearing
+    system = [
+        {"type": "text", "text": prefix},
+        {"type": "text", "text": case_block, "cache_control": {"type": "ephemeral"}},
+    ]
 
     # If this is the first message, use the opening
     if not conversation_history:
-        return {
-            "content": hearing_style.get("opening", "Good morning. Plaintiff, please present your case."),
-            "llm_metadata": None,
-        }
+        return system, None, opening
 
     # Build conversation messages for the API
     messages = []
@@ -83,6 +102,31 @@ async def generate_hearing_message(
         if msg["role"] in ("plaintiff", "defendant"):
             prefix = f"[{msg['role'].upper()}]: "
         messages.append({"role": role, "content": f"{prefix}{msg['content']}"})
+    return system, messages, opening
+
+
+async def generate_hearing_message(
+    archetype_id: str,
+    case_context: dict,
+    conversation_history: list[dict],
+) -> dict:
+    """
+    Generate the judge's next hearing message.
+
+    Args:
+        archetype_id: Which judge personality to use
+        case_context: Case details for context
+        conversation_history: Previous messages in the hearing
+
+    Returns:
+        dict with judge's message and LLM metadata
+    """
+    system, messages, opening = _hearing_request(archetype_id, case_context, conversation_history)
+    if messages is None:
+        return {
+            "content": opening,
+            "llm_metadata": None,
+        }
 
     response = await call_anthropic(
         system=system,
@@ -102,3 +146,23 @@ async def generate_hearing_message(
             "pipeline_step": "hearing_simulation",
         },
     }
+
+
+async def generate_hearing_message_stream(
+    archetype_id: str,
+    case_context: dict,
+    conversation_history: list[dict],
+) -> AsyncIterator[str]:
+    """Like ``generate_hearing_message``, but yield the judge's text as it arrives."""
+    system, messages, opening = _hearing_request(archetype_id, case_context, conversation_history)
+    if messages is None:
+        yield opening
+        return
+
+    async for text in stream_anthropic(
+        system=system,
+        messages=messages,
+        temperature=0.4,
+        max_tokens=500,
+    ):
+        yield text
@@ -6,15 +6,23 @@ API layer only deals with request/response concerns.
 
 from __future__ import annotations
 
+import asyncio
 import os
+import queue
 import re
+import shutil
+import threading
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from pathlib import Path
 
 from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
 
 from config import get_settings
-from crypto import decrypt_file_bytes, encrypt_file_bytes
+from crypto import decrypt_file_bytes, encrypt_file_bytes, is_encryption_enabled
 
 settings = get_settings()
 
@@ -25,9 +33,71 @@ ALLOWED_EXTENSIONS = frozenset({
 })
 
 
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class _BufferPool:
+    """Process-wide pool of reusable read buffers for upload streaming."""
+
+    def __init__(self, buffer_size: int, max_idle: int = 32):
+        self.buffer_size = buffer_size
+        self._max_idle = max_idle
+        self._idle: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+
+    @contextmanager
+    def acquire(self) -> Iterator[bytearray]:
+        try:
+            buf = self._idle.get_nowait()
+        except queue.Empty:
+            buf = bytearray(self.buffer_size)
+        try:
+            yield buf
+        finally:
+            if self._idle.qsize() < self._max_idle:
+                self._idle.put(buf)
+
+
+_upload_buffers = _BufferPool(UPLOAD_CHUNK_SIZE)
+
+
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _encrypt_and_write(path: str, plaintext: bytes) -> None:
+    _write_file(path, encrypt_file_bytes(plaintext))
+
+
+def _discard(path: str) -> None:
+    with suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _copy_spooled_upload(src, dest_path: str) -> int:
+    """Copy an unencrypted upload straight from Starlette's spool file.
+
+    Uses ``os.sendfile`` (kernel-side copy, no userland buffers) once the
+    spool has rolled over to a real file; small in-memory spools are copied
+    with ``shutil.copyfileobj``.  Returns the number of bytes written.
+    """
+    src.seek(0)
+    with open(dest_path, "wb") as dst:
+        if getattr(src, "_rolled", False) and hasattr(os, "sendfile"):
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            offset = 0
+            while sent := os.sendfile(dst_fd, src_fd, offset, UPLOAD_CHUNK_SIZE * 4):
+                offset += sent
+            return offset
+        shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+        return dst.tell()
+
+
 def _sanitize_filename(raw_name: str) -> str:
     """Strip dangerous characters and validate the result."""
-    sanitized = re.sub(r"[^A-Za-z0-9._-]", "_", raw_name).strip("._")
+    sanitized = _UNSAFE_FILENAME_CHARS.sub("_", raw_name).strip("._")
     if not sanitized:
         raise HTTPException(status_code=400, detail="Invalid filename")
     return sanitized
@@ -50,37 +120,60 @@ async def save_upload(file: UploadFile, case_id: uuid.UUID) -> str:
     _validate_extension(sanitized)
 
     upload_dir = os.path.join(settings.upload_dir, str(case_id))
-    os.makedirs(upload_dir, exist_ok=True)
+    # Every filesystem call goes through a worker thread: on slow or network
+    # storage even a mkdir would otherwise stall the event loop
+    await asyncio.to_thread(os.makedirs, upload_dir, exist_ok=True)
     file_path = os.path.join(upload_dir, f"{uuid.uuid4()}_{sanitized}")
 
-    total_size = 0
-    raw_chunks: list[bytes] = []
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"File too large. Max size is {settings.max_upload_size_mb}MB",
+    )
+    # Starlette records the spooled size; reject before touching the bytes
+    if file.size is not None and file.size > MAX_UPLOAD_SIZE_BYTES:
+        raise too_large
+
+    if not is_encryption_enabled():
+        # Nothing to transform: copy the spool file without Python-level reads
+        written = await asyncio.to_thread(_copy_spooled_upload, file.file, file_path)
+        if written > MAX_UPLOAD_SIZE_BYTES:
+            await asyncio.to_thread(_discard, file_path)
+            raise too_large
+        return file_path
+
+    # Encryption needs the plaintext in memory (Fernet encrypts one token).
+    # Stream the spooled upload through a pooled buffer into one growing
+    # bytearray: no per-chunk bytes objects, no final join copy.
+    plaintext = bytearray()
+    readinto = getattr(file.file, "readinto", None)
     try:
-        while chunk := await file.read(64 * 1024):
-            total_size += len(chunk)
-            if total_size > MAX_UPLOAD_SIZE_BYTES:
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Max size is {settings.max_upload_size_mb}MB",
-                )
-            raw_chunks.append(chunk)
-
-        plaintext = b"".join(raw_chunks)
-        ciphertext = encrypt_file_bytes(plaintext)
-        with open(file_path, "wb") as f:
-            f.write(ciphertext)
+        with _upload_buffers.acquire() as buf, memoryview(buf) as view:
+            while True:
+                if readinto is not None:
+                    n = await run_in_threadpool(readinto, view)
+                    chunk = view[:n]
+                else:
+                    chunk = await file.read(len(buf))
+                    n = len(chunk)
+                if not n:
+                    break
+                if len(plaintext) + n > MAX_UPLOAD_SIZE_BYTES:
+                    raise too_large
+                plaintext += chunk
+
+        # Fernet is CPU-bound on the whole file, so encrypt in the thread too
+        await asyncio.to_thread(_encrypt_and_write, file_path, bytes(plaintext))
     except HTTPException:
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        await asyncio.to_thread(_discard, file_path)
         raise
 
     return file_path
 
 
-def read_and_decrypt(file_path: str) -> bytes:
-    """Read an encrypted file from disk and return the plaintext bytes.
+def resolve_upload_path(file_path: str) -> str:
+    """Return the absolute path of a stored upload after access checks.
 
-    Validates the path stays within the allowed upload directory.
+    Validates the path stays within the allowed upload directory and exists.
     """
     abs_path = os.path.abspath(file_path)
     allowed_root = os.path.abspath(settings.upload_dir)
@@ -89,10 +182,68 @@ def read_and_decrypt(file_path: str) -> bytes:
 
     if not os.path.isfile(abs_path):
         raise HTTPException(status_code=404, detail="File no longer exists on disk")
+    return abs_path
+
 
+class _DecryptedFileCache:
+    """Thread-safe LRU of decrypted uploads, bounded by total plaintext bytes.
+
+    Stored uploads are never rewritten (each save gets a fresh UUID path), so
+    entries need no invalidation.  Files larger than the whole budget are
+    never cached.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_decrypted_files = _DecryptedFileCache(settings.decrypted_file_cache_mb * 1024 * 1024)
+
+
+def read_and_decrypt(file_path: str) -> bytes:
+    """Read an encrypted file from disk and return the plaintext bytes.
+
+    Blocking (file I/O + decryption); call it from a worker thread in async code.
+    Recently downloaded files are served from an in-memory LRU; the path
+    checks still run on every call.
+    """
+    abs_path = resolve_upload_path(file_path)
+    plaintext = _decrypted_files.get(abs_path)
+    if plaintext is not None:
+        return plaintext
     with open(abs_path, "rb") as f:
         ciphertext = f.read()
-    return decrypt_file_bytes(ciphertext)
+    plaintext = decrypt_file_bytes(ciphertext)
+    _decrypted_files.put(abs_path, plaintext)
+    return plaintext
 
 
 def safe_filename(file_path: str) -> str:
@@ -6,10 +6,13 @@ and conclusion detection from the API layer so both transports use identical log
 
 from __future__ import annotations
 
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from models.database import (
@@ -21,10 +24,27 @@ from models.database import (
     Party,
     PartyRole,
 )
-from prompts.system_prompts import generate_hearing_message
+from prompts.system_prompts import generate_hearing_message, generate_hearing_message_stream
 
 
 CONCLUSION_MARKER = "hearing is now concluded"
+# Case-insensitive search without building a lowercased copy of each reply
+_CONCLUSION_RE = re.compile(re.escape(CONCLUSION_MARKER), re.IGNORECASE)
+TRANSCRIPT_BATCH_SIZE = 50  # rows per server-side cursor fetch when streaming
+
+
+def _case_context(
+    case_type, plaintiff_narrative, defendant_narrative, claimed_amount,
+    plaintiff_name, defendant_name,
+) -> dict:
+    return {
+        "case_type": case_type.value if case_type else "unknown",
+        "plaintiff_name": plaintiff_name or "Plaintiff",
+        "defendant_name": defendant_name or "Defendant",
+        "plaintiff_narrative": plaintiff_narrative or "",
+        "defendant_narrative": defendant_narrative or "",
+        "claimed_amount": float(claimed_amount) if claimed_amount else 0,
+    }
 
 
 def build_case_context(case: Case, parties: list[Party]) -> dict:
@@ -37,26 +57,50 @@ def build_case_context(case: Case, parties: list[Party]) -> dict:
         elif p.role == PartyRole.defendant:
             defendant_name = p.name
 
-    return {
-        "case_type": case.case_type.value if case.case_type else "unknown",
-        "plaintiff_name": plaintiff_name,
-        "defendant_name": defendant_name,
-        "plaintiff_narrative": case.plaintiff_narrative or "",
-        "defendant_narrative": case.defendant_narrative or "",
-        "claimed_amount": float(case.claimed_amount) if case.claimed_amount else 0,
-    }
+    return _case_context(
+        case.case_type, case.plaintiff_narrative, case.defendant_narrative,
+        case.claimed_amount, plaintiff_name, defendant_name,
+    )
+
+
+async def load_case_context(db: AsyncSession, case_id) -> dict | None:
+    """Build the hearing prompt context for a case in a single query.
+
+    Same result as ``build_case_context``, but the party names are picked
+    out by SQL aggregates, so callers need not load ``Case.parties``.
+    Returns None if the case does not exist.
+    """
+    result = await db.execute(
+        select(
+            Case.case_type,
+            Case.plaintiff_narrative,
+            Case.defendant_narrative,
+            Case.claimed_amount,
+            func.max(Party.name).filter(Party.role == PartyRole.plaintiff),
+            func.max(Party.name).filter(Party.role == PartyRole.defendant),
+        )
+        .outerjoin(Party, Party.case_id == Case.id)
+        .where(Case.id == case_id)
+        .group_by(Case.id)
+    )
+    row = result.one_or_none()
+    return _case_context(*row) if row is not None else None
 
 
 def extract_party_names(case: Case) -> tuple[str, str]:
-    """Return (plaintiff_name, defendant_name) from loaded case.parties."""
-    plaintiff_name = "Plaintiff"
-    defendant_name = "Defendant"
-    for party in case.parties:
-        if party.role == PartyRole.plaintiff:
-            plaintiff_name = party.name
-        elif party.role == PartyRole.defendant:
-            defendant_name = party.name
-    return plaintiff_name, defendant_name
+    """Return (plaintiff_name, defendant_name) from loaded case.plaintiff/defendant."""
+    plaintiff, defendant = case.plaintiff, case.defendant
+    return (
+        plaintiff.name if plaintiff else "Plaintiff",
+        defendant.name if defendant else "Defendant",
+    )
+
+
+class JudgeMessageNotSaved(Exception):
+    """The judge's reply was generated, but no free sequence was left to save it.
+
+    The party's message of that exchange is already committed.
+    """
 
 
 @dataclass(frozen=True, slots=True)
@@ -76,6 +120,61 @@ async def get_next_sequence(db: AsyncSession, hearing_id) -> int:
     return result.scalar() or 0
 
 
+async def load_transcript(db: AsyncSession, hearing_id) -> list:
+    """Return a hearing's ``(role, content, sequence)`` rows in sequence order.
+
+    Selects just those columns, so long hearings don't build a
+    ``HearingMessage`` object per turn only to read three fields off it.
+    """
+    result = await db.execute(
+        select(HearingMessage.role, HearingMessage.content, HearingMessage.sequence)
+        .where(HearingMessage.hearing_id == hearing_id)
+        .order_by(HearingMessage.sequence)
+    )
+    return result.all()
+
+
+async def stream_transcript(
+    db: AsyncSession, hearing_id, batch_size: int = TRANSCRIPT_BATCH_SIZE
+) -> AsyncIterator[list]:
+    """Yield a hearing's ``(role, content, sequence)`` rows in batches.
+
+    Same rows as ``load_transcript``, read through a server-side cursor so
+    the caller can act on the first batch before the rest are fetched.
+    """
+    result = await db.stream(
+        select(HearingMessage.role, HearingMessage.content, HearingMessage.sequence)
+        .where(HearingMessage.hearing_id == hearing_id)
+        .order_by(HearingMessage.sequence)
+        .execution_options(yield_per=batch_size)
+    )
+    async for batch in result.partitions():
+        yield batch
+
+
+async def _add_judge_message(db: AsyncSession, hearing_id, content: str, sequence: int) -> bool:
+    """Stage the judge's message; mark the hearing complete if it concludes it.
+
+    Returns whether the hearing concluded.
+    """
+    db.add(
+        HearingMessage(
+            hearing_id=hearing_id,
+            role=HearingMessageRole.judge,
+            content=content,
+            sequence=sequence,
+        )
+    )
+
+    # Detect hearing conclusion; a direct UPDATE, so no SELECT to load the hearing
+    concluded = _CONCLUSION_RE.search(content) is not None
+    if concluded:
+        await db.execute(
+            update(Hearing).where(Hearing.id == hearing_id).values(completed_at=func.now())
+        )
+    return concluded
+
+
 async def process_hearing_exchange(
     db: AsyncSession,
     *,
@@ -84,13 +183,27 @@ async def process_hearing_exchange(
     case_context: dict,
     user_role: HearingMessageRole,
     user_content: str,
+    last_sequence: int | None = None,
+    history: list[dict] | None = None,
 ) -> JudgeExchangeResult:
     """Save a user message, generate the judge response, and persist it.
 
     This is the core hearing loop used by both the WebSocket and HTTP handlers.
     The caller is responsible for committing the transaction.
+
+    Callers that already know the hearing's highest message sequence pass it
+    as ``last_sequence`` to skip the MAX(sequence) query.  A stale value
+    cannot corrupt the transcript: the (hearing_id, sequence) unique
+    constraint rejects the insert instead.
+
+    Likewise ``history`` (``{"role", "content"}`` dicts in sequence order)
+    replaces reloading the transcript; on success both new turns are
+    appended to it, so a caller can keep passing the same list.
     """
-    max_seq = await get_next_sequence(db, hearing_id)
+    if last_sequence is None:
+        max_seq = await get_next_sequence(db, hearing_id)
+    else:
+        max_seq = last_sequence
 
     # Persist the user's message
     user_msg = HearingMessage(
@@ -103,41 +216,134 @@ async def process_hearing_exchange(
     await db.flush()
 
     # Build conversation history for the LLM
-    msgs_result = await db.execute(
-        select(HearingMessage)
-        .where(HearingMessage.hearing_id == hearing_id)
-        .order_by(HearingMessage.sequence)
-    )
-    history = [
-        {"role": m.role.value, "content": m.content}
-        for m in msgs_result.scalars().all()
-    ]
+    user_turn = {"role": user_role.value, "content": user_content}
+    if history is None:
+        conversation = [
+            {"role": role.value, "content": content}
+            for role, content, _ in await load_transcript(db, hearing_id)
+        ]
+    else:
+        conversation = [*history, user_turn]
 
     # Generate the judge's response
     judge_response = await generate_hearing_message(
         archetype_id=archetype_id,
         case_context=case_context,
-        conversation_history=history,
+        conversation_history=conversation,
     )
 
     judge_content = judge_response["content"]
     judge_seq = max_seq + 2
+    concluded = await _add_judge_message(db, hearing_id, judge_content, judge_seq)
 
-    # Persist the judge's message
-    judge_msg = HearingMessage(
-        hearing_id=hearing_id,
-        role=HearingMessageRole.judge,
-        content=judge_content,
-        sequence=judge_seq,
+    if history is not None:
+        history.extend((user_turn, {"role": HearingMessageRole.judge.value, "content": judge_content}))
+
+    return JudgeExchangeResult(
+        judge_content=judge_content,
+        judge_sequence=judge_seq,
+        concluded=concluded,
     )
-    db.add(judge_msg)
 
-    # Detect hearing conclusion
-    concluded = CONCLUSION_MARKER in judge_content.lower()
-    if concluded:
-        hearing_obj = await db.get(Hearing, hearing_id)
-        if hearing_obj:
-            hearing_obj.completed_at = func.now()
+
+async def _write_detached(session_factory, hearing_id, sequence: int, write):
+    """Run ``write(db, sequence)`` in its own session and commit it.
+
+    Another writer on the same hearing (a second tab, the HTTP fallback) can
+    take ``sequence`` first, in which case the (hearing_id, sequence) unique
+    constraint rejects the insert; the write is then retried once after
+    MAX(sequence).  Returns the sequence used and ``write``'s result.
+    """
+    try:
+        async with session_factory() as db:
+            result = await write(db, sequence)
+            await db.commit()
+    except IntegrityError:
+        async with session_factory() as db:
+            sequence = await get_next_sequence(db, hearing_id) + 1
+            result = await write(db, sequence)
+            await db.commit()
+    return sequence, result
+
+
+async def process_hearing_exchange_detached(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    hearing_id,
+    archetype_id: str,
+    case_context: dict,
+    user_role: HearingMessageRole,
+    user_content: str,
+    last_sequence: int,
+    history: list[dict],
+    on_delta: Callable[[str], Awaitable[None]] | None = None,
+) -> JudgeExchangeResult:
+    """``process_hearing_exchange`` for long-lived callers such as the WebSocket.
+
+    Each message is written and committed in its own short session, so no
+    pooled connection is held while the LLM generates the judge's reply.
+    The user's message stays saved even if that generation fails.  If
+    another writer has taken ``last_sequence + 1`` meanwhile, each write
+    moves past it once (see ``_write_detached``), and ``history`` is reloaded
+    from the saved transcript so the judge also sees that writer's turns.
+    Raises ``IntegrityError`` if the user's message still cannot be saved,
+    or ``JudgeMessageNotSaved`` if the judge's reply cannot.
+
+    With ``on_delta`` the reply is streamed: each chunk of text is passed to
+    it as it arrives, and the full reply is saved once generation finishes.
+    """
+    async def _add_user_message(db: AsyncSession, sequence: int) -> list[dict] | None:
+        db.add(
+            HearingMessage(
+                hearing_id=hearing_id,
+                role=user_role,
+                content=user_content,
+                sequence=sequence,
+            )
+        )
+        if sequence == last_sequence + 1:
+            return None
+        # Another writer got in first; reread the transcript, new message included
+        return [
+            {"role": role.value, "content": content}
+            for role, content, _ in await load_transcript(db, hearing_id)
+        ]
+
+    user_seq, transcript = await _write_detached(
+        session_factory, hearing_id, last_sequence + 1, _add_user_message
+    )
+    if transcript is None:
+        history.append({"role": user_role.value, "content": user_content})
+    else:
+        history[:] = transcript
+
+    if on_delta is None:
+        judge_response = await generate_hearing_message(
+            archetype_id=archetype_id,
+            case_context=case_context,
+            conversation_history=list(history),
+        )
+        judge_content = judge_response["content"]
+    else:
+        parts = []
+        async for text in generate_hearing_message_stream(
+            archetype_id=archetype_id,
+            case_context=case_context,
+            conversation_history=list(history),
+        ):
+            parts.append(text)
+            await on_delta(text)
+        judge_content = "".join(parts)
+    try:
+        judge_seq, concluded = await _write_detached(
+            session_factory,
+            hearing_id,
+            user_seq + 1,
+            lambda db, sequence: _add_judge_message(db, hearing_id, judge_content, sequence),
+        )
+    except IntegrityError as exc:
+        raise JudgeMessageNotSaved from exc
+    history.append({"role": HearingMessageRole.judge.value, "content": judge_content})
 
     return JudgeExchangeResult(
         judge_content=judge_content,
@@ -1,12 +1,15 @@
 """Shared helpers used by both judgment and comparison endpoints."""
 
+import asyncio
 import hashlib
 import json
+import time
 import uuid
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlalchemy import select
+from sqlalchemy.orm import joinedload, selectinload
 
 from api.security import get_owned_case
 from models.database import Case, Hearing, PartyRole
@@ -15,9 +18,10 @@ from models.database import Case, Hearing, PartyRole
 def extract_hearing_transcript(hearing: Hearing | None) -> list[dict] | None:
     if not hearing or not hearing.messages:
         return None
+    # Hearing.messages is loaded in sequence order (relationship order_by)
     return [
         {"role": message.role.value, "content": message.content}
-        for message in sorted(hearing.messages, key=lambda item: item.sequence)
+        for message in hearing.messages
     ]
 
 
@@ -26,6 +30,37 @@ def derive_winner(value: str | None) -> PartyRole:
     return PartyRole.plaintiff if "plaintiff" in winner else PartyRole.defendant
 
 
+def llm_call_row(
+    case_id: uuid.UUID, pipeline_step: str, call_meta: dict, *, cache_hit: bool = False
+) -> dict:
+    """An LLMCall row (for bulk insert) from a pipeline llm_metadata entry.
+
+    ``cache_hit`` records a call whose result was reused from the pipeline
+    cache: tagged ``cached:<step>`` with zero tokens, cost and latency, since
+    the request that made the call already logged what it spent.
+    """
+    if cache_hit:
+        return {
+            "case_id": case_id,
+            "pipeline_step": f"cached:{pipeline_step}"[:50],
+            "model": call_meta["model"],
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cost_usd": Decimal(0),
+            "latency_ms": 0,
+        }
+    return {
+        "case_id": case_id,
+        "pipeline_step": pipeline_step[:50],
+        "model": call_meta["model"],
+        "input_tokens": call_meta["input_tokens"],
+        "output_tokens": call_meta["output_tokens"],
+        # Numeric column: Decimal is what asyncpg's COPY encoder expects
+        "cost_usd": Decimal(str(call_meta["cost_usd"])),
+        "latency_ms": call_meta["latency_ms"],
+    }
+
+
 def comparison_run_key(
     case: Case,
     hearing: Hearing | None,
@@ -41,8 +76,100 @@ def comparison_run_key(
         "hearing_completed_at": hearing.completed_at.isoformat() if hearing and hearing.completed_at else None,
         "hearing_message_count": len(hearing.messages) if hearing and hearing.messages else 0,
     }
-    serialized = json.dumps(key_payload, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    return _digest(key_payload)
+
+
+# One encoder for every key: json.dumps with non-default options builds a
+# fresh JSONEncoder per call
+_encode_key_payload = json.JSONEncoder(sort_keys=True, separators=(",", ":")).encode
+
+
+def _digest(payload: dict) -> str:
+    return hashlib.sha256(_encode_key_payload(payload).encode("utf-8")).hexdigest()
+
+
+def pipeline_cache_key(
+    *,
+    plaintiff_narrative: str,
+    defendant_narrative: str,
+    plaintiff_name: str,
+    defendant_name: str,
+    claimed_amount: float | None,
+    archetype_id: str,
+    hearing_transcript: list[dict] | None,
+) -> str:
+    """Hash of everything ``run_pipeline`` reads, for ``cached_pipeline_result``.
+
+    Unlike ``comparison_run_key`` it leaves out case identity and timestamps,
+    so byte-identical inputs share a result across cases and runs.
+    """
+    return _digest(
+        {
+            "plaintiff_narrative": plaintiff_narrative,
+            "defendant_narrative": defendant_narrative,
+            "plaintiff_name": plaintiff_name,
+            "defendant_name": defendant_name,
+            "claimed_amount": claimed_amount,
+            "archetype_id": archetype_id,
+            "hearing_transcript": hearing_transcript,
+        }
+    )
+
+
+# ─── Pipeline result cache ────────────────────────────────────────────────────
+# pipeline_cache_key → (stored at, run_pipeline result).  Saves re-running the
+# whole multi-step LLM pipeline on retries, force-refreshes and judges that a
+# judgment and a comparison have in common.  Per-process and best effort.
+_PIPELINE_CACHE_TTL_SECONDS = 3600
+_PIPELINE_CACHE_MAX_SIZE = 256
+_pipeline_cache: dict[str, tuple[float, dict]] = {}
+_pipeline_locks: dict[str, asyncio.Lock] = {}
+
+
+def get_cached_pipeline_result(key: str) -> dict | None:
+    entry = _pipeline_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] >= _PIPELINE_CACHE_TTL_SECONDS:
+        _pipeline_cache.pop(key, None)
+        return None
+    return entry[1]
+
+
+def _store_pipeline_result(key: str, result: dict) -> None:
+    _pipeline_cache[key] = (time.monotonic(), result)
+    # Prevent unbounded growth: drop the oldest half (dicts keep insertion order)
+    if len(_pipeline_cache) > _PIPELINE_CACHE_MAX_SIZE:
+        for stale in list(_pipeline_cache)[: len(_pipeline_cache) // 2]:
+            _pipeline_cache.pop(stale, None)
+
+
+async def cached_pipeline_result(
+    key: str, compute: Callable[[], Awaitable[dict]], *, refresh: bool = False
+) -> tuple[dict, bool]:
+    """Return ``(result, computed)`` for ``key``, running ``compute`` on a miss.
+
+    Concurrent misses on one key wait for the first to finish rather than
+    each running the pipeline.  ``computed`` is False for cached results, whose
+    LLM calls were already paid for and logged.  ``refresh`` skips the lookup
+    (the fresh result still replaces the cached one).
+    """
+    result = None if refresh else get_cached_pipeline_result(key)
+    if result is not None:
+        return result, False
+
+    lock = _pipeline_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            result = None if refresh else get_cached_pipeline_result(key)
+            if result is not None:
+                return result, False
+            result = await compute()
+            _store_pipeline_result(key, result)
+            return result, True
+    finally:
+        if _pipeline_locks.get(key) is lock and not lock.locked():
+            del _pipeline_locks[key]
 
 
 async def get_case_and_hearing_context(
@@ -50,20 +177,18 @@ async def get_case_and_hearing_context(
     case_id: uuid.UUID,
     session_id: str,
 ) -> tuple[Case, Hearing | None]:
+    # The one-to-one parties and hearing ride along on the case SELECT as
+    # LEFT OUTER JOINs instead of each costing its own round trip
     case = await get_owned_case(
         db,
         case_id,
         session_id,
         options=(
-            selectinload(Case.parties),
+            joinedload(Case.plaintiff),
+            joinedload(Case.defendant),
             selectinload(Case.evidence),
             selectinload(Case.timeline_events),
+            joinedload(Case.hearing).selectinload(Hearing.messages),
         ),
     )
-    hearing_result = await db.execute(
-        select(Hearing)
-        .where(Hearing.case_id == case_id)
-        .options(selectinload(Hearing.messages))
-    )
-    hearing = hearing_result.scalar_one_or_none()
-    return case, hearing
+    return case, case.hearing
@@ -4,6 +4,7 @@ from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
 
+from api.security import is_admin_key_valid
 from db.connection import get_db
 from main import app
 from models.database import OperatorRole, Session
@@ -27,6 +28,9 @@ class _ExecuteResult:
     def all(self):
         return list(self._values)
 
+    def scalar_one_or_none(self):
+        return self._values[0] if self._values else None
+
 
 class _FakeDB:
     def __init__(self):
@@ -34,6 +38,16 @@ class _FakeDB:
 
     async def execute(self, *args, **kwargs):
         stmt = args[0] if args else None
+        if getattr(stmt, "is_update", False) and stmt.table.name == "sessions":
+            # Admin login: UPDATE sessions SET role=... WHERE id=... RETURNING
+            params = stmt.compile().params
+            session = self.sessions.get(params["id_1"])
+            if session is None:
+                return _ExecuteResult([])
+            # Keyed by column name (role_code); the value is the enum member
+            # before SmallIntCodedEnum encodes it
+            session.role = OperatorRole(params["role_code"])
+            return _ExecuteResult([session])
         if stmt is not None and hasattr(stmt, "is_dml") and stmt.is_dml:
             return _ExecuteResult([])
         # Corpus stats: GROUP BY source_type → (source_type, count) rows
@@ -72,8 +86,8 @@ def _make_client(fake_db: _FakeDB) -> TestClient:
 def test_auth_and_admin_corpus_flow(monkeypatch):
     fake_db = _FakeDB()
     monkeypatch.setattr(
-        "api.security.get_settings",
-        lambda: SimpleNamespace(admin_api_keys=["integration-admin-key"], debug=True),
+        "api.security.settings",
+        SimpleNamespace(admin_api_keys=["integration-admin-key"], debug=True),
     )
 
     with _make_client(fake_db) as client:
@@ -120,8 +134,8 @@ def test_auth_and_admin_corpus_flow(monkeypatch):
 def test_corpus_search_requires_admin_role(monkeypatch):
     fake_db = _FakeDB()
     monkeypatch.setattr(
-        "api.security.get_settings",
-        lambda: SimpleNamespace(admin_api_keys=["integration-admin-key"], debug=True),
+        "api.security.settings",
+        SimpleNamespace(admin_api_keys=["integration-admin-key"], debug=True),
     )
 
     with _make_client(fake_db) as client:
@@ -137,3 +151,16 @@ def test_corpus_search_requires_admin_role(monkeypatch):
         assert response_message == "Admin role required"
 
     app.dependency_overrides.clear()
+
+
+def test_admin_key_validation(monkeypatch):
+    monkeypatch.setattr(
+        "api.security.settings",
+        SimpleNamespace(admin_api_keys=["first-key", "second-kéy"], debug=True),
+    )
+
+    assert is_admin_key_valid("first-key")
+    assert is_admin_key_valid("second-kéy")  # non-ASCII keys are fine
+    assert not is_admin_key_valid("first-ke")
+    assert not is_admin_key_valid("")
+    assert not is_admin_key_valid(None)
@@ -57,20 +57,14 @@ def _make_case(case_id, session_id):
     return c
 
 
-def _noop_result():
-    """Dummy result for _touch_session_activity UPDATE."""
-    return MagicMock()
-
-
 def _make_update_db(mock_case):
     """Build an AsyncMock DB for update_case.
 
     Call order:
     1. get_owned_case → select Case
-    2. _touch_session_activity → UPDATE sessions
-    3. db.flush()
-    4. db.refresh(case)
-    5. db.execute(select Case...) → reload with relationships
+    2. db.flush()
+    3. db.refresh(case)
+    4. db.execute(select Case...) → reload with relationships
     """
     db = AsyncMock()
     case_result = MagicMock()
@@ -81,7 +75,6 @@ def _make_update_db(mock_case):
 
     db.execute = AsyncMock(side_effect=[
         case_result,     # get_owned_case
-        _noop_result(),  # _touch_session_activity
         reload_result,   # reload after update
     ])
     return db
@@ -164,7 +157,6 @@ class TestCaseUpdateErrors:
             db = AsyncMock()
             case_result = MagicMock()
             case_result.scalar_one_or_none.return_value = None
-            # _touch_session_activity won't run because get_owned_case raises first
             db.execute = AsyncMock(return_value=case_result)
             yield db
 
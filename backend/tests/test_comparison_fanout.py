@@ -0,0 +1,155 @@
+"""Tests for the comparison run's judge fan-out.
+
+Each judge pipeline runs in its own session from the sessionmaker (an
+AsyncSession cannot serve concurrent statements), and no more than
+PIPELINE_WORKERS pipelines run at once.
+"""
+
+import asyncio
+import contextlib
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import api.comparison as comparison
+import services.judgment_helpers as helpers
+from models.database import Case
+from models.schemas import ComparisonRunRequest
+
+ARCHETYPES = ["a1", "a2", "a3", "a4", "a5", "a6"]
+
+
+@pytest.fixture(autouse=True)
+def _clear_pipeline_cache():
+    helpers._pipeline_cache.clear()
+    yield
+    helpers._pipeline_cache.clear()
+
+
+def _make_case():
+    case = MagicMock(spec=Case)
+    case.id = uuid.uuid4()
+    case.plaintiff_narrative = "I paid a deposit."
+    case.defendant_narrative = "The unit was damaged."
+    case.claimed_amount = None
+    case.updated_at = None
+    return case
+
+
+def _make_sessionmaker(opened):
+    def sessionmaker():
+        @contextlib.asynccontextmanager
+        async def _session():
+            session = MagicMock(name=f"worker_session_{len(opened)}")
+            opened.append(session)
+            yield session
+
+        return _session()
+
+    return sessionmaker
+
+
+async def _run_comparison(run_pipeline, *, force_refresh=False, existing_id=None):
+    case = _make_case()
+    db = AsyncMock()
+    db.add = MagicMock()
+    opened = []
+    find_run = AsyncMock(return_value=None)
+
+    with (
+        patch.object(comparison.comparison_limiter, "check", AsyncMock()),
+        patch.object(
+            comparison, "get_case_and_hearing_context", AsyncMock(return_value=(case, None))
+        ),
+        patch.object(comparison, "_find_existing_run", find_run),
+        patch.object(
+            comparison, "_find_existing_run_id", AsyncMock(return_value=existing_id)
+        ),
+        patch.object(comparison, "extract_party_names", return_value=("Alice", "Bob")),
+        patch.object(
+            comparison,
+            "analyze_case",
+            AsyncMock(return_value={"facts": {}, "classification": {}, "rules": {}, "llm_calls": []}),
+        ),
+        patch.object(comparison, "run_pipeline", run_pipeline),
+        patch.object(comparison, "synthesize_comparison_insights", return_value={}),
+        patch.object(comparison, "ComparisonRunResponse"),
+    ):
+        await comparison.run_or_reuse_comparison(
+            case_id=case.id,
+            body=ComparisonRunRequest(archetype_ids=ARCHETYPES, force_refresh=force_refresh),
+            session_id=str(uuid.uuid4()),
+            db=db,
+            sessionmaker=_make_sessionmaker(opened),
+        )
+    if force_refresh:
+        find_run.assert_not_awaited()  # the old run's results are never loaded
+    return db, opened
+
+
+def _pipeline_result():
+    return {"judgment": {}, "pipeline_metadata": {"llm_calls": []}}
+
+
+async def test_each_pipeline_gets_its_own_session():
+    sessions = []
+
+    async def run_pipeline(*, db, **_kwargs):
+        sessions.append(db)
+        return _pipeline_result()
+
+    db, opened = await _run_comparison(run_pipeline)
+
+    assert len(sessions) == len(ARCHETYPES)
+    assert db not in sessions
+    assert len({id(s) for s in sessions}) == len(ARCHETYPES)
+    assert all(s in opened for s in sessions)
+
+
+async def test_concurrency_is_capped_at_worker_count():
+    running = 0
+    peak = 0
+
+    async def run_pipeline(**_kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return _pipeline_result()
+
+    await _run_comparison(run_pipeline)
+
+    assert peak == comparison.PIPELINE_WORKERS
+
+
+async def test_failed_judge_does_not_stop_the_others():
+    completed = []
+
+    async def run_pipeline(*, archetype_id, **_kwargs):
+        if archetype_id == "a2":
+            raise RuntimeError("LLM unavailable")
+        completed.append(archetype_id)
+        return _pipeline_result()
+
+    await _run_comparison(run_pipeline)
+
+    assert sorted(completed) == [a for a in ARCHETYPES if a != "a2"]
+
+
+async def test_force_refresh_deletes_old_run_by_id():
+    old_run_id = uuid.uuid4()
+
+    async def run_pipeline(**_kwargs):
+        return _pipeline_result()
+
+    db, _ = await _run_comparison(run_pipeline, force_refresh=True, existing_id=old_run_id)
+
+    delete_stmts = [
+        call.args[0] for call in db.execute.await_args_list
+        if getattr(call.args[0], "is_delete", False)
+    ]
+    assert len(delete_stmts) == 1
+    assert delete_stmts[0].table.name == "comparison_runs"
+    db.delete.assert_not_awaited()
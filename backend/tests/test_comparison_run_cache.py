@@ -0,0 +1,80 @@
+"""Tests for the in-process (case_id, run_key) → run id cache."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import api.comparison as comparison_api
+
+
+def _result(run):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = run
+    return result
+
+
+def _run(case_id):
+    run = MagicMock()
+    run.id = uuid.uuid4()
+    run.case_id = case_id
+    return run
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    comparison_api._run_id_cache.clear()
+    yield
+    comparison_api._run_id_cache.clear()
+
+
+class TestFindExistingRun:
+    @pytest.mark.asyncio
+    async def test_miss_populates_cache(self):
+        case_id = uuid.uuid4()
+        run = _run(case_id)
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(run)])
+
+        found = await comparison_api._find_existing_run(db, case_id, "key")
+
+        assert found is run
+        assert comparison_api._run_id_cache[(case_id, "key")] == run.id
+
+    @pytest.mark.asyncio
+    async def test_hit_loads_by_primary_key_only(self):
+        case_id = uuid.uuid4()
+        run = _run(case_id)
+        comparison_api._cache_run_id(case_id, "key", run.id)
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(run)])
+
+        found = await comparison_api._find_existing_run(db, case_id, "key")
+
+        assert found is run
+        assert db.execute.await_count == 1
+        stmt = db.execute.await_args.args[0]
+        assert "comparison_runs.id" in str(stmt.whereclause)
+        assert "run_key" not in str(stmt.whereclause)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_falls_back_to_run_key_lookup(self):
+        case_id = uuid.uuid4()
+        comparison_api._cache_run_id(case_id, "key", uuid.uuid4())
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(None), _result(None)])
+
+        found = await comparison_api._find_existing_run(db, case_id, "key")
+
+        assert found is None
+        assert db.execute.await_count == 2
+        assert (case_id, "key") not in comparison_api._run_id_cache
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(comparison_api, "_RUN_ID_CACHE_MAX_SIZE", 4)
+        case_id = uuid.uuid4()
+        for i in range(5):
+            comparison_api._cache_run_id(case_id, f"key-{i}", uuid.uuid4())
+
+        assert len(comparison_api._run_id_cache) <= 4
+        assert (case_id, "key-4") in comparison_api._run_id_cache
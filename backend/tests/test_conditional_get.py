@@ -0,0 +1,172 @@
+"""Tests for ETag / If-None-Match handling on GET hearing and GET judgment.
+
+A matching If-None-Match returns 304 after a single cheap lookup; anything
+else gets the full body with an ETag to send back next time.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from api.responses import etag
+from db.connection import get_db
+from main import app
+from models.database import Case, Hearing, HearingMessage, HearingMessageRole, Judgment
+
+
+def _make_case(case_id, session_id):
+    c = MagicMock(spec=Case)
+    c.id = case_id
+    c.session_id = uuid.UUID(session_id)
+    return c
+
+
+def _case_result(case_id, session_id):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = _make_case(case_id, session_id)
+    return result
+
+
+def _make_hearing(case_id):
+    h = MagicMock(spec=Hearing)
+    h.id = uuid.uuid4()
+    h.case_id = case_id
+    h.archetype_id = "strict"
+    h.started_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    h.completed_at = None
+    message = MagicMock(spec=HearingMessage)
+    message.id = uuid.uuid4()
+    message.hearing_id = h.id
+    message.role = HearingMessageRole.judge
+    message.content = "Good morning."
+    message.sequence = 1
+    message.created_at = h.started_at
+    h.messages = [message]
+    return h
+
+
+def _get(db, url, session_id, extra_headers=None):
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as client:
+            return client.get(url, headers={"X-Session-Id": session_id, **(extra_headers or {})})
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestHearingETag:
+    def _full_db(self, case_id, session_id, hearing):
+        hearing_result = MagicMock()
+        hearing_result.scalar_one_or_none.return_value = hearing
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[_case_result(case_id, session_id), hearing_result]
+        )
+        return db
+
+    def test_full_response_carries_etag(self):
+        session_id, case_id = str(uuid.uuid4()), uuid.uuid4()
+        hearing = _make_hearing(case_id)
+
+        response = _get(
+            self._full_db(case_id, session_id, hearing),
+            f"/cases/{case_id}/hearing",
+            session_id,
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag(hearing.id, 1, 1, None)
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_matching_tag_returns_304_without_loading_transcript(self):
+        session_id, case_id = str(uuid.uuid4()), uuid.uuid4()
+        hearing_id = uuid.uuid4()
+        tag = etag(hearing_id, 3, 3, None)
+        validator = MagicMock()
+        validator.one_or_none.return_value = (hearing_id, 3, 3, None)
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[_case_result(case_id, session_id), validator]
+        )
+
+        response = _get(db, f"/cases/{case_id}/hearing", session_id, {"If-None-Match": tag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == tag
+        assert response.content == b""
+        assert db.execute.await_count == 2  # case, validator
+
+    def test_stale_tag_gets_full_body(self):
+        session_id, case_id = str(uuid.uuid4()), uuid.uuid4()
+        hearing = _make_hearing(case_id)
+        validator = MagicMock()
+        validator.one_or_none.return_value = (hearing.id, 1, 1, None)
+        hearing_result = MagicMock()
+        hearing_result.scalar_one_or_none.return_value = hearing
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[
+                _case_result(case_id, session_id), validator, hearing_result,
+            ]
+        )
+
+        response = _get(
+            db, f"/cases/{case_id}/hearing", session_id, {"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag(hearing.id, 1, 1, None)
+        assert len(response.json()["messages"]) == 1
+
+
+class TestJudgmentETag:
+    def test_matching_tag_returns_304(self):
+        session_id, case_id = str(uuid.uuid4()), uuid.uuid4()
+        judgment_id = uuid.uuid4()
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_case_result(case_id, session_id)])
+        db.scalar = AsyncMock(return_value=judgment_id)
+
+        response = _get(
+            db,
+            f"/cases/{case_id}/judgment",
+            session_id,
+            {"If-None-Match": f"W/{etag(judgment_id)}"},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag(judgment_id)
+        assert db.execute.await_count == 1  # the judgment row is never loaded
+
+    def test_full_response_carries_etag(self):
+        session_id, case_id = str(uuid.uuid4()), uuid.uuid4()
+        judgment = MagicMock(spec=Judgment)
+        judgment.id = uuid.uuid4()
+        judgment.case_id = case_id
+        judgment.archetype_id = "strict"
+        judgment.findings_of_fact = []
+        judgment.conclusions_of_law = []
+        judgment.judgment_text = "Judgment for plaintiff."
+        judgment.rationale = ""
+        judgment.awarded_amount = None
+        judgment.in_favor_of = "plaintiff"
+        judgment.evidence_scores = None
+        judgment.reasoning_chain = None
+        judgment.advisory = None
+        judgment.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        judgment_result = MagicMock()
+        judgment_result.scalar_one_or_none.return_value = judgment
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[_case_result(case_id, session_id), judgment_result]
+        )
+
+        response = _get(db, f"/cases/{case_id}/judgment", session_id)
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == etag(judgment.id)
@@ -0,0 +1,69 @@
+"""Tests for db.connection.copy_rows (COPY-based bulk insert)."""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from db.connection import copy_rows
+from models.database import LLMCall
+
+
+def _session(driver_connection):
+    raw = MagicMock()
+    raw.driver_connection = driver_connection
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=raw)
+    db = AsyncMock()
+    db.connection = AsyncMock(return_value=conn)
+    return db
+
+
+def _row():
+    return {
+        "case_id": uuid.uuid4(),
+        "pipeline_step": "cmp:stern:reasoning",
+        "model": "claude-sonnet",
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cost_usd": Decimal("0.0125"),
+        "latency_ms": 400,
+    }
+
+
+async def test_copies_rows_and_fills_python_defaults():
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock()
+    db = _session(driver)
+    rows = [_row(), _row()]
+
+    await copy_rows(db, LLMCall, rows)
+
+    driver.copy_records_to_table.assert_awaited_once()
+    call = driver.copy_records_to_table.await_args
+    assert call.args == ("llm_calls",)
+    columns = call.kwargs["columns"]
+    records = call.kwargs["records"]
+    assert columns[: len(rows[0])] == list(rows[0])
+    assert "id" in columns  # uuid4 default, which COPY would not apply
+    assert "created_at" not in columns  # server default is left to Postgres
+    ids = [record[columns.index("id")] for record in records]
+    assert all(isinstance(i, uuid.UUID) for i in ids) and ids[0] != ids[1]
+    db.execute.assert_not_awaited()
+
+
+async def test_falls_back_to_executemany_without_copy():
+    db = _session(object())
+    rows = [_row()]
+
+    await copy_rows(db, LLMCall, rows)
+
+    db.execute.assert_awaited_once()
+    assert db.execute.await_args.args[1] == rows
+
+
+async def test_no_rows_is_a_no_op():
+    db = _session(MagicMock())
+
+    await copy_rows(db, LLMCall, [])
+
+    db.connection.assert_not_awaited()
@@ -0,0 +1,113 @@
+"""Tests for corpus embedding during ingestion."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import corpus.ingest as ingest
+import engine.llm_client as llm_client
+
+
+@pytest.fixture(autouse=True)
+def _embedding_cache_path(tmp_path, monkeypatch):
+    path = tmp_path / "embedding_cache" / "embeddings.json"
+    monkeypatch.setattr(ingest, "EMBEDDING_CACHE_PATH", path)
+    return path
+
+
+def _chunks(n):
+    return [
+        {
+            "source_type": "statute",
+            "source_title": f"W.S. 1-21-{i}",
+            "section_number": str(i),
+            "topic": "deposits",
+            "content": f"Section {i} text.",
+        }
+        for i in range(n)
+    ]
+
+
+def _fake_client(requests, running_peak):
+    running = 0
+
+    async def create(*, input, **_kwargs):
+        nonlocal running
+        requests.append(list(input))
+        running += 1
+        running_peak[0] = max(running_peak[0], running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        # The API may return items out of order; each carries its input index
+        items = [
+            SimpleNamespace(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=list(reversed(items)))
+
+    client = MagicMock()
+    client.embeddings.create = create
+    return client
+
+
+async def test_batches_requests_and_keeps_input_order():
+    texts = [f"text {'x' * i}" for i in range(10)]
+    requests, peak = [], [0]
+
+    with patch.object(llm_client, "get_openai_client", return_value=_fake_client(requests, peak)):
+        embeddings = await llm_client.generate_embeddings_batch(
+            texts, batch_size=4, concurrency=2
+        )
+
+    assert [len(r) for r in requests] == [4, 4, 2]
+    assert peak[0] == 2
+    assert embeddings == [[float(len(t))] for t in texts]
+
+
+async def test_ingest_embeds_all_chunks_in_one_call():
+    chunks = _chunks(5)
+    seen = []
+
+    async def fake_batch(texts, **_kwargs):
+        seen.append(texts)
+        return [[float(i)] for i in range(len(texts))]
+
+    with (
+        patch.object(ingest, "get_all_corpus_chunks", return_value=chunks),
+        patch.object(ingest, "generate_embeddings_batch", fake_batch),
+    ):
+        prepared = await ingest.embed_and_prepare_chunks()
+
+    assert seen == [[ingest._embed_text(c) for c in chunks]]
+    assert [p["section_number"] for p in prepared] == [c["section_number"] for c in chunks]
+    assert [p["embedding"] for p in prepared] == [[float(i)] for i in range(5)]
+
+
+async def test_reingest_only_embeds_changed_chunks(_embedding_cache_path):
+    chunks = _chunks(3)
+    seen = []
+
+    async def fake_batch(texts, **_kwargs):
+        seen.append(texts)
+        return [[float(len(t))] for t in texts]
+
+    with (
+        patch.object(ingest, "get_all_corpus_chunks", return_value=chunks),
+        patch.object(ingest, "generate_embeddings_batch", fake_batch),
+    ):
+        await ingest.embed_and_prepare_chunks()
+        assert _embedding_cache_path.exists()
+
+        chunks[1]["content"] = "Amended section text."
+        prepared = await ingest.embed_and_prepare_chunks()
+        assert seen[-1] == [ingest._embed_text(chunks[1])]
+
+        seen.clear()
+        await ingest.embed_and_prepare_chunks()
+
+    assert seen == []  # unchanged corpus: no embedding requests at all
+    assert [p["embedding"] for p in prepared] == [
+        [float(len(ingest._embed_text(c)))] for c in chunks
+    ]
@@ -0,0 +1,91 @@
+"""Tests that case and comparison-run reads load relationships up front.
+
+Every query that eager-loads with selectinload also carries raiseload("*"),
+so a relationship the endpoint forgot to load fails loudly instead of
+issuing one lazy SELECT per row.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from db.connection import get_db
+from main import app
+from models.database import Case, CaseStatus, CaseType
+
+
+def _has_raiseload(stmt) -> bool:
+    return any(
+        getattr(opt, "strategy", None) == (("lazy", "raise"),)
+        for opt in stmt._with_options
+    )
+
+
+def _make_case(case_id, session_id):
+    c = MagicMock(spec=Case)
+    c.id = case_id
+    c.session_id = uuid.UUID(session_id)
+    c.status = CaseStatus.intake
+    c.case_type = CaseType.contract
+    c.plaintiff_narrative = None
+    c.defendant_narrative = None
+    c.claimed_amount = None
+    c.damages_breakdown = None
+    c.archetype_id = None
+    c.parties = []
+    c.evidence = []
+    c.timeline_events = []
+    c.created_at = "2024-01-01T00:00:00"
+    c.updated_at = "2024-01-01T00:00:00"
+    return c
+
+
+def _run_with_db(db, method, url, headers):
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as client:
+            return client.request(method, url, headers=headers)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_case_guards_lazy_loads():
+    session_id = str(uuid.uuid4())
+    case_id = uuid.uuid4()
+    case_result = MagicMock()
+    case_result.scalar_one_or_none.return_value = _make_case(case_id, session_id)
+
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[case_result])
+
+    response = _run_with_db(db, "GET", f"/cases/{case_id}", {"X-Session-Id": session_id})
+
+    assert response.status_code == 200
+    # case SELECT (relationships via selectin), nothing more
+    assert db.execute.await_count == 1
+    assert _has_raiseload(db.execute.await_args_list[0].args[0])
+
+
+def test_list_comparison_runs_guards_lazy_loads():
+    session_id = str(uuid.uuid4())
+    case_id = uuid.uuid4()
+    case_result = MagicMock()
+    case_result.scalar_one_or_none.return_value = _make_case(case_id, session_id)
+    runs_result = MagicMock()
+    runs_result.scalars.return_value.all.return_value = []
+
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[case_result, runs_result])
+
+    response = _run_with_db(
+        db, "GET", f"/cases/{case_id}/comparison-runs", {"X-Session-Id": session_id}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert db.execute.await_count == 2
+    assert _has_raiseload(db.execute.await_args_list[1].args[0])
@@ -0,0 +1,26 @@
+"""Tests for the precomputed default error bodies."""
+
+import asyncio
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from api.error_handlers import DEFAULT_MESSAGES, _payload, http_exception_handler
+
+
+def test_default_body_matches_json_response_encoding():
+    response = asyncio.run(http_exception_handler(None, HTTPException(status_code=404, detail="")))
+
+    code, message = DEFAULT_MESSAGES[404]
+    expected = JSONResponse(content=_payload(code=code, message=message, retryable=False))
+    assert response.status_code == 404
+    assert response.media_type == "application/json"
+    assert response.body == expected.body
+
+
+def test_custom_detail_still_used():
+    response = asyncio.run(
+        http_exception_handler(None, HTTPException(status_code=404, detail="Case missing"))
+    )
+
+    assert b'"message":"Case missing"' in response.body
@@ -17,6 +17,7 @@ from fastapi import HTTPException
 
 from services.file_service import (
     ALLOWED_EXTENSIONS,
+    _DecryptedFileCache,
     _sanitize_filename,
     _validate_extension,
     read_and_decrypt,
@@ -156,3 +157,37 @@ class TestSafeFilename:
         result = safe_filename("uploads/subdir/nested/file.txt")
         assert "/" not in result
         assert result == "file.txt"
+
+
+# ─── Decrypted File Cache ─────────────────────────────────────────────────────
+
+
+class TestDecryptedFileCache:
+    def test_repeat_download_decrypts_once(self, tmp_path):
+        test_file = tmp_path / "evidence.pdf"
+        test_file.write_bytes(b"ciphertext")
+
+        with patch("services.file_service.settings") as mock_settings, \
+                patch("services.file_service._decrypted_files", _DecryptedFileCache(1024)), \
+                patch("services.file_service.decrypt_file_bytes", return_value=b"plain") as decrypt:
+            mock_settings.upload_dir = str(tmp_path)
+            assert read_and_decrypt(str(test_file)) == b"plain"
+            assert read_and_decrypt(str(test_file)) == b"plain"
+
+        decrypt.assert_called_once()
+
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = _DecryptedFileCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+        cache.put("c", b"cccc")
+
+        assert cache.get("a") == b"aaaa"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"cccc"
+
+    def test_skips_files_larger_than_budget(self):
+        cache = _DecryptedFileCache(max_bytes=4)
+        cache.put("big", b"too large")
+        assert cache.get("big") is None
@@ -68,9 +68,20 @@ def _make_hearing(hearing_id, case_id, completed=False):
     return h
 
 
-def _noop_result():
-    """Dummy result for _touch_session_activity UPDATE."""
-    return MagicMock()
+def _context_result():
+    """Result for the load_case_context aggregate SELECT."""
+    result = MagicMock()
+    result.one_or_none.return_value = (
+        CaseType.contract, "Plaintiff story", "Defendant story", None, "Alice", "Bob",
+    )
+    return result
+
+
+def _transcript_result(*rows):
+    """Result for the (role, content, sequence) transcript SELECT."""
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    return result
 
 
 # ─── Success Case ─────────────────────────────────────────────────────────────
@@ -96,19 +107,16 @@ class TestHearingHTTPMessage:
             case_result.scalar_one_or_none.return_value = mock_case
             case_result.scalar_one.return_value = mock_case
 
-            hearing_result = MagicMock()
-            hearing_result.scalar_one_or_none.return_value = mock_hearing
+            mock_case.hearing = mock_hearing
 
             # Call order:
-            # 1. get_owned_case → select Case
-            # 2. _touch_session_activity → UPDATE
-            # 3. select Hearing
-            # 4. select Case with parties (for case_context)
+            # 1. get_owned_case → select Case (hearing joined in)
+            # 2. select case context (party names aggregated in SQL)
+            # 3. select message (role, content, sequence) columns
             db.execute = AsyncMock(side_effect=[
                 case_result,     # get_owned_case
-                _noop_result(),  # _touch_session_activity
-                hearing_result,  # select Hearing
-                case_result,     # select Case with parties
+                _context_result(),  # select case context
+                _transcript_result(),  # select transcript
             ])
             yield db
 
@@ -148,10 +156,10 @@ class TestHearingHTTPMessage:
             case_result = MagicMock()
             case_result.scalar_one_or_none.return_value = mock_case
             case_result.scalar_one.return_value = mock_case
-            hearing_result = MagicMock()
-            hearing_result.scalar_one_or_none.return_value = mock_hearing
+            mock_case.hearing = mock_hearing
             db.execute = AsyncMock(side_effect=[
-                case_result, _noop_result(), hearing_result, case_result,
+                case_result, _context_result(),
+                _transcript_result(),
             ])
             yield db
 
@@ -181,11 +189,8 @@ class TestHearingHTTPErrors:
             db = AsyncMock()
             case_result = MagicMock()
             case_result.scalar_one_or_none.return_value = mock_case
-            hearing_result = MagicMock()
-            hearing_result.scalar_one_or_none.return_value = None
-            db.execute = AsyncMock(side_effect=[
-                case_result, _noop_result(), hearing_result,
-            ])
+            mock_case.hearing = None
+            db.execute = AsyncMock(side_effect=[case_result])
             yield db
 
         app.dependency_overrides[get_db] = override_get_db
@@ -212,11 +217,8 @@ class TestHearingHTTPErrors:
             db = AsyncMock()
             case_result = MagicMock()
             case_result.scalar_one_or_none.return_value = mock_case
-            hearing_result = MagicMock()
-            hearing_result.scalar_one_or_none.return_value = mock_hearing
-            db.execute = AsyncMock(side_effect=[
-                case_result, _noop_result(), hearing_result,
-            ])
+            mock_case.hearing = mock_hearing
+            db.execute = AsyncMock(side_effect=[case_result])
             yield db
 
         app.dependency_overrides[get_db] = override_get_db
@@ -4,6 +4,7 @@ Covers:
 - build_case_context() with various party configurations
 - extract_party_names() defaults and overrides
 - get_next_sequence() with empty and populated hearings
+- stream_transcript() batching
 - process_hearing_exchange() end-to-end with mocked DB and LLM
 - Conclusion detection via the CONCLUSION_MARKER sentinel
 """
@@ -12,11 +13,11 @@ import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from models.database import (
     Case,
     CaseType,
-    Hearing,
     HearingMessage,
     HearingMessageRole,
     Party,
@@ -25,10 +26,14 @@ from models.database import (
 from services.hearing_service import (
     CONCLUSION_MARKER,
     JudgeExchangeResult,
+    JudgeMessageNotSaved,
     build_case_context,
     extract_party_names,
     get_next_sequence,
+    load_case_context,
     process_hearing_exchange,
+    process_hearing_exchange_detached,
+    stream_transcript,
 )
 
 
@@ -55,6 +60,8 @@ def _make_case(
     c.defendant_narrative = defendant_narrative
     c.claimed_amount = claimed_amount
     c.parties = parties or []
+    c.plaintiff = next((p for p in c.parties if p.role == PartyRole.plaintiff), None)
+    c.defendant = next((p for p in c.parties if p.role == PartyRole.defendant), None)
     return c
 
 
@@ -108,6 +115,68 @@ class TestBuildCaseContext:
         assert ctx["claimed_amount"] == 0
 
 
+class TestLoadCaseContext:
+    async def test_matches_build_case_context(self):
+        plaintiff = _make_party(PartyRole.plaintiff, "Alice")
+        defendant = _make_party(PartyRole.defendant, "Bob")
+        case = _make_case(parties=[plaintiff, defendant])
+        db = AsyncMock()
+        result = MagicMock()
+        result.one_or_none.return_value = (
+            case.case_type, case.plaintiff_narrative, case.defendant_narrative,
+            case.claimed_amount, "Alice", "Bob",
+        )
+        db.execute.return_value = result
+
+        ctx = await load_case_context(db, uuid.uuid4())
+
+        assert ctx == build_case_context(case, [plaintiff, defendant])
+        assert db.execute.await_count == 1
+
+    async def test_missing_party_names_use_defaults(self):
+        db = AsyncMock()
+        result = MagicMock()
+        result.one_or_none.return_value = (None, None, None, None, None, None)
+        db.execute.return_value = result
+
+        ctx = await load_case_context(db, uuid.uuid4())
+
+        assert ctx["plaintiff_name"] == "Plaintiff"
+        assert ctx["defendant_name"] == "Defendant"
+        assert ctx["case_type"] == "unknown"
+
+    async def test_unknown_case_returns_none(self):
+        db = AsyncMock()
+        result = MagicMock()
+        result.one_or_none.return_value = None
+        db.execute.return_value = result
+
+        assert await load_case_context(db, uuid.uuid4()) is None
+
+
+class TestStreamTranscript:
+    async def test_yields_cursor_batches(self):
+        batches = [
+            [(HearingMessageRole.judge, "Opening.", 1), (HearingMessageRole.plaintiff, "Hi.", 2)],
+            [(HearingMessageRole.judge, "Go on.", 3)],
+        ]
+
+        async def partitions():
+            for batch in batches:
+                yield batch
+
+        result = MagicMock()
+        result.partitions = partitions
+        db = AsyncMock()
+        db.stream.return_value = result
+
+        received = [batch async for batch in stream_transcript(db, uuid.uuid4(), batch_size=2)]
+
+        assert received == batches
+        stmt = db.stream.await_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == 2
+
+
 # ─── extract_party_names ─────────────────────────────────────────────────────
 
 
@@ -179,29 +248,16 @@ class TestProcessHearingExchange:
         seq_result = MagicMock()
         seq_result.scalar.return_value = 2
 
-        # Second execute: fetch conversation history
-        msg1 = MagicMock()
-        msg1.role = HearingMessageRole.judge
-        msg1.content = "Opening statement"
-        msg1.sequence = 1
-
-        msg2 = MagicMock()
-        msg2.role = HearingMessageRole.plaintiff
-        msg2.content = "My argument"
-        msg2.sequence = 2
-
-        msg3 = MagicMock()
-        msg3.role = HearingMessageRole.plaintiff
-        msg3.content = "Additional details"
-        msg3.sequence = 3
-
+        # Second execute: fetch conversation history as (role, content, sequence)
         history_result = MagicMock()
-        scalars_mock = MagicMock()
-        scalars_mock.all.return_value = [msg1, msg2, msg3]
-        history_result.scalars.return_value = scalars_mock
+        history_result.all.return_value = [
+            (HearingMessageRole.judge, "Opening statement", 1),
+            (HearingMessageRole.plaintiff, "My argument", 2),
+            (HearingMessageRole.plaintiff, "Additional details", 3),
+        ]
 
-        db.execute.side_effect = [seq_result, history_result]
-        db.get.return_value = MagicMock(spec=Hearing)
+        # Third execute (only when the hearing concludes): UPDATE completed_at
+        db.execute.side_effect = [seq_result, history_result, MagicMock()]
 
         return db
 
@@ -247,9 +303,11 @@ class TestProcessHearingExchange:
         )
 
         assert result.concluded is True
-        # The hearing object's completed_at should have been set
-        hearing_obj = await mock_db.get(Hearing, hearing_id)
-        assert hearing_obj.completed_at is not None
+        # completed_at is set with a direct UPDATE rather than a loaded hearing
+        update_stmt = mock_db.execute.await_args.args[0]
+        assert update_stmt.is_update
+        assert update_stmt.table.name == "hearings"
+        mock_db.get.assert_not_awaited()
 
     @patch("services.hearing_service.generate_hearing_message")
     async def test_conclusion_case_insensitive(
@@ -300,12 +358,9 @@ class TestProcessHearingExchange:
         seq_result.scalar.return_value = None  # No messages yet
 
         history_result = MagicMock()
-        scalars_mock = MagicMock()
-        scalars_mock.all.return_value = []
-        history_result.scalars.return_value = scalars_mock
+        history_result.all.return_value = []
 
         db.execute.side_effect = [seq_result, history_result]
-        db.get.return_value = MagicMock(spec=Hearing)
 
         mock_generate.return_value = {"content": "Opening question."}
 
@@ -320,6 +375,56 @@ class TestProcessHearingExchange:
 
         assert result.judge_sequence == 2  # 0 + 2
 
+    @patch("services.hearing_service.generate_hearing_message")
+    async def test_known_last_sequence_skips_max_query(
+        self, mock_generate, mock_db, hearing_id, case_context
+    ):
+        mock_generate.return_value = {"content": "Go on."}
+        # Only the history query should run
+        history_result = MagicMock()
+        history_result.all.return_value = []
+        mock_db.execute.side_effect = [history_result]
+
+        result = await process_hearing_exchange(
+            mock_db,
+            hearing_id=hearing_id,
+            archetype_id="stern",
+            case_context=case_context,
+            user_role=HearingMessageRole.plaintiff,
+            user_content="More testimony.",
+            last_sequence=7,
+        )
+
+        assert result.judge_sequence == 9
+        assert mock_db.execute.await_count == 1
+
+    @patch("services.hearing_service.generate_hearing_message")
+    async def test_known_history_skips_reload_and_is_extended(
+        self, mock_generate, hearing_id, case_context
+    ):
+        db = AsyncMock()
+        mock_generate.return_value = {"content": "Please continue."}
+        history = [{"role": "judge", "content": "Opening statement"}]
+
+        await process_hearing_exchange(
+            db,
+            hearing_id=hearing_id,
+            archetype_id="stern",
+            case_context=case_context,
+            user_role=HearingMessageRole.plaintiff,
+            user_content="My argument.",
+            last_sequence=1,
+            history=history,
+        )
+
+        db.execute.assert_not_awaited()
+        sent = mock_generate.call_args.kwargs["conversation_history"]
+        assert sent == [
+            {"role": "judge", "content": "Opening statement"},
+            {"role": "plaintiff", "content": "My argument."},
+        ]
+        assert history == sent + [{"role": "judge", "content": "Please continue."}]
+
     @patch("services.hearing_service.generate_hearing_message")
     async def test_defendant_role_accepted(
         self, mock_generate, mock_db, hearing_id, case_context
@@ -339,6 +444,169 @@ class TestProcessHearingExchange:
         assert result.judge_content == "Noted."
 
 
+# ─── process_hearing_exchange_detached ────────────────────────────────────────
+
+
+class TestProcessHearingExchangeDetached:
+    @patch("services.hearing_service.generate_hearing_message")
+    async def test_no_session_open_during_llm_call(self, mock_generate):
+        events = []
+
+        class _Session:
+            def __init__(self):
+                self.add = MagicMock()
+                self.execute = AsyncMock()
+
+            async def __aenter__(self):
+                events.append("open")
+                return self
+
+            async def __aexit__(self, *exc):
+                events.append("close")
+
+            async def commit(self):
+                events.append("commit")
+
+        async def _generate(**kwargs):
+            events.append("llm")
+            return {"content": "This hearing is now concluded."}
+
+        mock_generate.side_effect = _generate
+        history = [{"role": "judge", "content": "Opening statement"}]
+
+        result = await process_hearing_exchange_detached(
+            _Session,
+            hearing_id=uuid.uuid4(),
+            archetype_id="stern",
+            case_context={},
+            user_role=HearingMessageRole.plaintiff,
+            user_content="My argument.",
+            last_sequence=1,
+            history=history,
+        )
+
+        assert events == ["open", "commit", "close", "llm", "open", "commit", "close"]
+        assert result.judge_sequence == 3
+        assert result.concluded is True
+        assert [turn["role"] for turn in history] == ["judge", "plaintiff", "judge"]
+
+    @staticmethod
+    def _racing_session(added, commit_errors):
+        """Session class whose commits raise ``commit_errors`` in turn.
+
+        Reads report that another tab has written sequences 2-4 meanwhile.
+        """
+        commits = iter(commit_errors)
+        result = MagicMock()
+        result.scalar.return_value = 4
+        result.all.return_value = [
+            (HearingMessageRole.judge, "Opening statement", 1),
+            (HearingMessageRole.defendant, "Other tab", 2),
+            (HearingMessageRole.judge, "Noted.", 3),
+            (HearingMessageRole.plaintiff, "Other tab again", 4),
+            (HearingMessageRole.plaintiff, "My argument.", 5),
+        ]
+
+        class _Session:
+            def __init__(self):
+                self.add = added.append
+                self.execute = AsyncMock(return_value=result)
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                pass
+
+            async def commit(self):
+                error = next(commits, None)
+                if error is not None:
+                    raise error
+
+        return _Session
+
+    @patch("services.hearing_service.generate_hearing_message")
+    async def test_retries_after_max_sequence_when_sequence_taken(self, mock_generate):
+        added = []
+        duplicate = IntegrityError("INSERT", {}, Exception("duplicate key"))
+        mock_generate.return_value = {"content": "Go on."}
+        history = [{"role": "judge", "content": "Opening statement"}]
+
+        result = await process_hearing_exchange_detached(
+            self._racing_session(added, [duplicate]),
+            hearing_id=uuid.uuid4(),
+            archetype_id="stern",
+            case_context={},
+            user_role=HearingMessageRole.plaintiff,
+            user_content="My argument.",
+            last_sequence=1,
+            history=history,
+        )
+
+        assert [msg.sequence for msg in added] == [2, 5, 6]
+        assert result.judge_sequence == 6
+        # The judge is prompted with the saved transcript, other tab included
+        prompted = mock_generate.call_args.kwargs["conversation_history"]
+        assert [turn["content"] for turn in prompted] == [
+            "Opening statement", "Other tab", "Noted.", "Other tab again", "My argument.",
+        ]
+        assert history[-1] == {"role": "judge", "content": "Go on."}
+
+    @patch("services.hearing_service.generate_hearing_message")
+    async def test_judge_write_losing_twice_raises_distinct_error(self, mock_generate):
+        added = []
+        duplicate = IntegrityError("INSERT", {}, Exception("duplicate key"))
+        mock_generate.return_value = {"content": "Go on."}
+
+        with pytest.raises(JudgeMessageNotSaved):
+            await process_hearing_exchange_detached(
+                self._racing_session(added, [None, duplicate, duplicate]),
+                hearing_id=uuid.uuid4(),
+                archetype_id="stern",
+                case_context={},
+                user_role=HearingMessageRole.plaintiff,
+                user_content="My argument.",
+                last_sequence=1,
+                history=[],
+            )
+
+        assert [msg.sequence for msg in added] == [2, 3, 5]
+
+    @patch("services.hearing_service.generate_hearing_message_stream")
+    async def test_streams_reply_through_on_delta(self, mock_stream):
+        session = AsyncMock()
+        session.add = MagicMock()
+        session.__aenter__.return_value = session
+
+        async def _chunks(**kwargs):
+            for text in ("Please ", "continue."):
+                yield text
+
+        mock_stream.side_effect = _chunks
+        deltas = []
+
+        async def _on_delta(text):
+            deltas.append(text)
+
+        result = await process_hearing_exchange_detached(
+            lambda: session,
+            hearing_id=uuid.uuid4(),
+            archetype_id="stern",
+            case_context={},
+            user_role=HearingMessageRole.plaintiff,
+            user_content="My argument.",
+            last_sequence=1,
+            history=[],
+            on_delta=_on_delta,
+        )
+
+        assert deltas == ["Please ", "continue."]
+        assert result.judge_content == "Please continue."
+        saved = session.add.call_args.args[0]
+        assert saved.content == "Please continue."
+        assert saved.sequence == 3
+
+
 # ─── CONCLUSION_MARKER constant ──────────────────────────────────────────────
 
 
@@ -10,13 +10,13 @@ class _FakeResult:
     def __init__(self, value):
         self._value = value
 
-    def scalar_one_or_none(self):
+    def one_or_none(self):
         return self._value
 
 
 class _FakeDB:
     async def execute(self, *args, **kwargs):
-        # First query in websocket handler checks for Hearing by case_id.
+        # First query in websocket handler loads the (Hearing, Case) row.
         # Returning None triggers an error payload and graceful close.
         return _FakeResult(None)
 
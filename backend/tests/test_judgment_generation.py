@@ -0,0 +1,134 @@
+"""Tests for the writes POST /cases/{case_id}/judgment makes.
+
+After the pipeline runs, the endpoint should issue exactly: the judgment
+INSERT ... ON CONFLICT DO NOTHING RETURNING, one executemany for the LLM call
+rows, and one flush for the case update — no ORM add per row and no refresh.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+import api.judgment as judgment_api
+import services.judgment_helpers as helpers
+from models.database import Case, CaseStatus, Judgment
+from models.schemas import JudgmentRequest
+
+
+@pytest.fixture(autouse=True)
+def _clear_pipeline_cache():
+    helpers._pipeline_cache.clear()
+    yield
+    helpers._pipeline_cache.clear()
+
+
+def _make_case():
+    case = MagicMock(spec=Case)
+    case.id = uuid.uuid4()
+    case.plaintiff_narrative = "I paid a deposit."
+    case.defendant_narrative = "The unit was damaged."
+    case.claimed_amount = None
+    case.case_type = None
+    case.plaintiff = None
+    case.defendant = None
+    return case
+
+
+def _llm_call(step):
+    return {
+        "pipeline_step": step,
+        "model": "claude-sonnet",
+        "input_tokens": 100,
+        "output_tokens": 50,
+        "cost_usd": 0.0125,
+        "latency_ms": 400,
+    }
+
+
+def _pipeline_result():
+    return {
+        "judgment": {"in_favor_of": "plaintiff", "judgment_text": "Judgment for plaintiff."},
+        "classification": {"primary_type": "contract", "primary_confidence": 0.9},
+        "pipeline_metadata": {
+            "llm_calls": [_llm_call("fact_extraction"), _llm_call("reasoning")],
+        },
+    }
+
+
+def _make_db(inserted):
+    precheck = MagicMock()
+    precheck.scalar_one_or_none.return_value = None
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.execute = AsyncMock(side_effect=[precheck, MagicMock()])
+    db.scalar = AsyncMock(return_value=inserted)
+    return db
+
+
+async def _generate(db, case):
+    with (
+        patch.object(judgment_api.judgment_limiter, "check", AsyncMock()),
+        patch.object(
+            judgment_api, "get_case_and_hearing_context", AsyncMock(return_value=(case, None))
+        ),
+        patch.object(judgment_api, "run_pipeline", AsyncMock(return_value=_pipeline_result())),
+    ):
+        return await judgment_api.generate_judgment(
+            case_id=case.id,
+            body=JudgmentRequest(archetype_id="strict"),
+            session_id=str(uuid.uuid4()),
+            db=db,
+        )
+
+
+async def test_writes_in_one_insert_one_executemany_one_flush():
+    case = _make_case()
+    inserted = MagicMock(spec=Judgment)
+    db = _make_db(inserted)
+
+    result = await _generate(db, case)
+
+    assert result is inserted
+    insert_stmt = db.scalar.await_args.args[0]
+    assert insert_stmt.is_insert
+    # precheck SELECT + LLM call executemany
+    assert db.execute.await_count == 2
+    llm_rows = db.execute.await_args_list[1].args[1]
+    assert [row["pipeline_step"] for row in llm_rows] == ["fact_extraction", "reasoning"]
+    assert db.flush.await_count == 1
+    db.refresh.assert_not_awaited()
+    db.add.assert_not_called()
+    assert case.status == CaseStatus.decided
+
+
+async def test_conflicting_insert_returns_409():
+    case = _make_case()
+    db = _make_db(None)  # a concurrent request inserted the judgment first
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _generate(db, case)
+
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.detail["error"]["code"] == "judgment_exists"
+    assert db.execute.await_count == 1  # no LLM rows written
+
+
+async def test_cached_pipeline_result_logs_zero_cost_calls_for_the_case():
+    await _generate(_make_db(MagicMock(spec=Judgment)), _make_case())
+
+    # Identical narratives on another case are served from the pipeline cache
+    case = _make_case()
+    retry_db = _make_db(MagicMock(spec=Judgment))
+    await _generate(retry_db, case)
+
+    # The new case still gets call rows (so its metadata exists), but the
+    # spend was logged by the request that ran the pipeline
+    assert retry_db.execute.await_count == 2
+    llm_rows = retry_db.execute.await_args_list[1].args[1]
+    assert [row["pipeline_step"] for row in llm_rows] == [
+        "cached:fact_extraction", "cached:reasoning",
+    ]
+    assert all(row["case_id"] == case.id for row in llm_rows)
+    assert all(row["cost_usd"] == 0 and row["input_tokens"] == 0 for row in llm_rows)
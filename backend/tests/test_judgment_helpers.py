@@ -0,0 +1,50 @@
+"""Tests for services/judgment_helpers.py transcript and winner helpers."""
+
+from unittest.mock import MagicMock
+
+from models.database import Hearing, HearingMessage, HearingMessageRole, PartyRole
+from services.judgment_helpers import derive_winner, extract_hearing_transcript
+
+
+def _message(role, content, sequence):
+    m = MagicMock(spec=HearingMessage)
+    m.role = role
+    m.content = content
+    m.sequence = sequence
+    return m
+
+
+class TestExtractHearingTranscript:
+    def test_relationship_loads_messages_in_sequence_order(self):
+        # extract_hearing_transcript relies on this instead of sorting
+        order_by = Hearing.messages.property.order_by
+        assert [col.key for col in order_by] == ["sequence"]
+
+    def test_keeps_loaded_order(self):
+        hearing = MagicMock(spec=Hearing)
+        hearing.messages = [
+            _message(HearingMessageRole.judge, "Opening.", 1),
+            _message(HearingMessageRole.plaintiff, "My claim.", 2),
+            _message(HearingMessageRole.defendant, "My reply.", 3),
+        ]
+
+        assert extract_hearing_transcript(hearing) == [
+            {"role": "judge", "content": "Opening."},
+            {"role": "plaintiff", "content": "My claim."},
+            {"role": "defendant", "content": "My reply."},
+        ]
+
+    def test_no_hearing_or_messages_is_none(self):
+        hearing = MagicMock(spec=Hearing)
+        hearing.messages = []
+
+        assert extract_hearing_transcript(None) is None
+        assert extract_hearing_transcript(hearing) is None
+
+
+class TestDeriveWinner:
+    def test_plaintiff_mentions_win_for_plaintiff(self):
+        assert derive_winner("Plaintiff (in part)") is PartyRole.plaintiff
+
+    def test_missing_value_defaults_to_defendant(self):
+        assert derive_winner(None) is PartyRole.defendant
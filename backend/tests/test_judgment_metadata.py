@@ -0,0 +1,102 @@
+"""Tests for GET /cases/{case_id}/judgment/metadata.
+
+Totals and the paginated call list come back from one statement.
+"""
+
+import uuid
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from db.connection import get_db
+from main import app
+from models.database import Case, LLMCall
+
+
+def _make_case(case_id, session_id):
+    c = MagicMock(spec=Case)
+    c.id = case_id
+    c.session_id = uuid.UUID(session_id)
+    return c
+
+
+def _make_call(step):
+    call = MagicMock(spec=LLMCall)
+    call.pipeline_step = step
+    call.model = "claude-sonnet"
+    call.input_tokens = 100
+    call.output_tokens = 50
+    call.cost_usd = Decimal("0.0125")
+    call.latency_ms = 400
+    return call
+
+
+def _get_metadata(db, case_id, session_id, query=""):
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as client:
+            return client.get(
+                f"/cases/{case_id}/judgment/metadata{query}",
+                headers={"X-Session-Id": session_id},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _db_with_rows(case_id, session_id, rows):
+    case_result = MagicMock()
+    case_result.scalar_one_or_none.return_value = _make_case(case_id, session_id)
+    metadata_result = MagicMock()
+    metadata_result.all.return_value = rows
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[case_result, metadata_result])
+    return db
+
+
+def test_totals_and_page_in_one_query():
+    session_id = str(uuid.uuid4())
+    case_id = uuid.uuid4()
+    totals = (Decimal("0.05"), 1600, 400, 200, 4)
+    db = _db_with_rows(
+        case_id,
+        session_id,
+        [(*totals, _make_call("fact_extraction")), (*totals, _make_call("classification"))],
+    )
+
+    response = _get_metadata(db, case_id, session_id, "?limit=2")
+
+    assert response.status_code == 200
+    body = response.json()
+    # case SELECT + one metadata SELECT
+    assert db.execute.await_count == 2
+    assert body["total_calls"] == 4
+    assert body["total_latency_ms"] == 1600
+    assert [c["step"] for c in body["calls"]] == ["fact_extraction", "classification"]
+
+
+def test_offset_past_end_keeps_totals():
+    session_id = str(uuid.uuid4())
+    case_id = uuid.uuid4()
+    db = _db_with_rows(case_id, session_id, [(Decimal("0.05"), 1600, 400, 200, 4, None)])
+
+    response = _get_metadata(db, case_id, session_id, "?offset=10")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_calls"] == 4
+    assert body["calls"] == []
+
+
+def test_no_calls_returns_404():
+    session_id = str(uuid.uuid4())
+    case_id = uuid.uuid4()
+    db = _db_with_rows(case_id, session_id, [(0, 0, 0, 0, 0, None)])
+
+    response = _get_metadata(db, case_id, session_id)
+
+    assert response.status_code == 404
+    assert response.json()["error"]["code"] == "judgment_metadata_not_found"
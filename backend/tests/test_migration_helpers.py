@@ -0,0 +1,31 @@
+"""Tests for db.migration_helpers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import db.migration_helpers as helpers
+
+
+def test_index_build_settings_are_reset_when_the_build_fails():
+    op = MagicMock()
+
+    def execute(sql):
+        if sql.startswith("CREATE INDEX"):
+            raise RuntimeError("could not create index")
+
+    op.execute.side_effect = execute
+
+    with patch.object(helpers, "op", op), pytest.raises(RuntimeError):
+        helpers.build_index_with_tuning(
+            "CREATE INDEX CONCURRENTLY ix ON corpus_chunks (embedding)",
+            maintenance_work_mem="4GB",
+            parallel_workers=8,
+        )
+
+    statements = [call.args[0] for call in op.execute.call_args_list]
+    assert statements[-3:] == [
+        "RESET max_parallel_workers",
+        "RESET max_parallel_maintenance_workers",
+        "RESET maintenance_work_mem",
+    ]
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
 
 from db.connection import get_db
 from main import app
@@ -18,7 +19,6 @@ from models.database import (
     Case,
     CaseStatus,
     CaseType,
-    Hearing,
     Party,
     PartyRole,
     Session,
@@ -63,41 +63,33 @@ def _make_db_for_party_duplicate(mock_case, existing_party):
 
     Call order:
     1. get_owned_case → select Case
-    2. _touch_session_activity → UPDATE sessions
-    3. add_party → select Party (duplicate check)
+    2. add_party → select Party (duplicate check)
     """
     db = AsyncMock()
     case_result = MagicMock()
     case_result.scalar_one_or_none.return_value = mock_case
 
-    activity_result = MagicMock()  # _touch_session_activity UPDATE
-
     party_result = MagicMock()
     party_result.scalar_one_or_none.return_value = existing_party
 
-    db.execute = AsyncMock(side_effect=[case_result, activity_result, party_result])
+    db.execute = AsyncMock(side_effect=[case_result, party_result])
     return db
 
 
-def _make_db_for_hearing_duplicate(mock_case, existing_hearing):
-    """Build an AsyncMock DB where get_owned_case succeeds, hearing check finds duplicate.
+def _make_db_for_hearing_duplicate(mock_case):
+    """Build an AsyncMock DB where get_owned_case succeeds, hearing insert conflicts.
 
     Call order:
     1. get_owned_case → select Case (with selectinload for parties)
-    2. _touch_session_activity → UPDATE sessions
-    3. start_hearing → select Hearing (duplicate check)
+    2. start_hearing → INSERT Hearing ON CONFLICT DO NOTHING (returns no row)
     """
     db = AsyncMock()
     case_result = MagicMock()
     case_result.scalar_one_or_none.return_value = mock_case
     case_result.scalar_one.return_value = mock_case
 
-    activity_result = MagicMock()
-
-    hearing_result = MagicMock()
-    hearing_result.scalar_one_or_none.return_value = existing_hearing
-
-    db.execute = AsyncMock(side_effect=[case_result, activity_result, hearing_result])
+    db.execute = AsyncMock(side_effect=[case_result])
+    db.scalar = AsyncMock(return_value=None)
     return db
 
 
@@ -164,13 +156,10 @@ class TestPartyDuplicate:
 class TestHearingDuplicate:
     def test_duplicate_hearing_returns_409(self, session_id, case_id, headers):
         mock_case = _make_case(case_id, session_id)
-        existing_hearing = MagicMock(spec=Hearing)
-        existing_hearing.id = uuid.uuid4()
-        existing_hearing.case_id = case_id
-        existing_hearing.archetype_id = "stern"
+        db = _make_db_for_hearing_duplicate(mock_case)
 
         async def override_get_db():
-            yield _make_db_for_hearing_duplicate(mock_case, existing_hearing)
+            yield db
 
         app.dependency_overrides[get_db] = override_get_db
         try:
@@ -186,3 +175,6 @@ class TestHearingDuplicate:
         assert response.status_code == 409
         body = response.json()
         assert body["error"]["code"] == "hearing_exists"
+        insert_stmt = db.scalar.call_args.args[0]
+        assert insert_stmt.is_insert
+        assert "ON CONFLICT" in str(insert_stmt.compile(dialect=postgresql.dialect()))
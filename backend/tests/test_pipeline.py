@@ -502,10 +502,37 @@ class TestJudicialReasoning:
         )
 
         assert "reasoning" in result
-        # Verify transcript was included
-        user_msg = mock_anthropic.call_args.kwargs["messages"][0]["content"]
-        assert "HEARING TRANSCRIPT" in user_msg
-        assert "I paid a deposit." in user_msg
+        # Verify transcript was included in the shared (cached) case block
+        case_block = mock_anthropic.call_args.kwargs["system"][1]
+        assert "HEARING TRANSCRIPT" in case_block["text"]
+        assert "I paid a deposit." in case_block["text"]
+        assert case_block["cache_control"] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    @patch("engine.reasoning_engine.call_anthropic", new_callable=AsyncMock)
+    async def test_case_block_is_identical_across_judges(self, mock_anthropic):
+        from engine.reasoning_engine import generate_reasoning
+
+        mock_anthropic.return_value = _anthropic_response(SAMPLE_REASONING)
+        rules = {"claim_elements": {}, "static_rules": {}, "retrieved_corpus": []}
+
+        systems = []
+        for archetype in (
+            {"id": "strict", "name": "Judge Morrison", "personality_prompt": "Strict."},
+            {"id": "practical", "name": "Judge Dawson", "personality_prompt": "Practical."},
+        ):
+            await generate_reasoning(
+                extracted_facts=SAMPLE_FACTS,
+                classification=SAMPLE_CLASSIFICATION,
+                applicable_rules=rules,
+                evidence_scores=SAMPLE_SCORES,
+                archetype=archetype,
+            )
+            systems.append(mock_anthropic.call_args.kwargs["system"])
+
+        # Everything up to the cache breakpoint is shared; only the judge block differs
+        assert systems[0][:2] == systems[1][:2]
+        assert systems[0][2] != systems[1][2]
 
     @pytest.mark.asyncio
     @patch("engine.reasoning_engine.call_anthropic", new_callable=AsyncMock)
@@ -846,6 +873,72 @@ class TestPipelineOrchestrator:
             )
 
 
+    @pytest.mark.asyncio
+    @patch("engine.pipeline.generate_advisory", new_callable=AsyncMock)
+    @patch("engine.pipeline.generate_decision", new_callable=AsyncMock)
+    @patch("engine.pipeline.generate_reasoning", new_callable=AsyncMock)
+    @patch("engine.pipeline.score_evidence", new_callable=AsyncMock)
+    @patch("engine.pipeline.get_applicable_rules", new_callable=AsyncMock)
+    @patch("engine.pipeline.classify_issues", new_callable=AsyncMock)
+    @patch("engine.pipeline.extract_facts", new_callable=AsyncMock)
+    async def test_pipeline_reuses_case_analysis(
+        self,
+        mock_extract,
+        mock_classify,
+        mock_rules,
+        mock_score,
+        mock_reasoning,
+        mock_decision,
+        mock_advisory,
+    ):
+        from engine.pipeline import run_pipeline
+
+        mock_score.return_value = {
+            "scores": SAMPLE_SCORES,
+            "llm_metadata": {**MOCK_LLM_METADATA, "pipeline_step": "evidence_scoring"},
+        }
+        mock_reasoning.return_value = {
+            "reasoning": SAMPLE_REASONING,
+            "llm_metadata": {**MOCK_LLM_METADATA, "pipeline_step": "judicial_reasoning"},
+        }
+        mock_decision.return_value = {
+            "decision": SAMPLE_DECISION,
+            "llm_metadata": {**MOCK_LLM_METADATA, "pipeline_step": "decision_generation"},
+        }
+        mock_advisory.return_value = {
+            "advisory": SAMPLE_ADVISORY,
+            "llm_metadata": {**MOCK_LLM_METADATA, "pipeline_step": "case_advisory"},
+        }
+        case_analysis = {
+            "facts": SAMPLE_FACTS,
+            "classification": SAMPLE_CLASSIFICATION,
+            "rules": {
+                "static_rules": {},
+                "claim_elements": {"elements": [], "damages_measure": ""},
+                "retrieved_corpus": [],
+            },
+            "llm_calls": [{**MOCK_LLM_METADATA, "pipeline_step": "fact_extraction"}],
+        }
+
+        result = await run_pipeline(
+            db=AsyncMock(),
+            plaintiff_narrative="Story.",
+            defendant_narrative="Story.",
+            archetype_id="strict",
+            case_analysis=case_analysis,
+        )
+
+        mock_extract.assert_not_called()
+        mock_classify.assert_not_called()
+        mock_rules.assert_not_called()
+        assert result["extracted_facts"] == SAMPLE_FACTS
+        # The shared steps' calls are accounted for by whoever ran them
+        steps = [c["pipeline_step"] for c in result["pipeline_metadata"]["llm_calls"]]
+        assert steps == [
+            "evidence_scoring", "judicial_reasoning", "decision_generation", "case_advisory",
+        ]
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Archetypes
 # ═══════════════════════════════════════════════════════════════════════
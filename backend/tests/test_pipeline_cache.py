@@ -0,0 +1,91 @@
+"""Tests for the in-process pipeline result cache."""
+
+import asyncio
+
+import pytest
+
+import services.judgment_helpers as helpers
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    helpers._pipeline_cache.clear()
+    yield
+    helpers._pipeline_cache.clear()
+
+
+def _key(**overrides):
+    inputs = {
+        "plaintiff_narrative": "I paid a deposit.",
+        "defendant_narrative": "The unit was damaged.",
+        "plaintiff_name": "Alice",
+        "defendant_name": "Bob",
+        "claimed_amount": 1500.0,
+        "archetype_id": "strict",
+        "hearing_transcript": None,
+    }
+    inputs.update(overrides)
+    return helpers.pipeline_cache_key(**inputs)
+
+
+class TestPipelineCacheKey:
+    def test_stable_for_identical_inputs(self):
+        assert _key() == _key()
+
+    def test_varies_with_archetype_and_transcript(self):
+        assert _key() != _key(archetype_id="practical")
+        assert _key() != _key(hearing_transcript=[{"role": "judge", "content": "Hi"}])
+
+
+class TestCachedPipelineResult:
+    async def test_second_call_is_served_from_cache(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"judgment": {}}
+
+        first, computed_first = await helpers.cached_pipeline_result("k", compute)
+        second, computed_second = await helpers.cached_pipeline_result("k", compute)
+
+        assert (computed_first, computed_second) == (True, False)
+        assert second is first
+        assert len(calls) == 1
+
+    async def test_concurrent_misses_run_once(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"judgment": {}}
+
+        outcomes = await asyncio.gather(
+            *(helpers.cached_pipeline_result("k", compute) for _ in range(3))
+        )
+
+        assert len(calls) == 1
+        assert sorted(computed for _, computed in outcomes) == [False, False, True]
+        assert helpers._pipeline_locks == {}
+
+    async def test_refresh_recomputes_and_replaces(self):
+        await helpers.cached_pipeline_result("k", lambda: _value("old"))
+
+        result, computed = await helpers.cached_pipeline_result(
+            "k", lambda: _value("new"), refresh=True
+        )
+
+        assert computed is True
+        assert result == {"v": "new"}
+        assert helpers.get_cached_pipeline_result("k") == {"v": "new"}
+
+    def test_expired_entries_are_dropped(self, monkeypatch):
+        helpers._store_pipeline_result("k", {"v": 1})
+        monkeypatch.setattr(helpers, "_PIPELINE_CACHE_TTL_SECONDS", 0)
+
+        assert helpers.get_cached_pipeline_result("k") is None
+        assert "k" not in helpers._pipeline_cache
+
+
+async def _value(v):
+    return {"v": v}
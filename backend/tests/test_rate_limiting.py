@@ -1,4 +1,4 @@
-"""Tests for the admin login rate limiter and FixedWindowRateLimiter.
+"""Tests for the admin login rate limiter and SlidingWindowRateLimiter.
 
 Covers:
 - Rate limiter allows requests within the limit
@@ -6,25 +6,27 @@ Covers:
 - Rate limiter resets after the window expires
 - Admin login endpoint enforces rate limiting
 - Per-key isolation (different sessions don't share limits)
+- No doubled burst across a window boundary (in-process and Redis)
 """
 
 import asyncio
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import HTTPException
 
-from api.guardrails import FixedWindowRateLimiter
+import api.guardrails as guardrails
+from api.guardrails import SlidingWindowRateLimiter
 
 
-# ─── FixedWindowRateLimiter Unit Tests ────────────────────────────────────────
+# ─── SlidingWindowRateLimiter Unit Tests ───────────────────────────────────────
 
 
-class TestFixedWindowRateLimiter:
+class TestSlidingWindowRateLimiter:
     @pytest.fixture()
     def limiter(self):
-        return FixedWindowRateLimiter(max_requests=3, window_seconds=60)
+        return SlidingWindowRateLimiter(max_requests=3, window_seconds=60)
 
     async def test_allows_up_to_limit(self, limiter):
         for _ in range(3):
@@ -51,7 +53,7 @@ class TestFixedWindowRateLimiter:
         await limiter.check("user2", code="test", message="Too many")
 
     async def test_window_expiry_resets_count(self):
-        limiter = FixedWindowRateLimiter(max_requests=2, window_seconds=1)
+        limiter = SlidingWindowRateLimiter(max_requests=2, window_seconds=1)
 
         await limiter.check("user1", code="test", message="Too many")
         await limiter.check("user1", code="test", message="Too many")
@@ -67,7 +69,7 @@ class TestFixedWindowRateLimiter:
         await limiter.check("user1", code="test", message="Too many")
 
     async def test_single_request_allowed(self):
-        limiter = FixedWindowRateLimiter(max_requests=1, window_seconds=60)
+        limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=60)
         await limiter.check("key", code="test", message="Blocked")
 
         with pytest.raises(HTTPException):
@@ -83,6 +85,73 @@ class TestFixedWindowRateLimiter:
         assert exc_info.value.detail["error"]["message"] == "Custom message"
         assert exc_info.value.detail["error"]["code"] == "rate_limited"
 
+    async def test_idle_locks_swept_when_table_grows(self, monkeypatch):
+        monkeypatch.setattr(SlidingWindowRateLimiter, "_MAX_LOCKS", 2)
+        limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=60)
+        await limiter.check("active", code="test", message="Too many")
+        limiter._get_lock("idle")  # lock without any recorded events
+
+        limiter._get_lock("new")
+
+        assert set(limiter._locks) == {"active", "new"}
+
+    async def test_no_double_burst_across_window_boundary(self):
+        limiter = SlidingWindowRateLimiter(max_requests=4, window_seconds=60)
+        with patch("api.guardrails.time.monotonic", return_value=6000 + 59):
+            for _ in range(4):
+                await limiter.check("user1", code="test", message="Too many")
+        # Just past the boundary the previous window still counts almost
+        # fully, so a fixed window's fresh allowance of 4 is not granted
+        allowed = 0
+        with patch("api.guardrails.time.monotonic", return_value=6060 + 1):
+            for _ in range(4):
+                try:
+                    await limiter.check("user1", code="test", message="Too many")
+                    allowed += 1
+                except HTTPException:
+                    pass
+        assert allowed == 1
+
+
+class TestRedisRateLimiter:
+    def _limiter(self, allowed):
+        hit = AsyncMock(return_value=allowed)
+        client = MagicMock()
+        client.register_script.return_value = hit
+        with patch.object(guardrails, "_redis_client", return_value=client):
+            limiter = guardrails.RedisSlidingWindowRateLimiter(
+                4, 60, redis_url="redis://localhost:6379/0"
+            )
+        return limiter, hit
+
+    async def test_weights_previous_window(self):
+        limiter, hit = self._limiter(1)
+
+        with patch("api.guardrails.time.time", return_value=6000 + 15):
+            await limiter.check("user1", code="test", message="Too many")
+
+        keys, args = hit.await_args.kwargs["keys"], hit.await_args.kwargs["args"]
+        assert keys == ["rl:test:user1:100", "rl:test:user1:99"]
+        assert args == [120, repr(0.75), 4]
+
+    async def test_rejected_hit_raises_429(self):
+        limiter, _ = self._limiter(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check("user1", code="test", message="Too many")
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.detail["error"]["details"]["limit"] == 4
+
+    def test_missing_redis_package_falls_back_to_in_process(self):
+        settings = MagicMock(redis_url="redis://localhost:6379/0")
+        with (
+            patch.object(guardrails, "get_settings", return_value=settings),
+            patch.object(guardrails, "_redis_client", side_effect=ImportError("redis")),
+        ):
+            limiter = guardrails.make_rate_limiter(4, 60)
+
+        assert isinstance(limiter, SlidingWindowRateLimiter)
+
 
 # ─── Admin Login Rate Limit Integration ───────────────────────────────────────
 
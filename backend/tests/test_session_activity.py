@@ -0,0 +1,113 @@
+"""Tests for the write-behind sessions.last_active tracking."""
+
+import contextlib
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import api.security as security
+
+
+@pytest.fixture(autouse=True)
+def _clear_activity_state():
+    security._session_activity_cache.clear()
+    security._pending_activity.clear()
+    yield
+    security._session_activity_cache.clear()
+    security._pending_activity.clear()
+
+
+def _sessionmaker(db):
+    @contextlib.asynccontextmanager
+    async def _session():
+        yield db
+
+    return _session
+
+
+def test_touch_queues_once_per_interval():
+    session_uuid = uuid.uuid4()
+
+    security._touch_session_activity(session_uuid)
+    assert security._pending_activity == {session_uuid}
+    security._pending_activity.clear()
+    security._touch_session_activity(session_uuid)  # within the interval
+
+    assert security._pending_activity == set()
+
+
+def test_first_touch_queues_even_soon_after_boot():
+    session_uuid = uuid.uuid4()
+
+    # monotonic() below the touch interval, as on a host up for minutes
+    with patch("api.security.time.monotonic", return_value=5.0):
+        security._touch_session_activity(session_uuid)
+
+    assert security._pending_activity == {session_uuid}
+
+
+def test_retouch_moves_session_to_newest():
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    with patch.object(security, "_ACTIVITY_TOUCH_INTERVAL", 0):
+        security._touch_session_activity(first)
+        security._touch_session_activity(second)
+        security._touch_session_activity(first)
+
+    assert list(security._session_activity_cache) == [second, first]
+
+
+def test_eviction_keeps_most_recently_touched():
+    sessions = [uuid.uuid4() for _ in range(5)]
+
+    with (
+        patch.object(security, "_ACTIVITY_TOUCH_INTERVAL", 0),
+        patch.object(security, "_ACTIVITY_CACHE_MAX_SIZE", 4),
+    ):
+        for session_uuid in sessions[:4]:
+            security._touch_session_activity(session_uuid)
+        security._touch_session_activity(sessions[0])  # now newest
+        security._touch_session_activity(sessions[4])  # overflows
+
+    assert list(security._session_activity_cache) == [sessions[3], sessions[0], sessions[4]]
+
+
+async def test_flush_writes_queued_sessions_in_one_update():
+    sessions = {uuid.uuid4() for _ in range(3)}
+    for session_uuid in sessions:
+        security._touch_session_activity(session_uuid)
+    db = AsyncMock()
+
+    with patch.object(security, "AsyncSessionLocal", _sessionmaker(db)):
+        flushed = await security.flush_session_activity()
+
+    assert flushed == 3
+    db.execute.assert_awaited_once()
+    assert set(db.execute.await_args.args[1]["ids"]) == sessions
+    db.commit.assert_awaited_once()
+    assert security._pending_activity == set()
+
+
+async def test_failed_flush_requeues_sessions():
+    session_uuid = uuid.uuid4()
+    security._touch_session_activity(session_uuid)
+    db = AsyncMock()
+    db.execute.side_effect = ConnectionError("database unavailable")
+
+    with (
+        patch.object(security, "AsyncSessionLocal", _sessionmaker(db)),
+        pytest.raises(ConnectionError),
+    ):
+        await security.flush_session_activity()
+
+    assert security._pending_activity == {session_uuid}
+
+
+async def test_flush_with_nothing_queued_skips_the_database():
+    db = AsyncMock()
+
+    with patch.object(security, "AsyncSessionLocal", _sessionmaker(db)):
+        assert await security.flush_session_activity() == 0
+
+    db.execute.assert_not_awaited()
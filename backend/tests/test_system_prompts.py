@@ -0,0 +1,62 @@
+"""Tests for the hearing system prompt built in prompts/system_prompts.py."""
+
+from prompts.system_prompts import _hearing_request
+
+
+def _context(**overrides):
+    ctx = {
+        "case_type": "contract",
+        "plaintiff_name": "Alice",
+        "plaintiff_narrative": "I paid a deposit.",
+        "defendant_name": "Bob",
+        "defendant_narrative": "The unit was damaged.",
+        "claimed_amount": 1500.0,
+    }
+    ctx.update(overrides)
+    return ctx
+
+
+HISTORY = [
+    {"role": "judge", "content": "Please begin."},
+    {"role": "plaintiff", "content": "I want my deposit back."},
+]
+
+
+class TestHearingRequest:
+    def test_persona_prefix_is_identical_across_cases(self):
+        first, _, _ = _hearing_request("strict", _context(), HISTORY)
+        second, _, _ = _hearing_request(
+            "strict", _context(plaintiff_name="Carol", claimed_amount=20.0), HISTORY
+        )
+
+        assert first[0] == second[0]
+        assert first[1] != second[1]
+        assert "Carol" in second[1]["text"]
+
+    def test_case_block_is_the_cached_tail(self):
+        system, _, _ = _hearing_request("strict", _context(), HISTORY)
+
+        assert "cache_control" not in system[0]
+        assert system[-1]["cache_control"] == {"type": "ephemeral"}
+        assert "$1,500.00" in system[-1]["text"]
+
+    def test_unknown_archetype_falls_back_to_common_sense(self):
+        fallback, _, opening = _hearing_request("no_such_judge", _context(), [])
+        common_sense, _, expected_opening = _hearing_request("common_sense", _context(), [])
+
+        assert fallback == common_sense
+        assert opening == expected_opening
+
+    def test_first_turn_has_no_messages(self):
+        _, messages, opening = _hearing_request("practical", _context(), [])
+
+        assert messages is None
+        assert opening
+
+    def test_party_turns_are_prefixed(self):
+        _, messages, _ = _hearing_request("practical", _context(), HISTORY)
+
+        assert messages == [
+            {"role": "assistant", "content": "Please begin."},
+            {"role": "user", "content": "[PLAINTIFF]: I want my deposit back."},
+        ]
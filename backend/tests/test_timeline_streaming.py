@@ -0,0 +1,96 @@
+"""Tests for streamed timeline responses (JSON array and ?stream=true NDJSON)."""
+
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from db.connection import get_db
+from main import app
+from models.database import Case
+
+
+class _AsyncRows:
+    def __init__(self, rows):
+        self._rows = iter(rows)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._rows)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _make_event(case_id, description):
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        case_id=case_id,
+        event_date=now,
+        description=description,
+        source=None,
+        disputed=False,
+        created_at=now,
+    )
+
+
+def _get_timeline(case_id, stream_result, query=""):
+    case = MagicMock(spec=Case)
+    case.id = case_id
+    case_result = MagicMock()
+    case_result.scalar_one_or_none.return_value = case
+
+    db = AsyncMock()
+    db.execute = AsyncMock(side_effect=[case_result])
+    db.stream = AsyncMock(return_value=stream_result)
+
+    async def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as client:
+            return client.get(
+                f"/cases/{case_id}/timeline{query}",
+                headers={"X-Session-Id": str(uuid.uuid4())},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_timeline_array_is_encoded_in_batches():
+    case_id = uuid.uuid4()
+    stream_result = MagicMock()
+    stream_result.scalars.return_value.partitions.return_value = _AsyncRows(
+        [[_make_event(case_id, "Lease signed")], [_make_event(case_id, "Deposit withheld")]]
+    )
+    stream_result.close = AsyncMock()
+
+    response = _get_timeline(case_id, stream_result)
+
+    assert response.status_code == 200
+    assert [e["description"] for e in response.json()] == ["Lease signed", "Deposit withheld"]
+    stream_result.close.assert_awaited_once()
+
+
+def test_timeline_streams_one_event_per_line():
+    case_id = uuid.uuid4()
+    stream_result = MagicMock()
+    stream_result.scalars.return_value = _AsyncRows(
+        [_make_event(case_id, "Lease signed"), _make_event(case_id, "Deposit withheld")]
+    )
+    stream_result.close = AsyncMock()
+
+    response = _get_timeline(case_id, stream_result, "?stream=true")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["description"] for line in lines] == ["Lease signed", "Deposit withheld"]
+    stream_result.close.assert_awaited_once()
@@ -27,6 +27,31 @@ function sortMessages(messages: HearingMessage[]): HearingMessage[] {
   return [...messages].sort((a, b) => a.sequence - b.sequence);
 }
 
+interface WsMessage {
+  role: string;
+  content: string;
+  sequence: number;
+}
+
+const JUDGE_DRAFT_ID = "judge-draft";
+
+function withoutDraft(messages: HearingMessage[]): HearingMessage[] {
+  return messages.some((msg) => msg.id === JUDGE_DRAFT_ID)
+    ? messages.filter((msg) => msg.id !== JUDGE_DRAFT_ID)
+    : messages;
+}
+
+function toHearingMessage(msg: WsMessage): HearingMessage {
+  return {
+    id: `${msg.sequence}`,
+    hearing_id: "live",
+    role: msg.role,
+    content: msg.content,
+    sequence: msg.sequence,
+    created_at: new Date().toISOString(),
+  };
+}
+
 // ── Types ────────────────────────────────────────────────────────────
 
 interface UseHearingOptions {
@@ -148,37 +173,67 @@ export function useHearing({
             try {
               const payload = JSON.parse(event.data) as
                 | { role: string; content: string; sequence: number }
+                | { role: string; delta: string }
+                | { event: "replay"; messages: WsMessage[] }
                 | { event: string }
                 | { error: string };
 
+              if ("event" in payload && payload.event === "replay") {
+                const replayed = (payload as { messages: WsMessage[] }).messages;
+                setMessages((prev) => {
+                  const known = new Set(prev.map((msg) => msg.sequence));
+                  const missing = replayed
+                    .filter((msg) => !known.has(msg.sequence))
+                    .map(toHearingMessage);
+                  return missing.length ? sortMessages([...prev, ...missing]) : prev;
+                });
+                return;
+              }
               if ("event" in payload && payload.event === "hearing_concluded") {
                 setConcluded(true);
                 setStatus("Hearing concluded.");
                 return;
               }
               if ("error" in payload) {
+                setMessages(withoutDraft);
                 setStatus(`WebSocket error: ${payload.error}`);
                 return;
               }
+              if ("delta" in payload) {
+                // Streamed judge text: grow a draft until the final frame lands
+                setMessages((prev) => {
+                  const draft = prev.find((msg) => msg.id === JUDGE_DRAFT_ID);
+                  if (!draft) {
+                    return [
+                      ...prev,
+                      {
+                        ...toHearingMessage({
+                          role: payload.role,
+                          content: payload.delta,
+                          sequence: Number.MAX_SAFE_INTEGER,
+                        }),
+                        id: JUDGE_DRAFT_ID,
+                      },
+                    ];
+                  }
+                  return prev.map((msg) =>
+                    msg === draft
+                      ? { ...msg, content: msg.content + payload.delta }
+                      : msg
+                  );
+                });
+                return;
+              }
               if (
                 "role" in payload &&
                 "content" in payload &&
                 "sequence" in payload
               ) {
                 setMessages((prev) => {
-                  if (prev.some((msg) => msg.sequence === payload.sequence))
-                    return prev;
-                  return sortMessages([
-                    ...prev,
-                    {
-                      id: `${payload.sequence}`,
-                      hearing_id: "live",
-                      role: payload.role,
-                      content: payload.content,
-                      sequence: payload.sequence,
-                      created_at: new Date().toISOString(),
-                    },
-                  ]);
+                  const settled = withoutDraft(prev);
+                  if (settled.some((msg) => msg.sequence === payload.sequence))
+                    return settled;
+                  return sortMessages([...settled, toHearingMessage(payload)]);
                 });
               }
             } catch {
@@ -264,7 +319,7 @@ export function useHearing({
       if (!caseId || !content.trim() || concluded) return;
       setIsSending(true);
 
-      const nextSequence = (messages.at(-1)?.sequence ?? 0) + 1;
+      const nextSequence = (withoutDraft(messages).at(-1)?.sequence ?? 0) + 1;
       const localUserMessage: HearingMessage = {
         id: `local-${nextSequence}`,
         hearing_id: "live",